@@ -0,0 +1,8 @@
+# Copyright (c) 2020-2022, James P. Imes, all rights reserved.
+
+"""
+Benchmarks for pyTRS: a deterministic generator of synthetic PLSS
+descriptions (``benchmarks.corpus``), and a runner that times the main
+operations of the library and compares them against a saved baseline
+(``benchmarks.run``).
+"""
@@ -0,0 +1,242 @@
+# Copyright (c) 2020-2022, James P. Imes, all rights reserved.
+
+"""
+A deterministic generator of synthetic (but realistic) PLSS descriptions
+in each of the layouts in ``pytrs.IMPLEMENTED_LAYOUTS``, for use as a
+benchmark corpus.
+
+The same arguments (including ``seed``) always generate the same
+descriptions::
+
+    corpus = generate_corpus(1000, seed=0)
+    corpus[0]
+    # -> ('T28S-R140E Sec 14: NE/4, Sec 15 - 17: Lots 1(39.14), 2, ...',
+    #     'TRS_desc')
+"""
+
+import random
+
+from pytrs import IMPLEMENTED_LAYOUTS
+from pytrs.parser.config import (
+    TRS_DESC,
+    DESC_STR,
+    S_DESC_TR,
+    TR_DESC_S,
+    COPY_ALL,
+)
+
+# The ways that each aliquot may be written. (Each is a pair of the
+# format for quarters and for halves.)
+_ALIQUOT_STYLES = (
+    ('{}/4', '{}/2'),
+    ('{}¼', '{}½'),
+    ('{}', '{}2'),
+)
+_QUARTERS = ('NE', 'NW', 'SE', 'SW')
+_HALVES = ('N', 'S', 'E', 'W')
+
+_SEC_WORDS = ('Sec', 'Section', 'Sec.')
+
+# Text that contains no Twp/Rge or section, for the 'copy_all' layout.
+_COPY_ALL_TEXTS = (
+    'That part of the {aliquot} lying north of the railroad right of way',
+    'All of the {aliquot}, less and except the east 200 feet thereof',
+    'The {aliquot}, as described in Book 12, Page 345',
+)
+
+
+class CorpusSpec:
+    """
+    The parameters for generating descriptions. Each ``(low, high)``
+    range is inclusive.
+    """
+
+    def __init__(
+            self,
+            twprges=(1, 3),
+            secs_per_twprge=(1, 4),
+            multisec_chance=0.15,
+            lots_chance=0.3,
+            lots_per_sec=(1, 4),
+            lot_acres_chance=0.5,
+            aliquots_per_sec=(1, 3),
+            aliquot_depth=(1, 3),
+    ):
+        """
+        :param twprges: The range of the number of Twp/Rge's in each
+         description.
+        :param secs_per_twprge: The range of the number of sections (or
+         multi-section ranges) in each Twp/Rge.
+        :param multisec_chance: The chance that a section is written as
+         a multi-section range (e.g., ``'Sec 24 - 27'``).
+        :param lots_chance: The chance that a section includes lots.
+        :param lots_per_sec: The range of the number of lots in a
+         section that includes lots.
+        :param lot_acres_chance: The chance that a lot is written with
+         its acreage (e.g., ``'Lot 1(39.14)'``).
+        :param aliquots_per_sec: The range of the number of aliquots in
+         each section.
+        :param aliquot_depth: The range of the number of components of
+         each aliquot (e.g., 3 for ``'N/2SW/4NE/4'``).
+        """
+        self.twprges = twprges
+        self.secs_per_twprge = secs_per_twprge
+        self.multisec_chance = multisec_chance
+        self.lots_chance = lots_chance
+        self.lots_per_sec = lots_per_sec
+        self.lot_acres_chance = lot_acres_chance
+        self.aliquots_per_sec = aliquots_per_sec
+        self.aliquot_depth = aliquot_depth
+
+    def to_dict(self) -> dict:
+        """Get the parameters as a dict."""
+        return dict(vars(self))
+
+
+def gen_aliquot(rng: random.Random, spec: CorpusSpec) -> str:
+    """
+    Generate a single aliquot (e.g., ``'N/2SW/4NE/4'``), whose last
+    component is always a quarter.
+    """
+    quarter_fmt, half_fmt = rng.choice(_ALIQUOT_STYLES)
+    depth = rng.randint(*spec.aliquot_depth)
+    components = [quarter_fmt.format(rng.choice(_QUARTERS))]
+    for _ in range(depth - 1):
+        if rng.random() < 0.4:
+            components.insert(0, half_fmt.format(rng.choice(_HALVES)))
+        else:
+            components.insert(0, quarter_fmt.format(rng.choice(_QUARTERS)))
+    return ''.join(components)
+
+
+def gen_lots(rng: random.Random, spec: CorpusSpec) -> str:
+    """
+    Generate the lots of a section (e.g., ``'Lots 1(39.14), 2 - 4'``).
+    """
+    num_lots = rng.randint(*spec.lots_per_sec)
+    first = rng.randint(1, 6)
+    lot_nums = list(range(first, first + num_lots))
+    if num_lots > 2 and rng.random() < 0.5:
+        # Write them as a range, without acreages.
+        return f"Lots {lot_nums[0]} - {lot_nums[-1]}"
+    lots = []
+    for num in lot_nums:
+        if rng.random() < spec.lot_acres_chance:
+            lots.append(f"{num}({rng.uniform(30, 45):.2f})")
+        else:
+            lots.append(str(num))
+    word = 'Lots' if num_lots > 1 else 'Lot'
+    return f"{word} {', '.join(lots)}"
+
+
+def gen_sec_desc(rng: random.Random, spec: CorpusSpec) -> str:
+    """
+    Generate the description of the land within a section (its lots
+    and aliquots).
+    """
+    parts = []
+    if rng.random() < spec.lots_chance:
+        parts.append(gen_lots(rng, spec))
+    num_aliquots = rng.randint(*spec.aliquots_per_sec)
+    parts.extend(gen_aliquot(rng, spec) for _ in range(num_aliquots))
+    return ', '.join(parts)
+
+
+def gen_secs(rng: random.Random, spec: CorpusSpec) -> list:
+    """
+    Generate the section (or multi-section range) headers for a single
+    Twp/Rge, in ascending order (e.g., ``['Sec 1', 'Sec 24 - 27']``).
+    """
+    num_secs = rng.randint(*spec.secs_per_twprge)
+    sec_word = rng.choice(_SEC_WORDS)
+    secs = []
+    sec = rng.randint(1, 8)
+    for _ in range(num_secs):
+        if sec > 36:
+            break
+        if rng.random() < spec.multisec_chance and sec < 34:
+            last = sec + rng.randint(1, 3)
+            secs.append(f"{sec_word} {sec} - {last}")
+            sec = last
+        else:
+            secs.append(f"{sec_word} {sec}")
+        sec += rng.randint(1, 6)
+    return secs
+
+
+def gen_twprge(rng: random.Random) -> str:
+    """Generate a Twp/Rge (e.g., ``'T154N-R97W'``)."""
+    twp = f"{rng.randint(1, 200)}{rng.choice('NS')}"
+    rge = f"{rng.randint(1, 110)}{rng.choice('EW')}"
+    return f"T{twp}-R{rge}"
+
+
+def generate_description(
+        rng: random.Random, layout: str, spec: CorpusSpec = None) -> str:
+    """
+    Generate a single description in the ``layout``.
+
+    :param rng: The ``random.Random`` to generate from.
+    :param layout: One of the layouts in ``pytrs.IMPLEMENTED_LAYOUTS``.
+    :param spec: (Optional) A ``CorpusSpec``. (Uses the defaults if not
+     specified.)
+    :return: The description text.
+    """
+    if spec is None:
+        spec = CorpusSpec()
+    if layout not in IMPLEMENTED_LAYOUTS:
+        raise ValueError(f"Unknown layout: {layout!r}")
+    if layout == COPY_ALL:
+        template = rng.choice(_COPY_ALL_TEXTS)
+        return template.format(aliquot=gen_aliquot(rng, spec))
+
+    blocks = []
+    for _ in range(rng.randint(*spec.twprges)):
+        twprge = gen_twprge(rng)
+        secs = [(sec, gen_sec_desc(rng, spec)) for sec in gen_secs(rng, spec)]
+        if layout == TRS_DESC:
+            body = ', '.join(f"{sec}: {desc}" for sec, desc in secs)
+            blocks.append(f"{twprge} {body}")
+        elif layout == DESC_STR:
+            body = ', '.join(f"{desc} of {sec}" for sec, desc in secs)
+            blocks.append(f"{body}, {twprge}")
+        elif layout == S_DESC_TR:
+            body = ', '.join(f"{sec}: {desc}" for sec, desc in secs)
+            blocks.append(f"{body} of {twprge}")
+        elif layout == TR_DESC_S:
+            body = ', '.join(f"{desc} of {sec}" for sec, desc in secs)
+            blocks.append(f"{twprge} {body}")
+    return '; '.join(blocks)
+
+
+def generate_corpus(
+        num_descs: int,
+        layouts=IMPLEMENTED_LAYOUTS,
+        seed: int = 0,
+        spec: CorpusSpec = None) -> list:
+    """
+    Generate a corpus of descriptions, cycling through the ``layouts``.
+
+    :param num_descs: The number of descriptions to generate.
+    :param layouts: The layouts to generate (in turn). Defaults to all
+     of ``pytrs.IMPLEMENTED_LAYOUTS``.
+    :param seed: The random seed. The same seed always generates the
+     same corpus.
+    :param spec: (Optional) A ``CorpusSpec``. (Uses the defaults if not
+     specified.)
+    :return: A list of 2-tuples of ``(text, layout)``.
+    """
+    rng = random.Random(seed)
+    layouts = list(layouts)
+    corpus = []
+    for i in range(num_descs):
+        layout = layouts[i % len(layouts)]
+        corpus.append((generate_description(rng, layout, spec), layout))
+    return corpus
+
+
+__all__ = [
+    'CorpusSpec',
+    'generate_description',
+    'generate_corpus',
+]
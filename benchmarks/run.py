@@ -0,0 +1,255 @@
+# Copyright (c) 2020-2022, James P. Imes, all rights reserved.
+
+"""
+Time the main operations of pyTRS on a synthetic corpus (see
+``benchmarks.corpus``), and compare the results against a saved
+baseline.
+
+Run from the root of the repository::
+
+    # Save a baseline (e.g., before making a change)...
+    python -m benchmarks.run --save baseline.json
+
+    # ...and compare against it afterward.
+    python -m benchmarks.run --compare baseline.json
+
+Each benchmark is run ``--repeat`` times, and the fastest time is kept.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+
+import pytrs
+from pytrs import PLSSDesc, TractList
+from pytrs.parser.tract.aliquot_simplify import simplify_aliquots
+from pytrs.tractwriter import TractWriter
+
+from .corpus import CorpusSpec, generate_corpus
+
+# The config for the benchmarks that parse lots and QQs. ('clean_qq'
+# is included because the corpus writes some aliquots without
+# fractions, e.g. 'NENE'.)
+PARSE_QQ_CONFIG = 'parse_qq,clean_qq'
+
+WRITER_ATTRIBUTES = ['trs', 'desc', 'lots', 'qqs', 'w_flags', 'e_flags']
+
+# The ratio (current / baseline) beyond which a result is reported as
+# slower or faster.
+DEFAULT_TOLERANCE = 0.10
+
+
+def _parse_all(texts, config=None):
+    return [PLSSDesc(text, config=config) for text in texts]
+
+
+def _tracts_of(parsed):
+    return TractList.from_multiple(parsed)
+
+
+def bench_parse(texts, tracts):
+    _parse_all(texts)
+
+
+def bench_parse_qq(texts, tracts):
+    _parse_all(texts, PARSE_QQ_CONFIG)
+
+
+def bench_simplify_aliquots(texts, tracts):
+    for tract in tracts:
+        simplify_aliquots(tract.qqs)
+
+
+def bench_sort(texts, tracts):
+    TractList(tracts).custom_sort('t.ns,r.ew,s,i')
+
+
+def bench_group(texts, tracts):
+    tracts.group_by('twprge')
+
+
+def bench_filter(texts, tracts):
+    tracts.filter_errors()
+    tracts.filter_duplicates(method='lots_qqs')
+    tracts.filter(key=lambda t: t.sec_num is not None and t.sec_num <= 18)
+
+
+def bench_tractwriter(texts, tracts):
+    fd, fp = tempfile.mkstemp(suffix='.csv')
+    os.close(fd)
+    try:
+        writer = TractWriter(WRITER_ATTRIBUTES, fp, mode='w')
+        writer.write(tracts)
+        writer.close()
+    finally:
+        os.remove(fp)
+
+
+# Each benchmark is called with the texts of the corpus and a
+# `TractList` of the tracts parsed from them (with `PARSE_QQ_CONFIG`).
+BENCHMARKS = {
+    'parse': bench_parse,
+    'parse_qq': bench_parse_qq,
+    'simplify_aliquots': bench_simplify_aliquots,
+    'sort': bench_sort,
+    'group': bench_group,
+    'filter': bench_filter,
+    'tractwriter': bench_tractwriter,
+}
+
+
+def run_benchmarks(
+        num_descs=2000, seed=0, repeat=3, names=None, spec=None) -> dict:
+    """
+    Run the benchmarks.
+
+    :param num_descs: The number of descriptions in the corpus.
+    :param seed: The random seed for the corpus.
+    :param repeat: The number of times to run each benchmark. (The
+     fastest time is kept.)
+    :param names: (Optional) The names of the benchmarks to run.
+     Defaults to all of ``BENCHMARKS``.
+    :param spec: (Optional) A ``CorpusSpec`` for generating the corpus.
+    :return: A dict of ``'meta'`` (describing the run) and
+     ``'results'`` (the fastest time of each benchmark, in seconds).
+    """
+    if spec is None:
+        spec = CorpusSpec()
+    if names is None:
+        names = list(BENCHMARKS)
+    corpus = generate_corpus(num_descs, seed=seed, spec=spec)
+    texts = [text for text, _ in corpus]
+    tracts = _tracts_of(_parse_all(texts, PARSE_QQ_CONFIG))
+
+    results = {}
+    for name in names:
+        func = BENCHMARKS[name]
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func(texts, tracts)
+            elapsed = time.perf_counter() - start
+            if best is None or elapsed < best:
+                best = elapsed
+        results[name] = best
+
+    meta = {
+        'pytrs_version': pytrs.__version__,
+        'python_version': platform.python_version(),
+        'platform': platform.platform(),
+        'num_descs': num_descs,
+        'num_tracts': len(tracts),
+        'seed': seed,
+        'repeat': repeat,
+        'spec': spec.to_dict(),
+    }
+    return {'meta': meta, 'results': results}
+
+
+def compare(current: dict, baseline: dict, tolerance=DEFAULT_TOLERANCE) -> list:
+    """
+    Compare the results of a run against a baseline.
+
+    :param current: The output of ``run_benchmarks()``.
+    :param baseline: A previous output of ``run_benchmarks()``.
+    :param tolerance: The ratio beyond which a result is reported as
+     ``'slower'`` or ``'faster'``. (Default 0.10, i.e. 10%.)
+    :return: A list of 5-tuples of ``(name, baseline_seconds,
+     current_seconds, ratio, verdict)``, where ``verdict`` is
+     ``'slower'``, ``'faster'``, or ``''``. (Benchmarks missing from
+     either run are skipped.)
+    """
+    rows = []
+    for name, seconds in current['results'].items():
+        base = baseline['results'].get(name)
+        if base is None:
+            continue
+        ratio = seconds / base if base else float('inf')
+        verdict = ''
+        if ratio > 1 + tolerance:
+            verdict = 'slower'
+        elif ratio < 1 - tolerance:
+            verdict = 'faster'
+        rows.append((name, base, seconds, ratio, verdict))
+    return rows
+
+
+def _format_results(results: dict) -> str:
+    lines = [f"{'benchmark':<20}{'seconds':>12}"]
+    for name, seconds in results['results'].items():
+        lines.append(f"{name:<20}{seconds:>12.4f}")
+    return '\n'.join(lines)
+
+
+def _format_comparison(rows: list) -> str:
+    lines = [
+        f"{'benchmark':<20}{'baseline':>12}{'current':>12}{'ratio':>9}"]
+    for name, base, seconds, ratio, verdict in rows:
+        lines.append(
+            f"{name:<20}{base:>12.4f}{seconds:>12.4f}{ratio:>9.2f}  {verdict}")
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Benchmark pyTRS on a synthetic corpus.')
+    parser.add_argument(
+        '-n', '--num-descs', type=int,
+        help='number of descriptions in the corpus (default 2000, or the '
+             'same as the baseline)')
+    parser.add_argument(
+        '--seed', type=int,
+        help='random seed for the corpus (default 0, or the same as the '
+             'baseline)')
+    parser.add_argument(
+        '--repeat', type=int, default=3,
+        help='times to run each benchmark; the fastest is kept (default 3)')
+    parser.add_argument(
+        '--only', nargs='+', choices=list(BENCHMARKS), metavar='NAME',
+        help=f"run only these benchmarks: {', '.join(BENCHMARKS)}")
+    parser.add_argument(
+        '--save', metavar='PATH', help='save the results as a baseline')
+    parser.add_argument(
+        '--compare', metavar='PATH',
+        help='compare the results against a saved baseline')
+    parser.add_argument(
+        '--tolerance', type=float, default=DEFAULT_TOLERANCE,
+        help='ratio beyond which a result is slower/faster (default 0.10)')
+    args = parser.parse_args(argv)
+
+    baseline = None
+    num_descs, seed, spec = 2000, 0, CorpusSpec()
+    if args.compare:
+        with open(args.compare, 'r') as file:
+            baseline = json.load(file)
+        # Use the same corpus as the baseline, unless told otherwise.
+        meta = baseline['meta']
+        num_descs, seed = meta['num_descs'], meta['seed']
+        spec = CorpusSpec(**meta['spec'])
+    if args.num_descs is not None:
+        num_descs = args.num_descs
+    if args.seed is not None:
+        seed = args.seed
+
+    current = run_benchmarks(num_descs, seed, args.repeat, args.only, spec)
+    print(f"{current['meta']['num_descs']} descriptions, "
+          f"{current['meta']['num_tracts']} tracts")
+
+    if args.save:
+        with open(args.save, 'w') as file:
+            json.dump(current, file, indent=2)
+
+    if baseline is None:
+        print(_format_results(current))
+        return 0
+    rows = compare(current, baseline, args.tolerance)
+    print(_format_comparison(rows))
+    return 1 if any(row[-1] == 'slower' for row in rows) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -34,6 +34,7 @@ from pytrs.parser import (
     TRS,        # parser.trs submodule
     TractList,  # parser.container submodule
     TRSList,    # parser.container submodule
+    TRSIndex,   # parser.container submodule
     Config,     # parser.config.config submodule
     MasterConfig,   # parser.config.master_config submodule
 
@@ -42,6 +43,20 @@ from pytrs.parser import (
     find_sec,       # parser.plss_preprocess submodule
     trs_to_dict,    # parser.trs submodule
 
+    # For parsing many descriptions at once
+    parse_many,     # parser.plssdesc.batch submodule
+    iter_parse,     # parser.plssdesc.batch submodule
+
+    # For reusing the results of duplicate descriptions
+    ParseCache,     # parser.plssdesc.parse_cache submodule
+    enable_parse_cache,     # parser.plssdesc.parse_cache submodule
+    disable_parse_cache,    # parser.plssdesc.parse_cache submodule
+    get_parse_cache,    # parser.plssdesc.parse_cache submodule
+
+    # For timing each stage of the parse
+    instrument,     # parser.profiling submodule
+    ParseStats,     # parser.profiling submodule
+
     # For grouping / sorting Tract objects
     group_tracts_by,   # parser.containers submodule
     sort_grouped_tracts,    # parser.containers submodule
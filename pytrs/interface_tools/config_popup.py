@@ -140,6 +140,8 @@ class PromptConfig(tk.Frame):
         'parse_qq',
         'break_halves',
         'no_pm',
+        'symbolic_qq',
+        'lite_tracts',
     ]
 
     # Parameters that are set to a number and control how deeply to
@@ -413,9 +415,26 @@ class PromptConfig(tk.Frame):
 
         'no_pm': (
             "Use this setting if you know the data does not contain "
-            "Principal Meridian following any Twp/Rge. "
-            "(This can greatly improve performance on descriptions "
-            "that contain more than a handful of Twp/Rge's.)"
+            "Principal Meridian following any Twp/Rge."
+        ),
+
+        'symbolic_qq': (
+            "Store the QQ's in each Tract as blocks of subdivided "
+            "aliquots (e.g., 'all of the 10-acre tracts in the NE/4'), "
+            "rather than generating every QQ individually. Useful with "
+            "a large `qq_depth`, which otherwise creates thousands of "
+            "QQ's for a single section.\n\n"
+            "The QQ's are still generated if they are iterated over.\n\n"
+            "Default: off (`False`)"
+        ),
+
+        'lite_tracts': (
+            "Create lightweight tracts that hold only the Twp/Rge/Sec "
+            "and description, and which are fully constructed only when "
+            "something else is needed. Useful if only the Twp/Rge/Sec "
+            "of each tract is needed.\n\n"
+            "Has no effect if parsing lots/QQ's.\n\n"
+            "Default: off (`False`)"
         ),
     }
 
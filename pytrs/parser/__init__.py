@@ -23,11 +23,29 @@ from .plssdesc import PLSSDesc
 from .plssdesc.plss_parse import (
     deduce_layout,
 )
+from .plssdesc.batch import (
+    parse_many,
+    iter_parse,
+)
+from .plssdesc.parse_cache import (
+    ParseCache,
+    enable_parse_cache,
+    disable_parse_cache,
+    get_parse_cache,
+)
 from .plssdesc.plss_preprocess import (
     find_twprge,
     find_sec,
 )
-from .tract import Tract
+from .profiling import (
+    ParseStats,
+    instrument,
+)
+from .tract import (
+    Tract,
+    CompactTract,
+    LiteTract,
+)
 from .trs import (
     TRS,
     trs_to_dict
@@ -35,6 +53,7 @@ from .trs import (
 from .containers import (
     TractList,
     TRSList,
+    TRSIndex,
     group_tracts_by,
     sort_grouped_tracts,
 )
@@ -88,11 +88,9 @@ class Config:
 
     - ``'no_pm'`` -- Tells the preprocessor not to expect "__ Principal
       Meridian" (or an abbreviation) after any Twp/Rge in a PLSS
-      description. This can completely mitigate a known performance
-      issue when encountering a PLSS description that contains more than
-      5 or 6 Twp/Rge's. The risk is that if a principal meridian is
-      actually encountered while using this setting, it will not be
-      handled correctly.
+      description. The risk is that if a principal meridian is actually
+      encountered while using this setting, it will not be handled
+      correctly.
 
     - ``'qq_depth_min.<number>'`` -- Sets the minimum ``qq_depth`` to
       the specified <number>. (◊, †)
@@ -111,6 +109,18 @@ class Config:
       if* we're at divisions smaller than the specified
       ``qq_depth_min``. (†)
 
+    - ``'symbolic_qq'`` - hold deep subdivisions of aliquots
+      symbolically, so that ``.qqs`` only generates each QQ when it is
+      iterated over. (Useful with a large ``qq_depth_min`` or
+      ``qq_depth``.) Counting, membership tests, and simplification
+      into aliquots work without generating the QQs. (†)
+
+    - ``'lite_tracts'`` - have ``PLSSDesc`` create lightweight
+      ``LiteTract`` objects, which hold only the Twp/Rge/Sec and
+      description (etc.) and are constructed into full ``Tract`` objects
+      only when needed. (Useful when only the ``.trs`` of each tract is
+      needed.) Has no effect if the tracts are parsed into lots/QQs.
+
     - ``'TRS_desc'`` -- force ``PLSSDesc`` to be parsed as this
       ``layout``.
 
@@ -211,6 +221,12 @@ class Config:
 
         import pytrs.interface_tools
         pytrs.interface_tools.prompt_config()
+
+    ``Config`` objects are immutable (use ``.replace()`` to get a
+    modified copy), and two ``Config`` objects with the same settings
+    and ``config_name`` are equal and hash the same. Use
+    ``Config.intern()`` to get a single shared ``Config`` for equivalent
+    config text or ``Config`` objects.
     """
 
     # Implemented settings that are settable via Config object:
@@ -230,8 +246,10 @@ class Config:
         'qq_depth_min',
         'qq_depth_max',
         'break_halves',
+        'symbolic_qq',
         'sec_within',
         'no_pm',
+        'lite_tracts',
     )
 
     # A list of attribute names whose values should be a bool:
@@ -245,8 +263,10 @@ class Config:
         'ocr_scrub',
         'segment',
         'break_halves',
+        'symbolic_qq',
         'sec_within',
         'no_pm',
+        'lite_tracts',
     )
 
     _INT_TYPE_ATTRIBUTES = (
@@ -270,8 +290,22 @@ class Config:
         'qq_depth_min',
         'qq_depth_max',
         'break_halves',
+        'symbolic_qq',
     )
 
+    # The results of parsing each config text (as a tuple of
+    # `(attribute, value)` pairs), and the shared `Config` for each
+    # config text and for each distinct `Config` (see `Config.intern()`).
+    # Each stops growing at `_REGISTRY_MAXSIZE` entries.
+    _PARSED_TEXTS = {}
+    _INTERNED_TEXTS = {}
+    _INTERNED = {}
+    _REGISTRY_MAXSIZE = 4096
+
+    # Set once the `Config` has been fully initialized, after which its
+    # attributes may not be changed.
+    _frozen = False
+
     def __init__(self, config_text: str = None, config_name=''):
         """
         Compile a Config object from a string ``config_text=``, with
@@ -314,11 +348,15 @@ class Config:
         self.qq_depth_min = None
         self.qq_depth_max = None
         self.break_halves = None
+        self.symbolic_qq = None
         self.sec_within = None
         self.no_pm = None
+        self.lite_tracts = None
 
         # Break up text.
-        self._text_to_attributes(config_text)
+        for attribute, value in Config._text_to_values(config_text):
+            setattr(self, attribute, value)
+        self._freeze()
 
     def __str__(self):
         return self.decompile_to_text()
@@ -326,41 +364,142 @@ class Config:
     def __repr__(self):
         return f"Config<{self.decompile_to_text()!r}>"
 
-    def _text_to_attributes(self, config_text: str) -> None:
+    def __setattr__(self, name, value):
+        if self._frozen:
+            raise AttributeError(
+                "Config objects are immutable. Use `.replace()` to get a "
+                "modified copy.")
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name):
+        if self._frozen:
+            raise AttributeError("Config objects are immutable.")
+        object.__delattr__(self, name)
+
+    def __eq__(self, other):
+        if not isinstance(other, Config):
+            return NotImplemented
+        return self._key == other._key
+
+    def __hash__(self):
+        return self._hash
+
+    def _freeze(self) -> None:
+        """
+        INTERNAL USE:
+        Compute the values that are derived from the settings, and make
+        this ``Config`` immutable.
+        """
+        values = tuple(getattr(self, att) for att in Config._CONFIG_ATTRIBUTES)
+        self._key = (values, self.config_name)
+        self._hash = hash(self._key)
+        # The settings to apply to a Tract or PLSSDesc (i.e. those that
+        # are specified).
+        self._tract_settings = tuple(
+            (att, getattr(self, att)) for att in Config._TRACT_ATTRIBUTES
+            if getattr(self, att) is not None)
+        self._plssdesc_settings = tuple(
+            (att, val) for att, val in zip(Config._CONFIG_ATTRIBUTES, values)
+            if val is not None)
+        self._frozen = True
+        return None
+
+    @staticmethod
+    def _text_to_values(config_text: str) -> tuple:
         """
         INTERNAL USE:
-        Convert the text into ``Config`` values and store them to the
-        appropriate ``Config`` attributes.
+        Convert the text into ``Config`` values. (The result for each
+        text is cached.)
 
         :param config_text: standard ``Config`` text.
-        :return: None.
+        :return: A tuple of ``(attribute, value)`` pairs, to be set in
+         order.
         """
-        config_text = re.sub(r'\s*', '', config_text)
+        values = Config._PARSED_TEXTS.get(config_text)
+        if values is not None:
+            return values
+        values = []
+        text = re.sub(r'\s*', '', config_text)
         # Separate config parameters with ','  or  ';'
-        for line in re.split(r'[;,]', config_text):
+        for line in re.split(r'[;,]', text):
             if not line:
                 continue
             if re.split(r'[\.=]', line)[0] in Config._BOOL_TYPE_ATTRIBUTES:
                 # If string is the name of an attribute that will be stored
                 # as a bool, default to `True` (but will be overruled in
-                # _set_str_to_values() if specified otherwise):
-                self._set_str_to_values(line, default_bool=True)
+                # _str_to_values() if specified otherwise):
+                pair = Config._str_to_values(line, default_bool=True)
             elif line in MasterConfig._LEGAL_NS:
                 # Specifying N/S can be done with just a string (there's
                 # nothing else it can mean in config context.)
-                self.default_ns = line
+                pair = ('default_ns', line)
             elif line in MasterConfig._LEGAL_EW:
                 # Specifying E/W can be done with just a string (there's
                 # nothing else it can mean in config context.)
-                self.default_ew = line
+                pair = ('default_ew', line)
             elif line in _IMPLEMENTED_LAYOUTS:
                 # Specifying layout can be done with just a string
                 # (there's nothing else it can mean in config context.)
-                self.layout = line
+                pair = ('layout', line)
             else:
                 # This method handles any other parameter.
-                self._set_str_to_values(line)
-        return None
+                pair = Config._str_to_values(line)
+            if pair[1] is not None:
+                values.append(pair)
+        values = tuple(values)
+        if len(Config._PARSED_TEXTS) < Config._REGISTRY_MAXSIZE:
+            Config._PARSED_TEXTS[config_text] = values
+        return values
+
+    @classmethod
+    def intern(cls, config):
+        """
+        Get the single shared ``Config`` for ``config``, which may be
+        config text, ``None``, or a ``Config`` object. Identical config
+        text (or equal ``Config`` objects) always gets the same
+        ``Config``, without being parsed again.
+
+        :param config: Config text, ``None``, or a ``Config`` object.
+        :return: A ``Config`` object.
+        """
+        if isinstance(config, Config):
+            interned = cls._INTERNED.get(config)
+            if interned is None:
+                interned = config
+                if len(cls._INTERNED) < cls._REGISTRY_MAXSIZE:
+                    interned = cls._INTERNED.setdefault(config, config)
+            return interned
+        if config is None:
+            config = ''
+        elif not isinstance(config, str):
+            raise ConfigError(config)
+        interned = cls._INTERNED_TEXTS.get(config)
+        if interned is None:
+            interned = cls.intern(cls(config))
+            if len(cls._INTERNED_TEXTS) < cls._REGISTRY_MAXSIZE:
+                interned = cls._INTERNED_TEXTS.setdefault(config, interned)
+        return interned
+
+    def replace(self, config_name=None, **settings):
+        """
+        Get a new ``Config`` with the same settings as this one, except
+        for those specified.
+
+        :param config_name: (Optional) The name of the new ``Config``.
+         (Defaults to the name of this one.)
+        :param settings: Keyword arguments that line up with ``Config``
+         settings and their new values (e.g., ``parse_qq=True``).
+        :return: A new ``Config``.
+        """
+        for att in settings:
+            if att not in Config._CONFIG_ATTRIBUTES:
+                raise ValueError(f"Illegal config attribute {att!r}")
+        parameters = {
+            att: getattr(self, att) for att in Config._CONFIG_ATTRIBUTES}
+        parameters.update(settings)
+        if config_name is None:
+            config_name = self.config_name
+        return Config.from_dict(parameters, config_name=config_name)
 
     @classmethod
     def from_parent(cls, parent, config_name='', suppress_layout=False):
@@ -374,15 +513,36 @@ class Config:
         :param suppress_layout: Whether to include the ``.layout``
          attribute from the parent (if any). (Defaults to ``False``)
         """
-        config = cls(config_name=config_name)
-        config.layout = getattr(parent, 'layout', None)
+        layout = getattr(parent, 'layout', None)
         if suppress_layout:
-            config.layout = None
-        config.parse_qq = parent.parse_qq
-        config.clean_qq = parent.clean_qq
-        config.default_ns = parent.default_ns
-        config.default_ew = parent.default_ew
-        config.suppress_lot_divs = parent.suppress_lot_divs
+            layout = None
+        values = (
+            ('layout', layout),
+            ('parse_qq', parent.parse_qq),
+            ('clean_qq', parent.clean_qq),
+            ('default_ns', parent.default_ns),
+            ('default_ew', parent.default_ew),
+            ('suppress_lot_divs', parent.suppress_lot_divs),
+        )
+        return cls._from_values(values, config_name)
+
+    @classmethod
+    def _from_values(cls, values, config_name=''):
+        """
+        INTERNAL USE:
+        Get a new ``Config`` with the (already-validated) values set.
+
+        :param values: An iterable of ``(attribute, value)`` pairs.
+        :param config_name: The name of the new ``Config``.
+        """
+        config = cls.__new__(cls)
+        config.config_text = ''
+        config.config_name = config_name
+        for att in cls._CONFIG_ATTRIBUTES:
+            setattr(config, att, None)
+        for att, val in values:
+            setattr(config, att, val)
+        config._freeze()
         return config
 
     @classmethod
@@ -405,7 +565,7 @@ class Config:
             name = config_name
         else:
             name = parameters.get('config_name', '')
-        cf = Config(config_name=name)
+        values = []
         for att in cls._CONFIG_ATTRIBUTES:
             val = parameters.get(att, None)
             if val is None:
@@ -424,8 +584,8 @@ class Config:
                 val = verify_default_ns(val)
             elif att == 'default_ew':
                 val = verify_default_ew(val)
-            setattr(cf, att, val)
-        return cf
+            values.append((att, val))
+        return cls._from_values(values, name)
 
     @classmethod
     def from_kwargs(cls, config_name='', **kwargs):
@@ -455,13 +615,15 @@ class Config:
                 write_vals.append(w)
         return ','.join(write_vals)
 
-    def _set_str_to_values(self, attrib_val, default_bool=None):
+    @staticmethod
+    def _str_to_values(attrib_val, default_bool=None) -> tuple:
         """
         INTERNAL USE:
 
         Take in a string of an attribute/value pair (in the format
-        ``'attribute.value'`` or ``'attribute=value'``) and set the
-        appropriate value of the attribute to this ``Config`` object.
+        ``'attribute.value'`` or ``'attribute=value'``) and convert it
+        to the appropriate ``(attribute, value)`` for a ``Config``
+        object. (The value is ``None`` if it should not be set.)
         """
         try:
             # split attribute/value pair by : or . or =
@@ -469,7 +631,7 @@ class Config:
         except ValueError:
             attribute = attrib_val
             value = None
-        if attribute not in self._CONFIG_ATTRIBUTES:
+        if attribute not in Config._CONFIG_ATTRIBUTES:
             raise ValueError(f"Illegal config attribute {attribute!r}")
         # Convert the value based on the category of the attribute.
         if attribute in Config._BOOL_TYPE_ATTRIBUTES:
@@ -485,9 +647,7 @@ class Config:
                 value = verify_default_ew(value)
         else:
             value = str_to_value(value)
-        if value is not None:
-            setattr(self, attribute, value)
-        return None
+        return attribute, value
 
 
 def attrib_and_val_to_str(attribute, value):
@@ -43,6 +43,19 @@ class MasterConfig:
     default_ns = NORTH
     default_ew = WEST
 
+    # The maximum number of Twp/Rge/Sec breakdowns to hold in the cache
+    # that is shared by all ``TRS`` and ``Tract`` objects. When full, the
+    # least-recently-used entries are discarded. (Set to ``None`` for no
+    # limit.)
+    trs_cache_maxsize = 65536
+
+    # A function to be called with ``(stage, seconds)`` every time a
+    # stage of the parse pipeline finishes in this process (see
+    # ``pytrs.instrument()`` for the stages). Not called for the work
+    # done in the worker processes of ``pytrs.parse_many()``. ``None``
+    # to turn it off.
+    profile_hook = None
+
     # Legal settings for N/S/E/W
     _LEGAL_NS = ('n', 's', 'N', 'S')
     _LEGAL_EW = ('e', 'w', 'E', 'W')
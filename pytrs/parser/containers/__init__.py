@@ -5,3 +5,4 @@ functions for grouping (or ungrouping) and sorting.
 """
 
 from .containers import *
+from .trs_index import *
@@ -0,0 +1,212 @@
+
+"""
+Functions to compile the data of many tracts into typed columns (one
+array per attribute), and from there into a ``pandas.DataFrame`` or a
+``pyarrow.Table``.
+
+Columns are NumPy arrays if NumPy is installed (otherwise, lists of the
+same values). The Twp/Rge/Sec fields are stored compactly:
+
+- ``twp_num`` and ``rge_num`` are ``int16``, and ``sec_num`` is
+  ``int8``. An undefined or error value is stored as ``0``.
+
+- ``twp_ns`` (or ``ns``) and ``rge_ew`` (or ``ew``) are ``int8``
+  category codes (see ``COLUMN_CATEGORIES``), with ``-1`` for an
+  undefined or error value.
+
+- ``twp_undef``, ``rge_undef``, ``sec_undef``, ``parse_complete``, and
+  ``desc_is_flawed`` are ``bool``; ``acres`` is ``float64``; and
+  ``orig_index`` is ``int64``.
+
+Any other attribute is stored as an ``object`` column holding the same
+values that ``Tract.to_dict()`` would.
+"""
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from ..trs import TRS
+from ..tract.tract import _export_value
+from ..tract.acreage import tracts_acreage
+
+# The categories for each category-coded column. A value's code is its
+# index in the tuple.
+COLUMN_CATEGORIES = {
+    'twp_ns': ('n', 's'),
+    'ns': ('n', 's'),
+    'rge_ew': ('e', 'w'),
+    'ew': ('e', 'w'),
+}
+
+# Columns of numbers, for which 0 means undefined or error.
+_NUM_DTYPES = {
+    'twp_num': 'int16',
+    'rge_num': 'int16',
+    'sec_num': 'int8',
+}
+
+_BOOL_COLUMNS = (
+    'twp_undef',
+    'rge_undef',
+    'sec_undef',
+    'parse_complete',
+    'desc_is_flawed',
+)
+
+# Attributes that are derived from the Twp/Rge/Sec alone, and so can be
+# computed once per unique Twp/Rge/Sec.
+_TRS_FIELDS = {
+    'trs', 'twp', 'twp_num', 'twp_ns', 'ns', 'twp_undef',
+    'rge', 'rge_num', 'rge_ew', 'ew', 'rge_undef',
+    'sec', 'sec_num', 'sec_undef', 'twprge',
+}
+# Attributes whose names differ from their key in `trs_to_dict()`.
+_TRS_FIELD_KEYS = {
+    'ns': 'twp_ns',
+    'ew': 'rge_ew',
+}
+
+
+def _trs_field_value(trs_dict, attribute):
+    """
+    INTERNAL USE:
+    Get the (encoded) column value of a Twp/Rge/Sec-derived attribute
+    from the dict returned by ``trs_to_dict()``.
+    """
+    if attribute == 'twprge':
+        return f"{trs_dict['twp']}{trs_dict['rge']}"
+    val = trs_dict[_TRS_FIELD_KEYS.get(attribute, attribute)]
+    if attribute in COLUMN_CATEGORIES:
+        categories = COLUMN_CATEGORIES[attribute]
+        return categories.index(val) if val in categories else -1
+    if attribute in _NUM_DTYPES and val is None:
+        return 0
+    return val
+
+
+def _column_dtype(attribute):
+    """INTERNAL USE: Get the NumPy dtype for the attribute's column."""
+    if attribute in _NUM_DTYPES:
+        return _NUM_DTYPES[attribute]
+    if attribute in COLUMN_CATEGORIES:
+        return 'int8'
+    if attribute in _BOOL_COLUMNS:
+        return 'bool'
+    if attribute == 'acres':
+        return 'float64'
+    if attribute == 'orig_index':
+        return 'int64'
+    return 'object'
+
+
+def tracts_to_columns(tracts, attributes) -> dict:
+    """
+    Compile the requested attributes of the tracts into columns.
+
+    :param tracts: A list of ``Tract`` (or ``CompactTract``) objects.
+    :param attributes: A list of the names of the attributes to include.
+    :return: A dict, keyed by attribute, of NumPy arrays (or of lists, if
+     NumPy is not installed), each in the same order as the tracts.
+    """
+    tracts = list(tracts)
+    columns = {}
+    trs_atts = [att for att in attributes if att in _TRS_FIELDS]
+    trs_cols = {}
+    if trs_atts and tracts:
+        # Break apart each unique Twp/Rge/Sec only once, encoding all of
+        # the requested fields at the same time, and then spread them out
+        # to the tracts.
+        trs_strs = [t.trs for t in tracts]
+        rows = {}
+        for trs in set(trs_strs):
+            dct = TRS.trs_to_dict(trs)
+            rows[trs] = tuple(_trs_field_value(dct, att) for att in trs_atts)
+        transposed = zip(*map(rows.__getitem__, trs_strs))
+        trs_cols = dict(zip(trs_atts, transposed))
+    for att in attributes:
+        if att in _TRS_FIELDS:
+            col = trs_cols.get(att, [])
+        elif att == 'acres':
+            col = tracts_acreage(tracts)
+        else:
+            default = f"{att}: n/a"
+            col = [_export_value(getattr(t, att, default)) for t in tracts]
+
+        if np is not None:
+            dtype = _column_dtype(att)
+            if dtype == 'object':
+                # (Filled in afterward, so that NumPy does not try to
+                # turn lists into additional dimensions.)
+                arr = np.empty(len(col), dtype=object)
+                arr[:] = col
+                col = arr
+            else:
+                col = np.asarray(col, dtype=dtype)
+        elif not isinstance(col, list):
+            col = list(col)
+        columns[att] = col
+    return columns
+
+
+def columns_to_pandas(columns: dict):
+    """
+    Convert columns (from ``tracts_to_columns()``) into a
+    ``pandas.DataFrame``. Category-coded columns become ``Categorical``,
+    and Twp/Rge/Sec numbers become nullable integers (with undefined or
+    error values as ``<NA>``).
+
+    Requires that pandas be installed.
+    """
+    try:
+        import pandas as pd
+    except ImportError:
+        raise ImportError("Exporting to a DataFrame requires pandas.")
+    data = {}
+    for att, col in columns.items():
+        if att in COLUMN_CATEGORIES:
+            col = pd.Categorical.from_codes(
+                col, categories=list(COLUMN_CATEGORIES[att]))
+        elif att in _NUM_DTYPES:
+            col = pd.array(col, dtype=_NUM_DTYPES[att].capitalize())
+            col[col == 0] = pd.NA
+        data[att] = col
+    return pd.DataFrame(data)
+
+
+def columns_to_arrow(columns: dict):
+    """
+    Convert columns (from ``tracts_to_columns()``) into a
+    ``pyarrow.Table``. Category-coded columns become dictionary-encoded,
+    and undefined or error Twp/Rge/Sec numbers become nulls.
+
+    Requires that pyarrow and NumPy be installed.
+    """
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise ImportError("Exporting to an Arrow table requires pyarrow.")
+    if np is None:
+        raise ImportError("Exporting to an Arrow table requires numpy.")
+    arrays = []
+    for att, col in columns.items():
+        col = np.asarray(col)
+        if att in COLUMN_CATEGORIES:
+            arr = pa.DictionaryArray.from_arrays(
+                pa.array(col, mask=col == -1),
+                pa.array(COLUMN_CATEGORIES[att]))
+        elif att in _NUM_DTYPES:
+            arr = pa.array(col, mask=col == 0)
+        else:
+            arr = pa.array(list(col) if col.dtype == object else col)
+        arrays.append(arr)
+    return pa.Table.from_arrays(arrays, names=list(columns))
+
+
+__all__ = [
+    'COLUMN_CATEGORIES',
+    'tracts_to_columns',
+    'columns_to_pandas',
+    'columns_to_arrow',
+]
@@ -4,15 +4,118 @@ Customized containers for ``Tract`` and ``TRS`` objects, along with
 helper functions for grouping (or ungrouping) and sorting.
 """
 
+import functools
 import re
+import warnings
+from bisect import insort
 from typing import Union
 
 from ...utils import flatten
 from ...utils import _confirm_list_of_strings as clean_attributes
 from ..tract import Tract
+from ..tract.compact_tract import CompactTract
+from ..tract.acreage import tracts_acreage
+from ..tract.fingerprint import (
+    trs_fingerprint,
+    lots_qqs_key,
+    desc_key,
+)
+from .columns import (
+    tracts_to_columns,
+    columns_to_pandas,
+    columns_to_arrow,
+)
 from ..trs import TRS
 
 
+# Sort key components (other than 'i') and the fields they use (from
+# ``trs_to_dict()``): {var: (number field, direction field)}
+_SORT_FIELDS = {
+    't': ('twp_num', 'twp_ns'),
+    'r': ('rge_num', 'rge_ew'),
+    's': ('sec_num', None),
+}
+
+# For directional sort methods, the direction that sorts first.
+_NEGATIVE_DIRECTION = {
+    'ns': 'n',
+    'sn': 's',
+    'we': 'w',
+    'ew': 'e',
+}
+
+# The regex pattern for a valid sort key component.
+_SORT_KEY_PATTERN = re.compile(
+    r"(?P<var>[itrs])(\.(?P<method>ns|sn|ew|we|num))?(\.(?P<rev>rev(erse)?))?")
+
+_LEGAL_SORT_METHODS = {
+    "i": ("num", None),
+    "t": ("ns", "sn", "num", None),
+    "r": ("ew", "we", "num", None),
+    "s": ("num", None)
+}
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_sort_key(key: str) -> tuple:
+    """
+    INTERNAL USE:
+    Compile a str-type sort key (see ``TractList.custom_sort()``) into a
+    tuple of ``(var, method, reverse)`` 3-tuples, in order of priority
+    (i.e., the rightmost key component first).
+    """
+    illegal_key_error = ValueError(f"Could not interpret sort key {key!r}.")
+    key = key.lower()
+    key = re.sub(r"\s", "", key)
+    key = re.sub(r"reverse", "rev", key)
+    spec = []
+    for k in key.split(','):
+        mo = _SORT_KEY_PATTERN.search(k)
+        if not mo:
+            raise illegal_key_error
+        if len(mo.group(0)) != len(k):
+            warnings.warn(SyntaxWarning(
+                f"Sort key {k!r} may not have been fully interpreted. "
+                f"Check to make sure you are using the correct syntax."
+            ))
+        var = mo.group("var")
+        # Default to "num" for all vars.
+        method = mo.group("method") or "num"
+        # Confirm legal method for this var
+        if method not in _LEGAL_SORT_METHODS[var]:
+            raise ValueError(f"invalid sort method: {k!r}")
+        spec.append((var, method, mo.group("rev") is not None))
+    spec.reverse()
+    return tuple(spec)
+
+
+def _i_sort_value(list_element):
+    """
+    INTERNAL USE:
+    If the element is a ``Tract`` object, extract and return its
+    internal UID. Otherwise, return 0.
+
+    (This function exists so that the sort method works on a list of
+    ``Tract`` objects as well as a list of ``TRS`` objects, the latter of
+    which do not have a ``._Tract__uid`` attribute.)
+    """
+    if isinstance(list_element, Tract):
+        return list_element._Tract__uid
+    elif isinstance(list_element, CompactTract):
+        return list_element._uid
+    return 0
+
+
+def _has_exact_match(element, others: list, exact_key) -> bool:
+    """
+    INTERNAL USE:
+    Check whether any of the ``others`` (which share a fingerprint with
+    the ``element``) has the same exact key as the ``element``.
+    """
+    key = exact_key(element)
+    return any(exact_key(other) == key for other in others)
+
+
 class _TRSTractList:
     """
     INTERNAL USE:
@@ -42,6 +145,11 @@ class _TRSTractList:
         :param iterable: Same as in ``list()``
         """
         self._elements = self._verify_iterable(iterable)
+        # Opt-in secondary indexes (see ``.create_index()``), keyed by
+        # attribute name, each mapping the values of that attribute to
+        # the (ascending) positions of the elements that have them.
+        self._indexes = {}
+        self._indexes_stale = False
 
     @classmethod
     def _verify_iterable(cls, iterable, into=None):
@@ -81,7 +189,14 @@ class _TRSTractList:
 
     def __setitem__(self, index, value):
         self._verify_individual(value)
+        if self._indexes and isinstance(index, int):
+            index = range(len(self))[index]
+            self._unindex_position(index)
+            self._elements[index] = value
+            self._index_position(index)
+            return
         self._elements[index] = value
+        self._invalidate_indexes()
 
     def __getitem__(self, item):
         return self._elements[item]
@@ -102,13 +217,17 @@ class _TRSTractList:
         return str(self)
 
     def extend(self, iterable):
+        start = len(self._elements)
         self._elements.extend(self._verify_iterable(iterable))
+        for i in range(start, len(self._elements)):
+            self._index_position(i)
 
     def append(self, obj):
         self._elements.append(self._verify_individual(obj))
+        self._index_position(len(self._elements) - 1)
 
     def __iadd__(self, other):
-        self._elements = self._elements + self._verify_iterable(other)
+        self.extend(other)
         return self
 
     def __add__(self, value):
@@ -116,6 +235,7 @@ class _TRSTractList:
 
     def __imul__(self, n):
         self._elements = self._elements * n
+        self._invalidate_indexes()
         return self
 
     def __mul__(self, n):
@@ -132,9 +252,20 @@ class _TRSTractList:
         return self._elements == other._elements
 
     def insert(self, i, obj):
-        return self._elements.insert(i, self._verify_individual(obj))
+        at_end = i >= len(self._elements)
+        self._elements.insert(i, self._verify_individual(obj))
+        if at_end:
+            self._index_position(len(self._elements) - 1)
+        else:
+            self._invalidate_indexes()
 
     def pop(self, n=-1):
+        if self._indexes and self._elements:
+            n = range(len(self))[n]
+            if n == len(self) - 1:
+                self._unindex_position(n)
+            else:
+                self._invalidate_indexes()
         return self._elements.pop(n)
 
     def copy(self):
@@ -143,6 +274,7 @@ class _TRSTractList:
     def sort(self, key=None, reverse=False):
         if key is None:
             return self.custom_sort(reverse=reverse)
+        self._invalidate_indexes()
         return self._elements.sort(key=key, reverse=reverse)
 
     def to_standard_list(self):
@@ -153,6 +285,155 @@ class _TRSTractList:
         """
         return self._elements.copy()
 
+    @staticmethod
+    def _index_value(element, attribute):
+        """INTERNAL USE: Get the value of an attribute to be indexed."""
+        return getattr(element, attribute, f"{attribute}: n/a")
+
+    def create_index(self, *attributes):
+        """
+        Maintain a hash index on each of the ``attributes`` (e.g.,
+        ``'trs'``, ``'twprge'``, ``'sec'``, or ``'source'``), so that
+        looking up elements by those attributes does not require
+        scanning the entire list. Indexed attributes are used by
+        ``.lookup()``, by ``.filter()`` (when ``key`` is passed as a
+        dict), by ``.group_by()``, and by ``TRSList.contains()``.
+
+        The indexes are kept up to date as elements are added to the
+        end of the list (or removed from the end) or replaced. Other
+        changes to the list (sorting, inserting into or popping from the
+        middle, etc.) cause the indexes to be rebuilt the next time they
+        are used.
+
+        .. note::
+            The indexes cannot detect changes to the elements
+            themselves. If the indexed attribute of any element is
+            changed (e.g., by setting a new ``.trs`` for a ``Tract``),
+            call ``.reindex()``.
+
+        :param attributes: The names of the attributes to index. Their
+         values must be hashable.
+        """
+        for attribute in attributes:
+            self._indexes[attribute] = self._build_index(attribute)
+
+    def drop_index(self, *attributes):
+        """
+        Stop maintaining the index on each of the ``attributes`` (or on
+        all attributes, if none are specified).
+        """
+        if not attributes:
+            attributes = list(self._indexes)
+        for attribute in attributes:
+            self._indexes.pop(attribute, None)
+
+    @property
+    def indexed_attributes(self) -> list:
+        """The names of the attributes that are currently indexed."""
+        return list(self._indexes)
+
+    def reindex(self):
+        """Rebuild all of the indexes (see ``.create_index()``)."""
+        for attribute in self._indexes:
+            self._indexes[attribute] = self._build_index(attribute)
+        self._indexes_stale = False
+
+    def _build_index(self, attribute) -> dict:
+        """INTERNAL USE: Build the index for a single attribute."""
+        index = {}
+        for i, element in enumerate(self._elements):
+            val = self._index_value(element, attribute)
+            index.setdefault(val, []).append(i)
+        return index
+
+    def _get_index(self, attribute):
+        """
+        INTERNAL USE:
+        Get the up-to-date index for the ``attribute``, or ``None`` if
+        that attribute is not indexed.
+        """
+        if attribute not in self._indexes:
+            return None
+        if self._indexes_stale:
+            self.reindex()
+        return self._indexes[attribute]
+
+    def _invalidate_indexes(self):
+        """INTERNAL USE: Flag the indexes to be rebuilt before next use."""
+        if self._indexes:
+            self._indexes_stale = True
+
+    def _index_position(self, i):
+        """INTERNAL USE: Add the element at position ``i`` to the indexes."""
+        if not self._indexes or self._indexes_stale:
+            return
+        element = self._elements[i]
+        for attribute, index in self._indexes.items():
+            val = self._index_value(element, attribute)
+            insort(index.setdefault(val, []), i)
+
+    def _unindex_position(self, i):
+        """
+        INTERNAL USE: Remove the element at position ``i`` from the
+        indexes.
+        """
+        if not self._indexes or self._indexes_stale:
+            return
+        element = self._elements[i]
+        for attribute, index in self._indexes.items():
+            val = self._index_value(element, attribute)
+            positions = index[val]
+            positions.remove(i)
+            if not positions:
+                del index[val]
+
+    def lookup(self, attribute, value):
+        """
+        Get a new ``TractList`` (or ``TRSList``, as applicable) of the
+        elements whose ``attribute`` equals ``value`` (in the order in
+        which they appear in this list). If the attribute is indexed
+        (see ``.create_index()``), this does not scan the list.
+
+        ``tractlist.lookup('trs', '154n97w14')`` is equivalent to
+        ``tractlist.filter(lambda t: t.trs == '154n97w14')``.
+
+        :param attribute: The name of the attribute to match.
+        :param value: The value to match.
+        """
+        index = self._get_index(attribute)
+        if index is None:
+            return self.__class__(
+                e for e in self._elements
+                if self._index_value(e, attribute) == value)
+        return self.__class__(self._elements[i] for i in index.get(value, ()))
+
+    def _match_indexes(self, criteria: dict) -> list:
+        """
+        INTERNAL USE:
+        Get the (ascending) positions of the elements whose attributes
+        match all of the ``criteria`` (a dict of attribute names and the
+        values to match), using indexes where available.
+        """
+        positions = None
+        unindexed = {}
+        for attribute, value in criteria.items():
+            index = self._get_index(attribute)
+            if index is None:
+                unindexed[attribute] = value
+                continue
+            found = set(index.get(value, ()))
+            positions = found if positions is None else positions & found
+        if positions is None:
+            positions = range(len(self._elements))
+        else:
+            positions = sorted(positions)
+        return [
+            i for i in positions
+            if all(
+                self._index_value(self._elements[i], att) == val
+                for att, val in unindexed.items())
+        ]
+
     def filter(self, key, drop=False):
         """
         Extract from this custom list all elements that match the
@@ -168,6 +449,12 @@ class _TRSTractList:
          ``True`` or ``True``-like returned values will result in the
          inclusion of that element).
 
+         May also be a dict of attribute names and values (e.g.,
+         ``{'trs': '154n97w14'}``), to select the elements whose
+         attributes match all of those values. Any of those attributes
+         that are indexed (see ``.create_index()``) will be matched
+         without scanning the list.
+
         :param drop: Whether to drop the matching elements from the
          original list. (Defaults to ``False``)
 
@@ -175,6 +462,8 @@ class _TRSTractList:
          the selected elements. (The original list will still hold all
          other elements, unless ``drop=True`` was passed.)
         """
+        if isinstance(key, dict):
+            return self._new_list_from_self(self._match_indexes(key), drop)
         indexes_to_include = []
         for i, element in enumerate(self):
             if key(element):
@@ -218,7 +507,7 @@ class _TRSTractList:
                 indexes_to_include.append(i)
         return self._new_list_from_self(indexes_to_include, drop)
 
-    def filter_duplicates(self, method='default', drop=False):
+    def filter_duplicates(self, method='default', drop=False, seen=None):
         """
         Find the duplicate ``Tract`` (or ``TRS`` objects) in this custom
         list, get a new custom list of the elements that were
@@ -279,9 +568,26 @@ class _TRSTractList:
          ``'instance'``, ``'lots_qqs'``, ``'desc'``, ``'trs'``, or
          ``'default'``).  See above for example behavior of each.
 
+        Tracts are first compared by stable 64-bit fingerprints of their
+        Twp/Rge/Sec plus their lots/QQs or description (see
+        ``Tract.lots_qqs_fingerprint`` and ``Tract.desc_fingerprint``),
+        and only those with matching fingerprints are compared by the
+        full data.
+
         :param drop: Whether to remove the identified duplicates from
          the original list.
 
+        :param seen: (Optional) A set of fingerprints from previous
+         batches of tracts, for finding duplicates across batches. Any
+         element whose fingerprint is already in ``seen`` is treated as
+         a duplicate, and the fingerprints of the new elements are added
+         to it. Pass the same set (starting with an empty ``set()``)
+         with the same ``method`` for each batch. (Has no effect with
+         ``method='instance'``.) *Note:* Because only the fingerprints
+         of previous batches are kept, elements are matched against
+         previous batches by fingerprint alone (see the note in
+         ``pytrs.parser.tract.fingerprint`` on collisions).
+
         :return: A new ``TractList`` (or ``TRSList``, as applicable).
         """
         unique = set()
@@ -294,44 +600,61 @@ class _TRSTractList:
         options = ('instance', 'lots_qqs', 'desc', 'trs')
         if method not in options:
             raise ValueError(f"`method` must be one of {options}")
-        lots_qqs = method == 'lots_qqs'
-        desc = method == 'desc'
-        trs = method == 'trs'
-        only_by_instance = not (lots_qqs or desc or trs)
+        if seen is None:
+            seen = set()
+        # The exact data to compare, where fingerprints match.
+        exact_key = None
+        if method == 'lots_qqs':
+            def fingerprint(elem):
+                if not isinstance(elem, (Tract, CompactTract)):
+                    return None
+                if not elem.parse_complete:
+                    return None
+                return elem.lots_qqs_fingerprint
+            exact_key = lots_qqs_key
+        elif method == 'desc':
+            def fingerprint(elem):
+                if isinstance(elem, TRS):
+                    # TRS (uses only .trs attribute)
+                    return trs_fingerprint(elem)
+                return elem.desc_fingerprint
+            exact_key = desc_key
+        elif method == 'trs':
+            fingerprint = trs_fingerprint
+
+            def exact_key(elem):
+                return elem.trs
+        else:
+            fingerprint = None
+
+        # The elements kept from this list, keyed by fingerprint.
+        kept = {}
 
         for i, element in enumerate(self):
             # Always find duplicate instances (because not all Tract
             # objects are parsed into lots/qqs).
             if element in unique:
                 indexes_to_include.append(i)
+                continue
             unique.add(element)
-            if only_by_instance:
+            if fingerprint is None:
                 continue
-
-            to_check = element
-            if lots_qqs:
-                if not isinstance(element, Tract):
-                    continue
-                if not element.parse_complete:
-                    continue
-                lq = sorted(set(element.lots_qqs))
-                to_check = f"{element.trs}_{lq}"
-            if desc:
-                if isinstance(element, Tract):
-                    # TractList
-                    to_check = f"{element.trs}_{element.pp_desc.strip()}"
-                elif isinstance(element, TRS):
-                    # TRS (uses only .trs attribute)
-                    to_check = element.trs
-            if trs:
-                to_check = element.trs
-
-            if to_check not in unique:
-                unique.add(to_check)
-            elif i not in indexes_to_include:
-                # Use elif to avoid double-appending i (may have already
-                # been added from the `instance` check).
+            fp = fingerprint(element)
+            if fp is None:
+                continue
+            kept_elements = kept.get(fp)
+            if kept_elements is None:
+                if fp in seen:
+                    # Matches a previous batch.
+                    indexes_to_include.append(i)
+                else:
+                    seen.add(fp)
+                    kept[fp] = [element]
+            elif _has_exact_match(element, kept_elements, exact_key):
                 indexes_to_include.append(i)
+            else:
+                # Same fingerprint, but different data.
+                kept_elements.append(element)
 
         return self._new_list_from_self(indexes_to_include, drop)
 
@@ -349,19 +672,19 @@ class _TRSTractList:
          original list.
         :return: The new ``TractList`` (or ``TRSList``).
         """
-        new_list = self.__class__()
-        # Populate the new list in reverse order, in order to remove the
-        # intended elements from the original list if requested.
-        for i in range(len(indexes) - 1, -1, -1):
-            ind = indexes[i]
-            new_list.append(self[ind])
-            if drop:
-                self.pop(ind)
-        new_list.reverse()
+        new_list = self.__class__(self._elements[i] for i in indexes)
+        if drop and indexes:
+            # Remove them all in a single pass (rather than popping each
+            # from the middle of the list).
+            to_drop = set(indexes)
+            self._elements = [
+                e for i, e in enumerate(self._elements) if i not in to_drop]
+            self._invalidate_indexes()
         return new_list
 
     def reverse(self):
         self._elements.reverse()
+        self._invalidate_indexes()
 
     def custom_sort(self, key='i,s,r,t', reverse=False):
         """
@@ -515,159 +838,45 @@ class _TRSTractList:
         :return: None
         """
 
-        def get_max(var):
-            """
-            Get the largest value of the matching var in the of any
-            element in this list. If there are no valid ints, return 0.
-            """
-            nums = [getattr(t, var) for t in self if getattr(t, var) is not None]
-            if nums:
-                return max(nums)
-            return 0
-
-        # TODO: Sort undefined Twp/Rge/Sec before error Twp/Rge/Sec.
-
-        default_twp = get_max("twp_num") + 1
-        default_rge = get_max("rge_num") + 1
-        default_sec = get_max("sec_num") + 1
-
-        assume = {
-            "twp_num": default_twp,
-            "rge_num": default_rge,
-            "sec_num": default_sec
-        }
-
-        illegal_key_error = ValueError(f"Could not interpret sort key {key!r}.")
-
-        # The regex pattern for a valid key component.
-        pat = r"(?P<var>[itrs])(\.(?P<method>ns|sn|ew|we|num))?(\.(?P<rev>rev(erse)?))?"
-
-        legal_methods = {
-            "i": ("num", None),
-            "t": ("ns", "sn", "num", None),
-            "r": ("ew", "we", "num", None),
-            "s": ("num", None)
-        }
-
-        def extract_safe_num(tract, var):
-            val = getattr(tract, var)
-            if val is None:
-                val = assume[var]
-            return val
-
-        def i_sort_evaluate(list_element):
-            """
-            If the element is a ``Tract`` object, extract and return its
-            internal UID. Otherwise, return 0.
-
-            (This function exists so that the sort method works on a
-            list of ``Tract`` objects as well as a list of ``TRS``
-            objects, the latter of which do not have a ``._Tract__uid``
-            attribute.)
-            """
-            if isinstance(list_element, Tract):
-                return list_element._Tract__uid
+        spec = _compile_sort_key(key)
+        elements = self._elements
+        # Extract the Twp/Rge/Sec fields once per unique Twp/Rge/Sec
+        # (rather than once per element for each sort key), then sort
+        # once on a tuple of all the keys.
+        trs_strs = [e.trs for e in elements]
+        fields = {t: TRS.trs_to_dict(t) for t in set(trs_strs)}
+        key_columns = []
+        for var, method, rev in spec:
+            if var == 'i':
+                col = [_i_sort_value(e) for e in elements]
             else:
-                return 0
-
-        sort_defs = {
-            'i.num': i_sort_evaluate,
-            't.num': lambda x: extract_safe_num(x, "twp_num"),
-            't.ns': lambda x: n_to_s(x),
-            't.sn': lambda x: n_to_s(x, reverse=True),
-            'r.num': lambda x: extract_safe_num(x, "rge_num"),
-            'r.we': lambda x: w_to_e(x),
-            'r.ew': lambda x: w_to_e(x, reverse=True),
-            's.num': lambda x: extract_safe_num(x, "sec_num")
-        }
-
-        def n_to_s(element, reverse=False):
-            """
-            Convert Twp number and direction to a positive or negative
-            int, depending on direction. North townships are negative;
-            South are positive (in order to leverage the default
-            behavior of ``list.sort()`` -- i.e. smallest to largest).
-            ``reverse=True`` to inverse the positive and negative.
-            """
-            num = element.twp_num
-            ns = element.twp_ns
-
-            multiplier = 1
-            if num is None:
-                num = default_twp
-            if ns is None:
-                multiplier = 1
-            if ns == 's':
-                multiplier = 1
-            elif ns == 'n':
-                multiplier = -1
-            if reverse:
-                multiplier *= -1
-            if ns is None:
-                # Always put _TRR_ERROR parses at the end.
-                multiplier *= -1 if reverse else 1
-            return multiplier * num
-
-        def w_to_e(element, reverse=False):
-            """
-            Convert Rge number and direction to a positive or negative
-            int, depending on direction. East townships are positive;
-            West are negative (in order to leverage the default behavior
-            of ``list.sort()`` -- i.e. smallest to largest).
-            ``reverse=True`` to inverse the positive and negative.
-            """
-            num = element.rge_num
-            ew = element.rge_ew
-
-            multiplier = 1
-            if num is None:
-                num = default_rge
-            if ew == 'e':
-                multiplier = 1
-            elif ew == 'w':
-                multiplier = -1
-            if reverse:
-                multiplier *= -1
-            if ew is None:
-                # Always put _TRR_ERROR parses at the end.
-                multiplier *= -1 if reverse else 1
-            return multiplier * num
-
-        def parse_key(k_):
-            k_ = k_.lower()
-            mo = re.search(pat, k_)
-            if not mo:
-                raise illegal_key_error
-            if len(mo.group(0)) != len(k_):
-                import warnings
-                warnings.warn(SyntaxWarning(
-                    f"Sort key {k_!r} may not have been fully interpreted. "
-                    f"Check to make sure you are using the correct syntax."
-                ))
-
-            var = mo.group("var")
-            method = mo.group("method")
-
-            if method is None:
-                # default to "num" for all vars.
-                method = "num"
-            # Whether to reverse
-            rev = mo.group("rev") is not None
-
-            # Confirm legal method for this var
-            if method not in legal_methods[var]:
-                raise ValueError(f"invalid sort method: {k!r}")
-
-            var_method = f"{var}.{method}"
-            return var_method, rev
-
-        key = key.lower()
-        key = re.sub(r"\s", "", key)
-        key = re.sub(r"reverse", "rev", key)
-        keys = key.split(',')
-        for k in keys:
-            sk, rev = parse_key(k)
-            self.sort(key=sort_defs[sk], reverse=rev)
+                num_att, dir_att = _SORT_FIELDS[var]
+                # TODO: Sort undefined Twp/Rge/Sec before error Twp/Rge/Sec.
+                default = max(
+                    (d[num_att] for d in fields.values()
+                     if d[num_att] is not None),
+                    default=0) + 1
+                # For directional methods (e.g., 't.ns'), one direction
+                # (e.g., north) is made negative so that it comes first.
+                # Errors always go at the end.
+                negative = _NEGATIVE_DIRECTION.get(method)
+                values = {}
+                for t, d in fields.items():
+                    n = d[num_att]
+                    if n is None:
+                        n = default
+                    if negative is not None and d[dir_att] == negative:
+                        n = -n
+                    values[t] = n
+                col = list(map(values.__getitem__, trs_strs))
+            if rev:
+                col = [-v for v in col]
+            key_columns.append(col)
+
+        sort_keys = list(zip(*key_columns))
+        order = sorted(range(len(elements)), key=sort_keys.__getitem__)
+        self._elements = [elements[i] for i in order]
+        self._invalidate_indexes()
 
         if reverse:
             self.reverse()
@@ -932,10 +1141,21 @@ class _TRSTractList:
          dict.)
         """
         dct = {}
-        for t in trstractlist:
-            val = getattr(t, attribute, f"{attribute}: n/a")
-            dct.setdefault(val, cls())
-            dct[val].append(t)
+        index = None
+        if isinstance(trstractlist, _TRSTractList):
+            index = trstractlist._get_index(attribute)
+        if index is not None:
+            # Use the existing index, with the groups in the order in
+            # which they first appear in the list.
+            elements = trstractlist._elements
+            groups = sorted(index.items(), key=lambda kv: kv[1][0])
+            for val, positions in groups:
+                dct[val] = cls(elements[i] for i in positions)
+        else:
+            for t in trstractlist:
+                val = getattr(t, attribute, f"{attribute}: n/a")
+                dct.setdefault(val, cls())
+                dct[val].append(t)
         if isinstance(into, dict):
             for k, tl in dct.items():
                 into.setdefault(k, cls())
@@ -1150,11 +1370,13 @@ class TractList(_TRSTractList):
           from the original ``TractList``.
     """
 
-    # A TractList holds only Tract objects. But Tract objects can be
-    # extracted from these types and added to the list.
-    _ok_individuals = (Tract,)
+    # A TractList holds only Tract (or CompactTract) objects. But Tract
+    # objects can be extracted from these types and added to the list.
+    _ok_individuals = (Tract, CompactTract)
     _ok_iterables = tuple()
-    _typeerror_msg = "TractList will accept only type `pytrs.Tract`."
+    _typeerror_msg = (
+        "TractList will accept only types `pytrs.Tract` and `CompactTract`."
+    )
 
     def __init__(self, iterable=()):
         """
@@ -1335,6 +1557,75 @@ class TractList(_TRSTractList):
         attributes = clean_attributes(attributes)
         return [t.to_list(attributes) for t in self]
 
+    def to_columns(self, *attributes) -> dict:
+        """
+        Compile the requested attributes of the ``Tract`` objects into
+        typed columns -- i.e. a dict, keyed by attribute, of NumPy
+        arrays (one value per ``Tract``, in order). Unlike
+        ``.tracts_to_dict()``, this does not create a dict (or list) for
+        each ``Tract``.
+
+        Twp/Rge/Sec numbers are stored as small ints (``0`` for
+        undefined or error), and N/S and E/W directions as category
+        codes. See the ``pytrs.parser.containers.columns`` module for
+        all column types.
+
+        Example:
+
+        .. code-block:: python
+
+            tl_obj.to_columns('trs', 'twp_num', 'twp_ns', 'qqs')
+
+        Example returns::
+
+            {'trs': array(['154n97w14', '154n97w15'], dtype=object),
+             'twp_num': array([154, 154], dtype=int16),
+             'twp_ns': array([0, 0], dtype=int8),
+             'qqs': array([list(['NENE', ...]), list(['NENW', ...])],
+                          dtype=object)}
+
+        If NumPy is not installed, the columns are lists instead.
+
+        :param attributes: The names (strings) of whichever attributes
+         should be included (see documentation on ``Tract`` objects
+         for the names of relevant attributes).
+        :return: A dict of columns, keyed by attribute.
+        """
+        attributes = clean_attributes(attributes)
+        return tracts_to_columns(self, attributes)
+
+    def to_pandas(self, *attributes):
+        """
+        Compile the requested attributes of the ``Tract`` objects into a
+        ``pandas.DataFrame`` (one row per ``Tract``), built from the
+        typed columns of ``.to_columns()``. N/S and E/W directions are
+        categorical, and undefined or error Twp/Rge/Sec numbers are
+        ``<NA>``.
+
+        Requires that pandas be installed.
+
+        :param attributes: The names (strings) of whichever attributes
+         should be included.
+        :return: A ``pandas.DataFrame``.
+        """
+        return columns_to_pandas(self.to_columns(*attributes))
+
+    def to_arrow(self, *attributes):
+        """
+        Compile the requested attributes of the ``Tract`` objects into a
+        ``pyarrow.Table`` (one row per ``Tract``), built from the typed
+        columns of ``.to_columns()``. N/S and E/W directions are
+        dictionary-encoded, and undefined or error Twp/Rge/Sec numbers
+        are null.
+
+        Requires that pyarrow and NumPy be installed.
+
+        :param attributes: The names (strings) of whichever attributes
+         should be included.
+        :return: A ``pyarrow.Table``.
+        """
+        return columns_to_arrow(self.to_columns(*attributes))
+
     def tracts_to_str(self, *attributes) -> str:
         """
         Compile the data for all ``Tract`` objects into an orderly
@@ -1719,6 +2010,50 @@ class TractList(_TRSTractList):
         # an accurate docstring (and to simplify the signature).
         return cls._from_multiple(objects)
 
+    def to_compact(self):
+        """
+        Get a new ``TractList`` holding a ``CompactTract`` for each
+        ``Tract`` in this one (in the same order), which takes up much
+        less memory. (Any ``CompactTract`` already in this list is
+        carried over as-is.)
+
+        Convert back with ``.to_full()``.
+
+        :return: A new ``TractList`` of ``CompactTract`` objects.
+        """
+        return TractList(
+            t if isinstance(t, CompactTract) else CompactTract(t)
+            for t in self
+        )
+
+    def to_full(self):
+        """
+        Get a new ``TractList`` holding a full ``Tract`` for each
+        ``CompactTract`` in this one (in the same order), so that they
+        can be parsed or reconfigured. (Any ``Tract`` already in this
+        list is carried over as-is.)
+
+        :return: A new ``TractList`` of ``Tract`` objects.
+        """
+        return TractList(
+            t.to_tract() if isinstance(t, CompactTract) else t
+            for t in self
+        )
+
+    def acreage(self):
+        """
+        Get the nominal gross acreage of each ``Tract`` in this list (in
+        the same order), as computed by ``Tract.acres`` -- i.e. the
+        acreage of its QQs (assuming standard 640-acre sections), plus
+        the acreage stated for any of its lots.
+
+        If NumPy is installed, the acreages are computed in a single
+        vectorized pass and returned as a NumPy array of floats (so
+        ``tractlist.acreage().sum()`` gives the total). Otherwise, they
+        are returned as a list of floats.
+        """
+        return tracts_acreage(self)
+
     def consolidate(self, desc_delim='; '):
         """
         Consolidate tracts by TRS. Creates a new ``Tract`` object for
@@ -1740,8 +2075,16 @@ class TractList(_TRSTractList):
             qqs_all = []
             lots_all = []
             descs_all = []
+            added = {}
             for tract in group:
                 descs_all.append(tract.desc)
+                # Skip the lots and QQs of any tract whose lots/QQs were
+                # all already added by an earlier (duplicate) tract.
+                fp = tract.lots_qqs_fingerprint
+                added_tracts = added.setdefault(fp, [])
+                if _has_exact_match(tract, added_tracts, lots_qqs_key):
+                    continue
+                added_tracts.append(tract)
                 qqs_all.extend(tract.qqs)
                 lots_all.extend(tract.lots)
             qqs_seen = set()
@@ -1925,7 +2268,7 @@ class TRSList(_TRSTractList):
 
     # A TRSList holds only TRS objects. But these types can be processed
     # into individual TRS objects, which are then added.
-    _ok_individuals = (str, TRS, Tract)
+    _ok_individuals = (str, TRS, Tract, CompactTract)
     _ok_iterables = (TractList,)
     _typeerror_msg = (
         "TRSList will accept only types ('str', 'TRS', 'Tract')."
@@ -1958,7 +2301,7 @@ class TRSList(_TRSTractList):
             return obj
         if isinstance(obj, str):
             return TRS(obj)
-        if isinstance(obj, Tract):
+        if isinstance(obj, (Tract, CompactTract)):
             return TRS(obj.trs)
         raise TypeError(f"{cls._typeerror_msg} Cannot accept {type(obj)}")
 
@@ -1977,6 +2320,26 @@ class TRSList(_TRSTractList):
         """
         return [trs_obj.trs for trs_obj in self]
 
+    def to_ints(self):
+        """
+        Encode the Twp/Rge/Sec of each element in this list as a single
+        integer (see ``TRS.to_int()``), for compact storage.
+
+        :return: A new (plain) list of ints.
+        """
+        return [trs_obj.to_int() for trs_obj in self]
+
+    @classmethod
+    def from_ints(cls, ints):
+        """
+        Create a new ``TRSList`` from integers that were encoded by
+        ``TRS.to_int()`` (or ``TRSList.to_ints()``).
+
+        :param ints: An iterable of encoded ints.
+        :return: The new ``TRSList``.
+        """
+        return cls(map(TRS.int_to_trs, ints))
+
     def contains(self, trs, match_all=False) -> bool:
         """
         Check whether this ``TRSList`` contains one or more specific
@@ -2006,10 +2369,13 @@ class TRSList(_TRSTractList):
         # convert all elements within it to `TRS` objects) and add to a
         # TRSList. Convert the resulting TRSList to a set.
         look_for = set(TRSList.from_multiple(trs).to_strings())
-        contained = set(self.to_strings())
+        # Use the index on 'trs' if there is one (see `.create_index()`).
+        contained = self._get_index('trs')
+        if contained is None:
+            contained = set(self.to_strings())
         if match_all:
-            return len(look_for - contained) == 0
-        return len(contained.intersection(look_for)) > 0
+            return all(t in contained for t in look_for)
+        return any(t in contained for t in look_for)
 
     @classmethod
     def from_multiple(cls, *objects):
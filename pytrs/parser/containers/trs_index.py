@@ -0,0 +1,307 @@
+
+"""
+An index of ``Tract`` or ``TRS`` objects by their position on the
+nominal PLSS section grid, for fast lookups and for neighbor, adjacency,
+and radius queries.
+"""
+
+from ..trs import TRS
+from ..tract import Tract
+from ..tract.compact_tract import CompactTract
+from .containers import TractList, TRSList
+
+# Each township is 6 sections (i.e. 6 miles) on a side.
+_TWP_SIZE = 6
+
+# The 8 grid offsets to the sections that border a section, including
+# those that touch only at a corner.
+_ALL_NEIGHBORS = (
+    (-1, 1), (0, 1), (1, 1),
+    (-1, 0), (1, 0),
+    (-1, -1), (0, -1), (1, -1),
+)
+# Only those that share a side.
+_SIDE_NEIGHBORS = ((0, 1), (-1, 0), (1, 0), (0, -1))
+
+
+def trs_to_grid(trs):
+    """
+    Convert a Twp/Rge/Sec into integer ``(x, y)`` coordinates on the
+    nominal PLSS section grid, where each section is a 1-mile square,
+    ``x`` increases to the east, and ``y`` increases to the north. The
+    origin is the southwest corner of T1N-R1E Sec 31 (so T1N-R1E Sec 31
+    is at ``(0, 0)``, and T1S-R1W Sec 1 is at ``(-1, -1)``).
+
+    Sections are numbered in the standard boustrophedon order: Sec 1 in
+    the northeast corner of the township, through Sec 6 in the northwest
+    corner; then Sec 7 directly south of Sec 6, through Sec 12 on the
+    east; and so on through Sec 36 in the southeast corner.
+
+    .. note::
+        The grid is nominal. It does not account for correction lines,
+        irregular townships, or differing principal meridians.
+
+    :param trs: The Twp/Rge/Sec, as a ``TRS`` object or a string in the
+     standard pyTRS format (e.g., ``'154n97w14'``).
+    :return: A 2-tuple of ints, or ``None`` if any part of the
+     Twp/Rge/Sec is undefined or an error.
+    """
+    if not isinstance(trs, TRS):
+        trs = TRS(trs)
+    twp_num = trs.twp_num
+    rge_num = trs.rge_num
+    sec_num = trs.sec_num
+    if None in (twp_num, rge_num, sec_num) or not 1 <= sec_num <= 36:
+        return None
+    if trs.twp_ns == 'n':
+        twp_y = (twp_num - 1) * _TWP_SIZE
+    else:
+        twp_y = -twp_num * _TWP_SIZE
+    if trs.rge_ew == 'e':
+        rge_x = (rge_num - 1) * _TWP_SIZE
+    else:
+        rge_x = -rge_num * _TWP_SIZE
+    row, col = divmod(sec_num - 1, _TWP_SIZE)
+    if row % 2 == 0:
+        # The 1st, 3rd, and 5th rows (from the north) run east to west.
+        col = _TWP_SIZE - 1 - col
+    return rge_x + col, twp_y + _TWP_SIZE - 1 - row
+
+
+def grid_to_trs(x: int, y: int) -> str:
+    """
+    Convert ``(x, y)`` coordinates on the nominal PLSS section grid back
+    into a Twp/Rge/Sec in the standard pyTRS format. (The inverse of
+    ``trs_to_grid()``.)
+
+    :param x: The east-west coordinate.
+    :param y: The north-south coordinate.
+    :return: The Twp/Rge/Sec as a string (e.g., ``'154n97w14'``).
+    """
+    rge_x, col = divmod(x, _TWP_SIZE)
+    twp_y, row_from_south = divmod(y, _TWP_SIZE)
+    row = _TWP_SIZE - 1 - row_from_south
+    if row % 2 == 0:
+        col = _TWP_SIZE - 1 - col
+    sec_num = row * _TWP_SIZE + col + 1
+    if twp_y >= 0:
+        twp = f"{twp_y + 1}n"
+    else:
+        twp = f"{-twp_y}s"
+    if rge_x >= 0:
+        rge = f"{rge_x + 1}e"
+    else:
+        rge = f"{-rge_x}w"
+    return f"{twp}{rge}{sec_num:02d}"
+
+
+class TRSIndex:
+    """
+    An index of ``Tract`` (or ``TRS``) objects by their Twp/Rge/Sec and
+    by the position of that section on the nominal PLSS section grid
+    (see ``trs_to_grid()``). Supports fast lookup by Twp/Rge/Sec, plus
+    neighbor, adjacency, and radius queries::
+
+        index = TRSIndex(some_tractlist)
+        index.get('154n97w14')          # The tracts in Sec 14.
+        index.border('154n97w14')       # The 8 sections around it.
+        index.adjacent('154n97w14')     # The tracts in those sections.
+        index.within('154n97w14', 2)    # The tracts within 2 miles.
+
+    Queries that return elements return them in a ``TractList`` (or a
+    ``TRSList``, if the index was created from Twp/Rge/Sec rather than
+    from tracts), in the order in which they were indexed. Elements
+    whose Twp/Rge/Sec is undefined or an error are kept in
+    ``.unlocated`` and are only found by ``.get()``.
+
+    .. note::
+        Distances and adjacency are based on the nominal grid, in which
+        every section is a 1-mile square. They do not account for
+        correction lines, irregular townships, or differing principal
+        meridians.
+    """
+
+    def __init__(self, source=()):
+        """
+        :param source: A ``TractList``, ``TRSList``, or ``PLSSDesc`` --
+         or any iterable of ``Tract`` objects, or of ``TRS`` objects
+         and/or strings in the standard pyTRS format.
+        """
+        if not isinstance(source, (TractList, TRSList)):
+            source = list(source)
+            if all(isinstance(e, (Tract, CompactTract)) for e in source):
+                source = TractList(source)
+            else:
+                source = TRSList(source)
+        self._container_type = type(source)
+        self._by_trs = {}
+        # Each grid cell holds 2-tuples of (order indexed, element).
+        self._by_cell = {}
+        self._count = 0
+        self.unlocated = self._container_type()
+        for element in source:
+            self.add(element)
+
+    def __repr__(self):
+        return (
+            f"TRSIndex({len(self._by_trs)} Twp/Rge/Sec, "
+            f"{len(self._by_cell)} located on grid)")
+
+    def __len__(self):
+        return self._count
+
+    def __contains__(self, trs):
+        return self._trs_str(trs) in self._by_trs
+
+    @staticmethod
+    def _trs_str(trs) -> str:
+        """INTERNAL USE: Get the Twp/Rge/Sec of ``trs`` as a string."""
+        if isinstance(trs, str):
+            return trs
+        return trs.trs
+
+    def add(self, element):
+        """
+        Add a ``Tract`` (or ``TRS``, if this index holds ``TRS``
+        objects) to the index.
+        """
+        trs = element.trs
+        self._by_trs.setdefault(trs, []).append(element)
+        cell = trs_to_grid(trs)
+        if cell is None:
+            self.unlocated.append(element)
+        else:
+            self._by_cell.setdefault(cell, []).append((self._count, element))
+        self._count += 1
+
+    def _collect(self, cells):
+        """
+        INTERNAL USE:
+        Get the indexed elements in the ``cells``, in the order in which
+        they were indexed.
+        """
+        found = []
+        for cell in cells:
+            found.extend(self._by_cell.get(cell, ()))
+        found.sort(key=lambda pair: pair[0])
+        return self._container_type(element for _, element in found)
+
+    def get(self, trs):
+        """
+        Get the elements at the Twp/Rge/Sec.
+
+        :param trs: The Twp/Rge/Sec, as a ``TRS`` object or a string in
+         the standard pyTRS format.
+        """
+        return self._container_type(self._by_trs.get(self._trs_str(trs), ()))
+
+    def trs(self) -> list:
+        """Get a list of every Twp/Rge/Sec in the index (as strings)."""
+        return list(self._by_trs.keys())
+
+    @staticmethod
+    def _cells_of(trs) -> set:
+        """
+        INTERNAL USE:
+        Get the grid cells of one or more Twp/Rge/Sec (ignoring any that
+        cannot be placed on the grid).
+        """
+        if isinstance(trs, (str, TRS, Tract, CompactTract)):
+            trs = [trs]
+        cells = set()
+        for t in trs:
+            cell = trs_to_grid(TRSIndex._trs_str(t))
+            if cell is not None:
+                cells.add(cell)
+        return cells
+
+    @staticmethod
+    def border(trs, diagonal=True) -> list:
+        """
+        Get the sections that border a section, or that border a unit
+        made up of multiple sections (excluding the sections in the unit
+        itself). These are returned whether or not they are in the
+        index.
+
+        :param trs: The Twp/Rge/Sec -- as a ``TRS`` object or a string
+         in the standard pyTRS format -- or an iterable of them (or a
+         ``TractList``, etc.) for a multi-section unit.
+        :param diagonal: Whether to include the sections that only touch
+         at a corner. (Default ``True``.)
+        :return: A sorted list of Twp/Rge/Sec strings.
+        """
+        cells = TRSIndex._cells_of(trs)
+        offsets = _ALL_NEIGHBORS if diagonal else _SIDE_NEIGHBORS
+        bordering = {
+            (x + dx, y + dy) for x, y in cells for dx, dy in offsets}
+        bordering -= cells
+        return sorted(grid_to_trs(x, y) for x, y in bordering)
+
+    def adjacent(self, trs, diagonal=True):
+        """
+        Get the indexed elements in the sections that border a section
+        (or a unit made up of multiple sections). See ``.border()``.
+
+        :param trs: The Twp/Rge/Sec -- as a ``TRS`` object or a string
+         in the standard pyTRS format -- or an iterable of them (or a
+         ``TractList``, etc.) for a multi-section unit.
+        :param diagonal: Whether to include the sections that only touch
+         at a corner. (Default ``True``.)
+        """
+        cells = self._cells_of(trs)
+        offsets = _ALL_NEIGHBORS if diagonal else _SIDE_NEIGHBORS
+        bordering = {
+            (x + dx, y + dy) for x, y in cells for dx, dy in offsets}
+        return self._collect(bordering - cells)
+
+    def within(self, trs, miles, include_self=True):
+        """
+        Get the indexed elements in every section whose center is within
+        ``miles`` of the center of the section (or of any section in a
+        multi-section unit).
+
+        :param trs: The Twp/Rge/Sec -- as a ``TRS`` object or a string
+         in the standard pyTRS format -- or an iterable of them (or a
+         ``TractList``, etc.) for a multi-section unit.
+        :param miles: The radius, in miles (i.e. sections).
+        :param include_self: Whether to include the elements in the
+         section(s) of ``trs`` themselves. (Default ``True``.)
+        """
+        cells = self._cells_of(trs)
+        reach = int(miles)
+        limit = miles * miles
+        nearby = set()
+        for x, y in cells:
+            for dx in range(-reach, reach + 1):
+                for dy in range(-reach, reach + 1):
+                    if dx * dx + dy * dy <= limit:
+                        nearby.add((x + dx, y + dy))
+        if not include_self:
+            nearby -= cells
+        return self._collect(nearby)
+
+    @staticmethod
+    def distance(trs_1, trs_2) -> float:
+        """
+        Get the distance in miles between the centers of two sections
+        (on the nominal grid).
+
+        :param trs_1: A Twp/Rge/Sec, as a ``TRS`` object or a string in
+         the standard pyTRS format.
+        :param trs_2: Another Twp/Rge/Sec.
+        :return: The distance, or ``None`` if either Twp/Rge/Sec cannot
+         be placed on the grid.
+        """
+        cell_1 = trs_to_grid(TRSIndex._trs_str(trs_1))
+        cell_2 = trs_to_grid(TRSIndex._trs_str(trs_2))
+        if cell_1 is None or cell_2 is None:
+            return None
+        return ((cell_1[0] - cell_2[0]) ** 2
+                + (cell_1[1] - cell_2[1]) ** 2) ** 0.5
+
+
+__all__ = [
+    'TRSIndex',
+    'trs_to_grid',
+    'grid_to_trs',
+]
@@ -0,0 +1,281 @@
+"""
+Functions for parsing many PLSS descriptions in a single call,
+optionally spreading the work across multiple processes, or streaming
+the results one ``Tract`` at a time.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from ..config import (
+    Config,
+    ConfigError,
+    MasterConfig,
+)
+from ..trs import TRS
+from ..profiling.profiling import (
+    instrument,
+    is_collecting,
+    _merge_into_active,
+)
+from .plssdesc import PLSSDesc
+
+
+def parse_many(
+        descriptions,
+        config=None,
+        layout=None,
+        workers=None,
+        chunksize=None,
+        tracts_only=False) -> list:
+    """
+    Parse many PLSS descriptions, optionally across multiple processes
+    (using a ``concurrent.futures.ProcessPoolExecutor``).
+
+    The results are returned in the same order as the input
+    ``descriptions``, and each description's ``source`` (if any) is
+    carried over to the resulting ``PLSSDesc`` and its ``Tract``
+    objects.
+
+    Example:
+
+    .. code-block:: python
+
+        rows = [
+            ('T154N-R97W Sec 14: NE/4', 'lease_0001'),
+            ('T155N-R97W Sec 1: SW/4', 'lease_0002'),
+        ]
+        parsed = pytrs.parse_many(rows, config='parse_qq', workers=4)
+
+    .. note::
+        When parsing in worker processes, ``pytrs.instrument()``
+        collects the stats of the workers, but the
+        ``MasterConfig.profile_hook`` (if any) is not called for the
+        work that they do.
+
+    .. note::
+        ``Tract`` objects are assigned a new unique identifier when they
+        are returned from a worker process, so that sorting by creation
+        order (i.e. ``'i'`` in ``.custom_sort()``) follows the order of
+        ``descriptions``, just as though they had been parsed in this
+        process.
+
+    :param descriptions: An iterable of descriptions to parse. Each
+     element may be a string (the description text), or a 2-tuple of
+     ``(text, source)``.
+
+    :param config: (Optional) Either a ``Config`` object, or a string of
+     parameters, to apply to every ``PLSSDesc``. (See documentation on
+     ``Config`` objects for optional config parameters.)
+
+    :param layout: (Optional) The pyTRS layout to use for every
+     description. If not specified, will be deduced for each
+     description.
+
+    :param workers: (Optional) The maximum number of worker processes.
+     If not specified, will default to the number of processors on the
+     machine (as with ``ProcessPoolExecutor``). Pass ``workers=1`` (or
+     ``0``) to parse serially in this process, without a pool.
+
+    :param chunksize: (Optional) The number of descriptions to send to
+     a worker at a time. If not specified, will be determined from the
+     number of descriptions and workers.
+
+    :param tracts_only: Whether to return a ``TractList`` for each
+     description, instead of a ``PLSSDesc``. (Defaults to ``False``.)
+     This results in less data being sent back from each worker.
+
+    :return: A list of ``PLSSDesc`` objects (or ``TractList`` objects,
+     if ``tracts_only=True``), one per description, in the same order as
+     ``descriptions``.
+    """
+    config_text = _config_to_text(config)
+    jobs = [
+        (text, source, config_text, layout, tracts_only)
+        for text, source in _unpack_descriptions(descriptions)
+    ]
+    if not jobs:
+        return []
+
+    if workers is not None and workers <= 1:
+        # Nothing to remap, since the Tracts were created in this process.
+        return [_parse_job(job) for job in jobs]
+
+    if chunksize is None:
+        # Send each worker roughly 4 chunks, so that a slow chunk does
+        # not leave the other workers idle at the end.
+        num_workers = workers or _default_workers()
+        chunksize = max(1, len(jobs) // (num_workers * 4))
+
+    # If stats are being collected here (by `pytrs.instrument()`), have
+    # the workers collect their own and send them back. (The
+    # `MasterConfig.profile_hook` is not called for work done in the
+    # workers.)
+    job_func = _parse_job
+    if is_collecting():
+        job_func = _parse_job_instrumented
+
+    with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(
+                MasterConfig.default_ns,
+                MasterConfig.default_ew,
+                TRS._cached_trs(),
+            )
+    ) as executor:
+        results = list(executor.map(job_func, jobs, chunksize=chunksize))
+
+    if job_func is _parse_job_instrumented:
+        for _, stats in results:
+            _merge_into_active(stats)
+        results = [result for result, _ in results]
+
+    # Tracts created in a worker process carry UIDs from that process's
+    # counter, which would collide with (and sort differently from)
+    # those in this process. Reassign them in input order.
+    for result in results:
+        for tract in result:
+            tract._reset_uid()
+    return results
+
+
+def iter_parse(descriptions, config=None, layout=None):
+    """
+    Parse descriptions lazily, yielding the resulting ``Tract`` objects
+    one at a time (in order), without holding the entire batch in
+    memory at once.
+
+    Each description is parsed only as its ``Tract`` objects are
+    requested, and no ``PLSSDesc`` is kept for it, so this is suitable
+    for very large inputs (e.g., rows streamed from a .csv file and fed
+    into a ``TractWriter``).
+
+    Example:
+
+    .. code-block:: python
+
+        rows = (
+            (row[desc_col], row_num)
+            for row_num, row in enumerate(csv.reader(file))
+        )
+        for tract in pytrs.iter_parse(rows, config='parse_qq'):
+            writer.write(tract)
+
+    .. note::
+        The ``Tract`` objects from a given description are yielded only
+        after that entire description has been parsed, because the
+        warning and error flags generated for the description are handed
+        down to all of its ``Tract`` objects.
+
+    :param descriptions: An iterable of descriptions to parse. Each
+     element may be a string (the description text), or a 2-tuple of
+     ``(text, source)``.
+
+    :param config: (Optional) Either a ``Config`` object, or a string of
+     parameters, to apply to every description. (See documentation on
+     ``Config`` objects for optional config parameters.)
+
+    :param layout: (Optional) The pyTRS layout to use for every
+     description. If not specified, will be deduced for each
+     description.
+
+    :return: A generator of ``Tract`` objects.
+    """
+    # A single unparsed PLSSDesc locks down the config parameters once,
+    # and is then reused to parse each description.
+    template = PLSSDesc('', layout=layout, config=config, wait_to_parse=True)
+    for text, source in _unpack_descriptions(descriptions):
+        if not isinstance(text, str):
+            raise TypeError(
+                f"Descriptions must be of type 'string'. "
+                f"Passed as type {type(text)}.")
+        template.orig_desc = text
+        template.source = source
+        yield from template.parse(commit=False)
+
+
+def _unpack_descriptions(descriptions):
+    """
+    INTERNAL USE:
+    Generate ``(text, source)`` pairs from an iterable whose elements
+    are either strings or 2-tuples of ``(text, source)``.
+    """
+    for row in descriptions:
+        if isinstance(row, str):
+            yield row, None
+        else:
+            text, source = row
+            yield text, source
+
+
+def _config_to_text(config) -> str:
+    """
+    INTERNAL USE:
+    Convert ``config`` to config text, which is cheap to send to the
+    worker processes.
+    """
+    if config is None or isinstance(config, str):
+        return config
+    if isinstance(config, Config):
+        return config.decompile_to_text()
+    raise ConfigError(config)
+
+
+def _default_workers() -> int:
+    """
+    INTERNAL USE:
+    The number of workers that ``ProcessPoolExecutor`` will use if
+    ``max_workers`` is not specified.
+    """
+    return os.cpu_count() or 1
+
+
+def _init_worker(default_ns, default_ew, cached_trs):
+    """
+    INTERNAL USE:
+    Prepare a new worker process. The ``MasterConfig`` defaults are
+    carried over from the parent process (which would not otherwise
+    happen on platforms that spawn, rather than fork, new processes),
+    and the ``TRS`` cache is warmed up with the Twp/Rge/Sec that were
+    already cached in the parent process.
+    """
+    MasterConfig.default_ns = default_ns
+    MasterConfig.default_ew = default_ew
+    TRS._warm_cache(cached_trs)
+
+
+def _parse_job(job):
+    """
+    INTERNAL USE:
+    Parse a single description (in whichever process this is called).
+
+    :param job: A tuple of
+     ``(text, source, config_text, layout, tracts_only)``.
+    :return: A ``PLSSDesc``, or its ``TractList`` if ``tracts_only``.
+    """
+    text, source, config_text, layout, tracts_only = job
+    desc = PLSSDesc(text, layout=layout, config=config_text, source=source)
+    if tracts_only:
+        return desc.tracts
+    return desc
+
+
+def _parse_job_instrumented(job):
+    """
+    INTERNAL USE:
+    Same as ``_parse_job()``, but also collect the stats of the parse
+    (see ``pytrs.instrument()``).
+
+    :return: A 2-tuple of the result of ``_parse_job()`` and the stats
+     (as a dict from ``ParseStats.to_dict()``).
+    """
+    with instrument() as stats:
+        result = _parse_job(job)
+    return result, stats.to_dict()
+
+
+__all__ = [
+    'parse_many',
+    'iter_parse',
+]
@@ -0,0 +1,232 @@
+"""
+An opt-in, bounded cache of parse results, for datasets that contain
+many exact-duplicate PLSS descriptions.
+"""
+
+import threading
+from collections import OrderedDict
+
+from ..config import MasterConfig
+from ..containers import TractList
+
+# The active cache (if any), used by `PLSSDesc.parse()`.
+_PARSE_CACHE = None
+
+
+class ParseCache:
+    """
+    A bounded cache of parse results, keyed by the original text of a
+    PLSS description and the parameters it was parsed with. When full,
+    the least-recently-used result is discarded to make room.
+
+    Turn it on with ``pytrs.enable_parse_cache()``, after which every
+    ``PLSSDesc`` that is parsed will check it first.
+
+    Results are stored and returned as copies, so any changes to the
+    ``Tract`` objects (or flags) returned from the cache will not affect
+    the cached results. Each copied ``Tract`` gets a new unique
+    identifier and the ``source`` of the description being parsed.
+
+    Get statistics from the ``.hits``, ``.misses``, and ``.evictions``
+    attributes, or all at once with ``.info()``.
+    """
+
+    DEFAULT_MAXSIZE = 4096
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        """
+        :param maxsize: The maximum number of parse results to hold.
+        """
+        if not isinstance(maxsize, int) or maxsize < 1:
+            raise ValueError('`maxsize` must be a positive int.')
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._results = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._results)
+
+    def __repr__(self):
+        return f"ParseCache<{self.info()}>"
+
+    @staticmethod
+    def make_key(text: str, layout, params: dict) -> tuple:
+        """
+        INTERNAL USE:
+        Generate the key for the parse of ``text`` with the ``layout``
+        and the dict of (fully resolved) parse parameters that will be
+        passed to the ``PLSSParser``.
+        """
+        params = dict(params)
+        # Unspecified directions fall back on the MasterConfig, which may
+        # change between parses.
+        if not params.get('default_ns'):
+            params['default_ns'] = MasterConfig.default_ns
+        if not params.get('default_ew'):
+            params['default_ew'] = MasterConfig.default_ew
+        return text, layout, tuple(sorted(params.items()))
+
+    def get(self, key, source=None):
+        """
+        Get a fresh copy of the cached parse result for the ``key``, or
+        ``None`` if it is not in the cache.
+
+        :param key: A key generated by ``.make_key()``.
+        :param source: The ``source`` to apply to the copied ``Tract``
+         objects.
+        :return: A ``CachedParse`` object (or ``None``).
+        """
+        with self._lock:
+            result = self._results.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            self._results.move_to_end(key)
+            self.hits += 1
+        return result.copy(source)
+
+    def put(self, key, parser) -> None:
+        """
+        Store a copy of the results of a ``PLSSParser`` (or
+        ``CachedParse``) under the ``key``.
+
+        :param key: A key generated by ``.make_key()``.
+        :param parser: The ``PLSSParser`` whose results to store.
+        """
+        result = CachedParse.from_parser(parser)
+        with self._lock:
+            self._results[key] = result
+            self._results.move_to_end(key)
+            while len(self._results) > self.maxsize:
+                self._results.popitem(last=False)
+                self.evictions += 1
+        return None
+
+    def clear(self) -> None:
+        """Discard all cached results (and reset the statistics)."""
+        with self._lock:
+            self._results.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+        return None
+
+    def info(self) -> dict:
+        """
+        Get the statistics for this cache as a dict, with keys
+        ``'hits'``, ``'misses'``, ``'evictions'``, ``'size'``, and
+        ``'maxsize'``.
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self._results),
+            'maxsize': self.maxsize,
+        }
+
+
+class CachedParse:
+    """
+    INTERNAL USE:
+    The stored results of a ``PLSSParser``, with the same attributes
+    that ``PLSSDesc.parse()`` pulls from the parser.
+    """
+
+    UNPACKABLES = (
+        "tracts",
+        "w_flags",
+        "e_flags",
+        "w_flag_lines",
+        "e_flag_lines",
+        "current_layout",
+    )
+
+    def __init__(
+            self,
+            tracts,
+            w_flags,
+            e_flags,
+            w_flag_lines,
+            e_flag_lines,
+            current_layout,
+            text):
+        self.tracts = tracts
+        self.w_flags = w_flags
+        self.e_flags = e_flags
+        self.w_flag_lines = w_flag_lines
+        self.e_flag_lines = e_flag_lines
+        self.current_layout = current_layout
+        # The preprocessed text.
+        self.text = text
+
+    @classmethod
+    def from_parser(cls, parser):
+        """
+        Copy the results of a ``PLSSParser`` (or another
+        ``CachedParse``).
+        """
+        return cls(
+            tracts=TractList(t._fresh_copy() for t in parser.tracts),
+            w_flags=list(parser.w_flags),
+            e_flags=list(parser.e_flags),
+            w_flag_lines=list(parser.w_flag_lines),
+            e_flag_lines=list(parser.e_flag_lines),
+            current_layout=parser.current_layout,
+            text=parser.text)
+
+    def copy(self, source=None):
+        """
+        Get a copy of these results, whose ``Tract`` objects have the
+        specified ``source``.
+        """
+        new = CachedParse.from_parser(self)
+        for tract in new.tracts:
+            tract.source = source
+        return new
+
+
+def enable_parse_cache(maxsize: int = ParseCache.DEFAULT_MAXSIZE) -> ParseCache:
+    """
+    Turn on caching of parse results, so that parsing a PLSS description
+    that has already been parsed (with the same parameters) will reuse
+    the earlier results instead of parsing it again. Useful for datasets
+    that contain many exact-duplicate descriptions.
+
+    If the cache is already on, it is replaced with a new, empty one.
+
+    :param maxsize: The maximum number of parse results to hold. (When
+     full, the least-recently-used result is discarded.)
+    :return: The new ``ParseCache`` (whose ``.info()`` method reports
+     hits, misses, etc.).
+    """
+    global _PARSE_CACHE
+    _PARSE_CACHE = ParseCache(maxsize)
+    return _PARSE_CACHE
+
+
+def disable_parse_cache() -> None:
+    """
+    Turn off caching of parse results (and discard the cache).
+    """
+    global _PARSE_CACHE
+    _PARSE_CACHE = None
+    return None
+
+
+def get_parse_cache():
+    """
+    Get the active ``ParseCache``, or ``None`` if caching is turned off.
+    """
+    return _PARSE_CACHE
+
+
+__all__ = [
+    'ParseCache',
+    'enable_parse_cache',
+    'disable_parse_cache',
+    'get_parse_cache',
+]
@@ -4,18 +4,23 @@ Class and functions for parsing PLSS descriptions that have already been
 preprocessed.
 """
 
+from ...utils import (
+    _intern_flags,
+    _intern_flag_lines,
+)
 from ..rgxlib import *
 from ..unpack import (
     SecUnpacker,
     unpack_twprge,
     twprge_natural_to_short,
-    is_multi_sec,
 )
 from ..config import (
+    Config,
     MasterConfig,
 )
-from ..tract import Tract
+from ..tract import Tract, LiteTract
 from ..containers import TractList
+from ..profiling.profiling import timed
 from ..config import (
     TRS_DESC,
     DESC_STR,
@@ -27,6 +32,10 @@ from .plss_preprocess import (
     PLSSPreprocessor,
     find_twprge,
 )
+from .plss_tokenize import (
+    PLSSTokenizer,
+    MULTISEC,
+)
 
 _E_FLAG_SECERR = 'sec_error'
 _E_FLAG_TWPRGE_ERR = 'twprge_error'
@@ -38,6 +47,11 @@ SEC_END = 'SEC_END'
 TEXT_START = 'TEXT_START'
 TEXT_END = 'TEXT_END'
 
+# The `Config` to hand down to Tracts when `parse_qq` is used, for each
+# `Config` handed down by the PLSSDesc. (Stops growing at the same size
+# as the `Config` registry.)
+_PARSE_QQ_CONFIGS = {}
+
 
 class TwpRgeFinder:
     """
@@ -46,26 +60,36 @@ class TwpRgeFinder:
     A class to find Twp/Rge's that appropriately match the specified
     layout.
     """
-    def __init__(self, txt: str, layout: str = None):
+    def __init__(
+            self,
+            txt: str,
+            layout: str = None,
+            tokenizer: PLSSTokenizer = None):
         self.txt = txt
         self.matches = []
         self.layout = layout
         self.flags = []
         self.flag_lines = []
+        if tokenizer is None:
+            tokenizer = PLSSTokenizer(txt)
+        self.tokenizer = tokenizer
         self.findall_matching_twprge(txt, layout)
 
+    @timed('twprge_finder')
     def findall_matching_twprge(self, txt, layout):
         """
         INTERNAL USE:
 
         Find Twp/Rge's that appropriately match the specified layout.
 
-        :param txt: The text in which to find matching Twp/Rge's.
+        :param txt: The text in which to find matching Twp/Rge's. (Must
+        be the text that was tokenized in ``.tokenizer``.)
         :param layout: The layout of the text. (Will be deduced if not
         specified.)
         """
+        tokenizer = self.tokenizer
         if layout is None:
-            layout = deduce_layout(text=txt)
+            layout = deduce_layout(text=txt, tokenizer=tokenizer)
 
         def new_match(mo):
             """
@@ -79,8 +103,7 @@ class TwpRgeFinder:
             self.matches.append(new)
             return new
 
-        j = 0
-        for twprge_mo in twprge_regex.finditer(txt):
+        for _, twprge_mo, i, _ in tokenizer.twprge_tokens:
             # For these layouts, all Twp/Rge count as matches.
             if layout in (DESC_STR, TR_DESC_S, COPY_ALL):
                 new_match(twprge_mo)
@@ -89,14 +112,11 @@ class TwpRgeFinder:
             # For TRS_DESC and S_DESC_TR, we have to rule out false matches.
             legit_match = True
 
-            # Get the rightmost sec_mo to the left of this twprge.
-            i = twprge_mo.start(0)
-            sec_mo = None
-            for sec_mo in multisec_regex.finditer(txt, pos=j, endpos=i):
-                j = sec_mo.start(0)
+            # Get the rightmost section to the left of this twprge.
+            sec_start = tokenizer.last_sec_start_before(i)
 
-            if sec_mo is not None:
-                substring = txt[sec_mo.start(0):twprge_mo.end(0)]
+            if sec_start is not None:
+                substring = txt[sec_start:twprge_mo.end(0)]
                 # If there's a match on this regex pattern, this is not
                 # a match.
                 # (E.g., "...that part of Section 4 of T154N-R97W...")
@@ -134,14 +154,19 @@ class SecFinder:
             self,
             txt: str,
             layout: str = None,
-            require_colon=False):
+            require_colon=False,
+            tokenizer: PLSSTokenizer = None):
         self.txt = txt
         self.matches = []
         self.layout = layout
         self.flags = []
         self.flag_lines = []
+        if tokenizer is None:
+            tokenizer = PLSSTokenizer(txt)
+        self.tokenizer = tokenizer
         self.findall_matching_sec(txt, layout, require_colon)
 
+    @timed('sec_finder')
     def findall_matching_sec(
             self,
             text: str,
@@ -152,7 +177,8 @@ class SecFinder:
 
         Pull from the text all sections and 'multi-sections' that are
         appropriate to the description layout.
-        :param text: The text to search for sections.
+        :param text: The text to search for sections. (Must be the text
+        that was tokenized in ``.tokenizer``.)
         :param layout: The layout of the description. (Will be deduced
         if not specified.)
         :param require_colon: Whether to require a colon after section
@@ -162,22 +188,22 @@ class SecFinder:
         (as turned on with config parameter ``'sec_colon_cautious'``).
         """
 
-        def new_match(mo):
+        def new_match(mo, unpacker):
             """
             Extract the list of section numbers, and the start/end
             positions of the match. Append to the list of matches as a
             4-tuple, whose first element is 'SEC'.
             :param mo:
+            :param unpacker: The ``SecUnpacker`` for the matched text.
             :return:
             """
-            unpacker = SecUnpacker(mo.group(0))
             self.flags.extend(unpacker.flags)
             self.flag_lines.extend(unpacker.flag_lines)
             new = ('SEC', unpacker.sec_list, mo.start(0), mo.end(0))
             self.matches.append(new)
 
         if layout is None:
-            layout = deduce_layout(text=text)
+            layout = deduce_layout(text=text, tokenizer=self.tokenizer)
 
         # require_colon=True will pass over sections that are NOT
         # followed by colons in the TRS_DESC and S_DESC_TR layouts only.
@@ -200,19 +226,28 @@ class SecFinder:
             # need_colon has no effect on other description layouts.
             need_colon = False
 
-        for sec_mo in multisec_regex.finditer(text):
+        for kind, sec_mo, start, _ in self.tokenizer.sec_tokens:
             # Sections and multi-sections can get ruled out for a few reasons.
             legit_match = True
             sec_txt = sec_mo.group(0)
-            sec_nums = SecUnpacker(sec_txt).sec_list
+            unpacker = SecUnpacker(sec_txt)
+            sec_nums = unpacker.sec_list
 
             # For TRS_DESC and S_DESC_TR layouts specifically, we do NOT
             # want to match sections following "of", "said", or "in"
             # (e.g. 'the NE/4 of Section 4'), because it very likely
             # means it's a continuation of the same description.
             illegal = (' of', ' said', ' in', ' within')
-            illegal_word_prior = text[:sec_mo.start()].rstrip().endswith(illegal)
-            if layout in [TRS_DESC, S_DESC_TR] and illegal_word_prior:
+            illegal_word_prior = False
+            if layout in [TRS_DESC, S_DESC_TR]:
+                # (Only look back as far as needed, rather than slicing
+                # everything before every section.)
+                prior_end = start
+                while prior_end > 0 and text[prior_end - 1].isspace():
+                    prior_end -= 1
+                prior = text[max(0, prior_end - 7):prior_end]
+                illegal_word_prior = prior.endswith(illegal)
+            if illegal_word_prior:
                 legit_match = False
 
             # Also for TRS_DESC and S_DESC_TR layouts, we ONLY want to
@@ -232,13 +267,13 @@ class SecFinder:
                 self.flag_lines.append((flag, sec_txt))
                 continue
 
-            if is_multi_sec(sec_mo):
+            if kind == MULTISEC:
                 # Generate the appropriate flag.
                 flag = f"multisec_found<{','.join(sec_nums)}>"
                 self.flags.append(flag)
                 self.flag_lines.append((flag, sec_txt))
 
-            new_match(sec_mo)
+            new_match(sec_mo, unpacker)
 
         if self.matches and require_colon != self.SECOND_PASS:
             return None
@@ -288,8 +323,8 @@ class PLSSParser:
             self,
             text,
             layout: str = None,
-            default_ns: str = MasterConfig.default_ns,
-            default_ew: str = MasterConfig.default_ew,
+            default_ns: str = None,
+            default_ew: str = None,
             ocr_scrub=False,
             clean_up: bool = None,
             parse_qq=False,
@@ -302,7 +337,8 @@ class PLSSParser:
             break_halves=False,
             sec_within=False,
             no_pm=False,
-            handed_down_config: str = None,
+            lite_tracts=False,
+            handed_down_config=None,
             source=None,
     ):
         """
@@ -315,8 +351,10 @@ class PLSSParser:
 
         :param text: Preprocessed text to be parsed.
         :param layout:
-        :param default_ns:
-        :param default_ew:
+        :param default_ns: (Defaults to ``MasterConfig.default_ns`` as
+        of init.)
+        :param default_ew: (Defaults to ``MasterConfig.default_ew`` as
+        of init.)
         :param ocr_scrub:
         :param clean_up:
         :param parse_qq: Whether to instruct subordinate Tract objects
@@ -335,27 +373,37 @@ class PLSSParser:
         :param break_halves:
         :param sec_within:
         :param no_pm:
-        :param handed_down_config: Config data to hand down to
-        subordinate Tract objects. (Will be at least partially
-        overridden by ``parse_qq=True``, if that is passed.)
+        :param lite_tracts: Whether to create ``LiteTract`` objects
+        (unless ``parse_qq`` is used).
+        :param handed_down_config: Config data (a ``Config`` object or
+        config text) to hand down to subordinate Tract objects. (Will be
+        at least partially overridden by ``parse_qq=True``, if that is
+        passed.)
         :param source:
         """
         # These inform subordinate Tract objects.
         self.parse_qq = parse_qq
         self.source = source
         self.orig_text = text
-        if handed_down_config is None:
-            handed_down_config = ''
-        if parse_qq:
-            handed_down_config = f"{handed_down_config},parse_qq"
+        # Compiled once here, and shared by every Tract.
+        handed_down_config = Config.intern(handed_down_config)
+        if parse_qq and not handed_down_config.parse_qq:
+            handed_down_config = _with_parse_qq(handed_down_config)
         self.handed_down_config = handed_down_config
 
         # These impact the parse of this PLSS description.
+        if default_ns is None:
+            default_ns = MasterConfig.default_ns
+        if default_ew is None:
+            default_ew = MasterConfig.default_ew
         self.mandate_layout = not segment and layout is not None
         preprocessor = PLSSPreprocessor(text, default_ns, default_ew, ocr_scrub, no_pm)
         self.text = preprocessor.text
+        # The Twp/Rge's and sections found in the preprocessed text,
+        # which are reused for every stage of the parse.
+        self.tokenizer = preprocessor.tokenizer
         if layout is None:
-            layout = deduce_layout(self.text)
+            layout = deduce_layout(self.text, tokenizer=self.tokenizer)
         self.layout = layout
         if clean_up is None:
             clean_up = True
@@ -370,6 +418,9 @@ class PLSSParser:
         self.no_pm = no_pm
         # Keep track of which tracts were repaired with 'sec_within'.
         self.sec_within_indexes = []
+        # LiteTracts are only created if the Tracts would not be parsed
+        # at init.
+        self.lite_tracts = lite_tracts and not parse_qq
 
         # These exclusively affect the parsing of subordinate Tracts.
         self.clean_qq = clean_qq
@@ -435,7 +486,8 @@ class PLSSParser:
                     flag_unused(unused_bit)
 
         if segment:
-            chunker = PLSSChunker(self.text, layout=self.layout)
+            chunker = PLSSChunker(
+                self.text, layout=self.layout, tokenizer=self.tokenizer)
             self.blocks = chunker.blocks
             self.unused_components.extend(chunker.unused_blocks)
 
@@ -477,11 +529,32 @@ class PLSSParser:
         Give each subordinate Tract object the warning and error flags
         of this PLSSParser.
         """
+        # Intern the flags once, so that every Tract references the same
+        # strings (and flag lines) rather than holding its own copies.
+        self.w_flags = _intern_flags(self.w_flags)
+        self.w_flag_lines = _intern_flag_lines(self.w_flag_lines)
+        self.e_flags = _intern_flags(self.e_flags)
+        self.e_flag_lines = _intern_flag_lines(self.e_flag_lines)
+        lite_flags = None
+        if self.lite_tracts:
+            # LiteTracts share these until their flags are accessed.
+            lite_flags = (
+                tuple(self.w_flags),
+                tuple(self.w_flag_lines),
+                tuple(self.e_flags),
+                tuple(self.e_flag_lines),
+            )
         for tract in self.tracts:
-            tract.w_flags.extend(self.w_flags)
-            tract.w_flag_lines.extend(self.w_flag_lines)
-            tract.e_flags.extend(self.e_flags)
-            tract.e_flag_lines.extend(self.e_flag_lines)
+            if (lite_flags is not None and isinstance(tract, LiteTract)
+                    and tract.is_lite):
+                tract._lite_flags = lite_flags
+                continue
+            # Concatenating (rather than extending) allocates lists of
+            # exactly the needed length.
+            tract.w_flags = tract.w_flags + self.w_flags
+            tract.w_flag_lines = tract.w_flag_lines + self.w_flag_lines
+            tract.e_flags = tract.e_flags + self.e_flags
+            tract.e_flag_lines = tract.e_flag_lines + self.e_flag_lines
         return None
 
     def check_error_tracts(self):
@@ -499,6 +572,7 @@ class PLSSParser:
             self.e_flag_lines.append((flag, flag))
         return None
 
+    @timed('construct_tracts')
     def construct_tracts(self):
         """
         Convert the parsed data components in ``.tract_components``
@@ -511,15 +585,25 @@ class PLSSParser:
                 desc = cleanup_desc(desc)
             for sec in tract_data['sec']:
                 trs = f"{tract_data['twprge']}{sec}"
-                new_tract = Tract(
-                    desc,
-                    trs,
-                    config=self.handed_down_config,
-                    parse_qq=self.parse_qq,
-                    source=self.source,
-                    orig_desc=self.orig_text,
-                    orig_index=self.next_tract_uid
-                )
+                if self.lite_tracts:
+                    new_tract = LiteTract(
+                        desc,
+                        trs,
+                        config=self.handed_down_config,
+                        source=self.source,
+                        orig_desc=self.orig_text,
+                        orig_index=self.next_tract_uid
+                    )
+                else:
+                    new_tract = Tract(
+                        desc,
+                        trs,
+                        config=self.handed_down_config,
+                        parse_qq=self.parse_qq,
+                        source=self.source,
+                        orig_desc=self.orig_text,
+                        orig_index=self.next_tract_uid
+                    )
                 self.tracts.append(new_tract)
                 new_tracts.append(new_tract)
                 if tract_data['sec_within']:
@@ -541,15 +625,21 @@ class PLSSChunker:
     the resulting tracts.
     """
 
-    def __init__(self, text, layout=None):
+    def __init__(self, text, layout=None, tokenizer: PLSSTokenizer = None):
         """
         INTERNAL USE:
         :param text: The text to be broken into chunks.
         :param layout: The layout to use. If not specified, will be
         deduced.
+        :param tokenizer: (Optional) A ``PLSSTokenizer`` that has
+        already been run on the text. (If not specified, the text will
+        be tokenized here.)
         """
         self.text = text
         self.layout = layout
+        if tokenizer is None:
+            tokenizer = PLSSTokenizer(text)
+        self.tokenizer = tokenizer
         self.blocks = []
         # A list of 2-tuples, being (<0 or 1>, <block of unused text>).
         # 0 indicates text that came before a valid chunk; 1 indicates
@@ -567,10 +657,10 @@ class PLSSChunker:
         """
         text = self.text
         if layout is None:
-            layout = deduce_layout(text)
+            layout = deduce_layout(text, tokenizer=self.tokenizer)
         # Don't collect TwpRgeFinder-generated flags at this point.
         # They'll be collected during the actual parse.
-        matches = TwpRgeFinder(text, layout).matches
+        matches = TwpRgeFinder(text, layout, self.tokenizer).matches
         if not matches or layout == COPY_ALL:
             self.blocks.append(text)
             return None
@@ -632,7 +722,9 @@ class PLSSChunker:
         return None
 
 
-def deduce_layout(text: str, candidates: list = None):
+@timed('deduce_layout')
+def deduce_layout(
+        text: str, candidates: list = None, tokenizer: PLSSTokenizer = None):
     """
     Deduce the layout of the description.
 
@@ -648,6 +740,10 @@ def deduce_layout(text: str, candidates: list = None):
     layout from ``pytrs.IMPLEMENTED_LAYOUTS`` is in the list. (Strings
     not in ``pytrs.IMPLEMENTED_LAYOUTS`` will have no effect.)
 
+    :param tokenizer: (Optional) A ``PLSSTokenizer`` that has already
+    been run on the text, whose tokens will be used instead of
+    searching the text again.
+
     :return: Returns the algorithm's best guess at the layout (a
     string).
     """
@@ -663,24 +759,43 @@ def deduce_layout(text: str, candidates: list = None):
     # Default to COPY_ALL if we can't affirmatively deduce a better option.
     layout_guess = COPY_ALL
 
-    text = text.strip()
-
     # No need to capture section number. Just want to check position in
     # relation to Twp/Rge.
-    sec_mo = no_num_sec_regex.search(text)
-    twprge_mo = twprge_regex.search(text)
-
-    if not sec_mo or not twprge_mo:
+    sec_start = twprge_start = twprge_end = None
+    if tokenizer is None:
+        text = text.strip()
+        sec_mo = no_num_sec_regex.search(text)
+        twprge_mo = twprge_regex.search(text)
+        if sec_mo:
+            sec_start = sec_mo.start()
+        if twprge_mo:
+            twprge_start, twprge_end = twprge_mo.span()
+    else:
+        sec_start = tokenizer.first_sec_word()
+        if tokenizer.twprge_tokens:
+            _, _, twprge_start, twprge_end = tokenizer.twprge_tokens[0]
+        # Count positions as though the text had been stripped.
+        text = tokenizer.text
+        leading = len(text) - len(text.lstrip())
+        if leading:
+            text = text[leading:]
+            if sec_start is not None:
+                sec_start -= leading
+            if twprge_start is not None:
+                twprge_start -= leading
+                twprge_end -= leading
+
+    if sec_start is None or twprge_start is None:
         # Default to COPY_ALL, as having no identifiable section or
         # Twp/Rge is an insurmountable flaw.
         return COPY_ALL
 
     # If the first identified section comes before the first identified
     # Twp/Rge, then it's probably DESC_STR or S_DESC_TR.
-    if sec_mo.start() < twprge_mo.start():
+    if sec_start < twprge_start:
         if try_desc_str:
             layout_guess = DESC_STR
-        if try_s_desc_tr and sec_mo.start() <= 1:
+        if try_s_desc_tr and sec_start <= 1:
             # This is such an unlikely layout, that we give it very
             # limited room for error. If the section comes first in the
             # description, we should expect it VERY early in the text.
@@ -690,7 +805,7 @@ def deduce_layout(text: str, candidates: list = None):
     if try_tr_desc_s:
         # Check how many characters appear between Twp/Rge and Sec, and
         # decide whether it's TR_DESC_S or TRS_DESC, based on that.
-        string_between = text[twprge_mo.end():sec_mo.start()].strip()
+        string_between = text[twprge_end:sec_start].strip()
         if len(string_between) >= 4:
             return TR_DESC_S
 
@@ -700,6 +815,20 @@ def deduce_layout(text: str, candidates: list = None):
     return layout_guess
 
 
+def _with_parse_qq(config: Config) -> Config:
+    """
+    INTERNAL USE:
+    Get the shared ``Config`` that has the same settings as ``config``,
+    but with ``parse_qq`` turned on.
+    """
+    new_config = _PARSE_QQ_CONFIGS.get(config)
+    if new_config is None:
+        new_config = Config.intern(config.replace(parse_qq=True))
+        if len(_PARSE_QQ_CONFIGS) < Config._REGISTRY_MAXSIZE:
+            _PARSE_QQ_CONFIGS[config] = new_config
+    return new_config
+
+
 def cleanup_desc(text):
     """
     INTERNAL USE:
@@ -736,6 +865,12 @@ class ChunkParser:
         self.text = text
         self.layout = layout
         self.parent = parent
+        # Reuse the parent's tokens if this chunk is the entire text
+        # (i.e. if the description was not segmented).
+        if text == parent.text:
+            self.tokenizer = parent.tokenizer
+        else:
+            self.tokenizer = PLSSTokenizer(text)
         self.twprge_matches = []
         self.working_twprge_list = []
         self.sec_matches = []
@@ -760,6 +895,7 @@ class ChunkParser:
         # Parsing also hands off the relevant data to the parent.
         self.parse_safe()
 
+    @timed('chunk_parser')
     def parse_safe(self):
         """
         Parse this chunk, but protect the flag attributes of the
@@ -795,7 +931,7 @@ class ChunkParser:
         chunk = self.text
         chunk_layout = self.layout
         if chunk_layout != COPY_ALL and not self.parent.mandate_layout:
-            chunk_layout = deduce_layout(chunk)
+            chunk_layout = deduce_layout(chunk, tokenizer=self.tokenizer)
         self.find_matches(chunk, chunk_layout)
         self.populate_markers(chunk)
 
@@ -853,12 +989,13 @@ class ChunkParser:
         :param layout: The layout to use for finding matches.
         """
         # Populate Twp/Rge matches/flags.
-        twprge_finder = TwpRgeFinder(text, layout)
+        twprge_finder = TwpRgeFinder(text, layout, self.tokenizer)
         self.twprge_matches = twprge_finder.matches
         self.w_flags.extend(twprge_finder.flags)
         self.w_flag_lines.extend(twprge_finder.flag_lines)
         # Populate section matches/flags.
-        sec_finder = SecFinder(text, layout, self.parent.require_colon)
+        sec_finder = SecFinder(
+            text, layout, self.parent.require_colon, self.tokenizer)
         self.sec_matches = sec_finder.matches
         self.w_flags.extend(sec_finder.flags)
         self.w_flag_lines.extend(sec_finder.flag_lines)
@@ -3,6 +3,7 @@
 Tools for preprocessing text before parsing as PLSSDesc.
 """
 
+import bisect
 import re
 
 from ..rgxlib import *
@@ -13,12 +14,18 @@ from ..unpack import (
 from ..config import (
     MasterConfig,
 )
+from ..profiling.profiling import (
+    timed,
+    start_timing,
+    stop_timing,
+)
+from .plss_tokenize import PLSSTokenizer
 
 SCRUBBER_REGEXES = (
     twprge_regex,
     pp_twprge_no_nswe,
-    pp_twprge_no_nsr,
-    pp_twprge_no_ewt,
+    # Combines pp_twprge_no_nsr and pp_twprge_no_ewt into one pass.
+    pp_twprge_no_nsr_or_ewt,
     pp_twprge_pm,
     pp_twprge_comma_remove,
 )
@@ -26,6 +33,17 @@ SCRUBBER_REGEXES = (
 # Turn this one on with `ocr_scrub=True`
 OCR_SCRUBBER = pp_twprge_ocr_scrub
 
+# The name under which each scrubber is instrumented (see
+# ``pytrs.instrument()``).
+_SCRUBBER_STAGES = {
+    twprge_regex: 'plss_preprocess.twprge_regex',
+    pp_twprge_no_nswe: 'plss_preprocess.pp_twprge_no_nswe',
+    pp_twprge_no_nsr_or_ewt: 'plss_preprocess.pp_twprge_no_nsr_or_ewt',
+    pp_twprge_pm: 'plss_preprocess.pp_twprge_pm',
+    pp_twprge_comma_remove: 'plss_preprocess.pp_twprge_comma_remove',
+    OCR_SCRUBBER: 'plss_preprocess.pp_twprge_ocr_scrub',
+}
+
 
 class PLSSPreprocessor:
     """
@@ -34,14 +52,16 @@ class PLSSPreprocessor:
     A class for preprocessing text for the PLSSParser. Get the
     preprocessed text from the ``.text`` attribute, or the original text
     from the ``.orig_text`` attribute.  Get a list of Twp/Rge's that
-    were fixed in the ``.fixed_twprges`` attribute.
+    were fixed in the ``.fixed_twprges`` attribute, and the tokenized
+    preprocessed text (a ``PLSSTokenizer``) from the ``.tokenizer``
+    attribute.
     """
 
     def __init__(
             self,
             orig_text: str,
-            default_ns=MasterConfig.default_ns,
-            default_ew=MasterConfig.default_ew,
+            default_ns=None,
+            default_ew=None,
             ocr_scrub=False,
             no_pm=False,
     ):
@@ -65,13 +85,17 @@ class PLSSPreprocessor:
 
             .. note::
 
-                When parsing long descriptions (more than 5 or 6
-                Twp/Rges in the original block of text), the principal
-                meridian scrubber can cause major performance issues,
-                especially beyond the 12th Twp/Rge. Disabling this
-                scrubber with ``no_pm=True`` will improve performance.
+                The principal meridian scrubber only does any real work
+                where the text contains something that looks like a
+                principal meridian, so ``no_pm=True`` is no longer
+                needed to parse long descriptions quickly.
         """
 
+        # Take the `MasterConfig` defaults once, at init.
+        if default_ns is None:
+            default_ns = MasterConfig.default_ns
+        if default_ew is None:
+            default_ew = MasterConfig.default_ew
         self.orig_text = orig_text
         self.ocr_scrub = ocr_scrub
         self.default_ns = default_ns
@@ -81,6 +105,7 @@ class PLSSPreprocessor:
         # These attributes are populated by `.preprocess()`:
         self.fixed_twprges = []
         self.text = ''
+        self.tokenizer = None
 
         self.preprocess(orig_text, default_ns, default_ew, ocr_scrub, commit=True)
 
@@ -110,14 +135,16 @@ class PLSSPreprocessor:
             ocr_scrub = self.ocr_scrub
         if no_pm is None:
             no_pm = self.no_pm
-        txt, fixed_twprges = plss_preprocess(
+        txt, fixed_twprges, tokenizer = plss_preprocess(
             txt, default_ns, default_ew, ocr_scrub, no_pm)
         if commit:
             self.text = txt
             self.fixed_twprges = fixed_twprges
+            self.tokenizer = tokenizer
         return txt, fixed_twprges
 
 
+@timed('plss_preprocess')
 def plss_preprocess(
         txt: str,
         default_ns: str = None,
@@ -131,13 +158,13 @@ def plss_preprocess(
     a list of fixed Twp/Rges to ``.fixed_twprges``.
 
     See documentation for ``PLSSDesc.preprocess()`` for fuller
-    write-up. (Note that this returns a 2-tuple of the preprocessed
-    string AND a list of Twp/Rges that were 'fixed' (i.e. to which NS
-    and/or EW was added.)
+    write-up. (Note that this returns a 3-tuple of the preprocessed
+    string, a list of Twp/Rges that were 'fixed' (i.e. to which NS
+    and/or EW was added), and the tokenized preprocessed string.)
 
-    :return: A 2-tuple of the preprocessed string AND a list of
-    Twp/Rge's that were fixed (i.e. that had been missing N/S, E/W, or
-    both).
+    :return: A 3-tuple of the preprocessed string, a list of Twp/Rge's
+    that were fixed (i.e. that had been missing N/S, E/W, or both), and
+    a ``PLSSTokenizer`` of the preprocessed string.
     """
 
     if default_ns is None:
@@ -150,7 +177,11 @@ def plss_preprocess(
     orig_twprge_list = find_twprge(txt)
 
     # Iteratively run each of the preprocess regexes over the text,
-    # swapping in the cleaned up Twp/Rge every time.
+    # swapping in the cleaned up Twp/Rge every time. (Apart from the
+    # 'no_nsr' and 'no_ewt' patterns, these passes are kept separate and
+    # in order: each cleaned-up Twp/Rge is padded with a space, which
+    # can expose a Twp/Rge to a later pass that was run together with
+    # its neighbor in the original.)
     pp_regexes = list(SCRUBBER_REGEXES)
     if no_pm:
         i = pp_regexes.index(pp_twprge_pm)
@@ -158,13 +189,17 @@ def plss_preprocess(
     if ocr_scrub:
         pp_regexes.insert(0, OCR_SCRUBBER)
     for pp_rgx in pp_regexes:
+        start = start_timing()
         txt = sub_scrubber(pp_rgx, txt, default_ns, default_ew)
+        stop_timing(_SCRUBBER_STAGES[pp_rgx], start)
 
     txt = reduce_whitespace(txt)
 
     # Look for Twp/Rge's in the newly preprocessed text, to see if we've
-    # found any new ones.
-    processed_twprge_list = find_twprge(txt)
+    # found any new ones. (The parser will reuse these tokens.)
+    tokenizer = PLSSTokenizer(txt)
+    processed_twprge_list = [
+        unpack_twprge(mo) for _, mo, _, _ in tokenizer.twprge_tokens]
 
     # Remove from the post-preprocess TR list each of the elements
     # in the list generated from the original text.
@@ -172,23 +207,99 @@ def plss_preprocess(
         if twprge in processed_twprge_list:
             processed_twprge_list.remove(twprge)
 
-    return txt, processed_twprge_list
+    return txt, processed_twprge_list, tokenizer
 
 
 def sub_scrubber(rgx, txt: str, default_ns: str, default_ew: str) -> str:
+    """
+    INTERNAL USE:
+    Swap in the cleaned-up version of every Twp/Rge matched by ``rgx``,
+    in a single pass over the text.
+
+    :param rgx: One of the ``SCRUBBER_REGEXES`` (or the
+     ``OCR_SCRUBBER``).
+    :param txt: The text to scrub.
+    :param default_ns: How to interpret townships for which direction
+     was not specified.
+    :param default_ew: How to interpret ranges for which direction was
+     not specified.
+    :return: The scrubbed text.
+    """
     # Only use ocr_scrub if the rgx being used is the ocr_scrub regex.
     ocr_scrub = rgx == pp_twprge_ocr_scrub
-    matches = rgx.finditer(txt)
-    for match in matches:
-        clean_twprge = unpack_twprge(
+
+    def clean_twprge(match):
+        matched = match.group(0)
+        if rgx is pp_twprge_no_nsr_or_ewt:
+            # Re-match with whichever alternative matched, to get at
+            # the named groups.
+            alt = pp_twprge_no_nsr if match['no_nsr'] else pp_twprge_no_ewt
+            match = alt.fullmatch(txt, *match.span())
+        # Some of the scrubber regexes can match whitespace (e.g., a
+        # linebreak) ahead of the Twp/Rge itself. Keep it, so that this
+        # Twp/Rge is not run together with whatever came before it.
+        leading = matched[:len(matched) - len(matched.lstrip())]
+        twprge = unpack_twprge(
             match,
             default_ns=default_ns,
             default_ew=default_ew,
             ocr_scrub=ocr_scrub)
         # Tack on a space at the end to maintain a gap between this
         # Twp/Rge and whatever comes after it.
-        txt = txt.replace(match.group(0), clean_twprge + ' ')
-    return txt
+        return f"{leading}{twprge} "
+
+    if rgx is pp_twprge_pm:
+        return sub_pm_scrubber(clean_twprge, txt)
+
+    # Each match is replaced where it was found, so the text is scanned
+    # (and rebuilt) only once, regardless of how many Twp/Rge it has.
+    return rgx.sub(clean_twprge, txt)
+
+
+def sub_pm_scrubber(repl, txt: str) -> str:
+    """
+    INTERNAL USE:
+    Equivalent to ``pp_twprge_pm.sub(repl, txt)``, but without running
+    the (expensive) ``pp_twprge_pm`` pattern over the entire text.
+
+    The text is first scanned for anything that looks like a principal
+    meridian, using the much cheaper ``pm_regex``. The full pattern is
+    then attempted only at those Twp/Rge that are followed by a P.M.
+    before the next Twp/Rge (since a match never crosses into another
+    Twp/Rge), so the cost stays linear in the length of the text.
+
+    :param repl: A function that takes a match object and returns the
+     replacement string.
+    :param txt: The text to scrub.
+    :return: The scrubbed text.
+    """
+    pm_starts = [mo.start() for mo in pm_regex.finditer(txt)]
+    if not pm_starts:
+        return txt
+
+    twprge_starts = [mo.start() for mo in twprge_regex.finditer(txt)]
+    chunks = []
+    pos = 0
+    for i, start in enumerate(twprge_starts):
+        if start < pos:
+            # Already swallowed by the previous match.
+            continue
+        try:
+            limit = twprge_starts[i + 1]
+        except IndexError:
+            limit = len(txt)
+        j = bisect.bisect_left(pm_starts, start)
+        if j == len(pm_starts) or pm_starts[j] >= limit:
+            # No P.M. between this Twp/Rge and the next one.
+            continue
+        mo = pp_twprge_pm.match(txt, start)
+        if mo is None:
+            continue
+        chunks.append(txt[pos:start])
+        chunks.append(repl(mo))
+        pos = mo.end()
+    chunks.append(txt[pos:])
+    return ''.join(chunks)
 
 
 def reduce_whitespace(txt):
@@ -232,7 +343,7 @@ def find_twprge(
     if ocr_scrub:
         preprocess = True
     if preprocess:
-        text, _ = plss_preprocess(text, default_ns, default_ew, ocr_scrub)
+        text, _, _ = plss_preprocess(text, default_ns, default_ew, ocr_scrub)
     tr_list = [
         unpack_twprge(mo, default_ns, default_ew)
         for mo in twprge_regex.finditer(text)
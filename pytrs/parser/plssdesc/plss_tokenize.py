@@ -0,0 +1,103 @@
+"""
+A tokenizer that scans a preprocessed PLSS description for Twp/Rge's and
+sections once, so that every stage of the parser can share the results.
+"""
+
+import bisect
+
+from ..rgxlib import (
+    twprge_regex,
+    multisec_regex,
+    no_num_sec_regex,
+)
+from ..unpack import is_multi_sec
+
+TWPRGE = 'TWPRGE'
+SEC = 'SEC'
+MULTISEC = 'MULTISEC'
+
+
+class PLSSTokenizer:
+    """
+    INTERNAL USE:
+
+    Scan a (preprocessed) PLSS description for Twp/Rge's, sections, and
+    multi-sections, and store them as a single stream of tokens, sorted
+    by position (in ``.tokens``). Each token is a 4-tuple of
+    ``(kind, match_object, start, end)``, where ``kind`` is one of
+    ``'TWPRGE'``, ``'SEC'``, or ``'MULTISEC'``.
+
+    Layout deduction, the ``TwpRgeFinder``, the ``SecFinder``, and the
+    ``ChunkParser`` all consume the same tokens, rather than each
+    running their own regex searches over the text.
+
+    .. note::
+        The Twp/Rge and section patterns are each run over the text once
+        and then merged, rather than combined into a single pattern,
+        because their matches can legitimately overlap (e.g., in
+        ``'Sec 1, 154N-R97W'``, both patterns claim the ``'154'``).
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.twprge_tokens = [
+            (TWPRGE, mo, mo.start(), mo.end())
+            for mo in twprge_regex.finditer(text)
+        ]
+        self.sec_tokens = [
+            (MULTISEC if is_multi_sec(mo) else SEC, mo, mo.start(), mo.end())
+            for mo in multisec_regex.finditer(text)
+        ]
+        self._sec_starts = [token[2] for token in self.sec_tokens]
+        self.tokens = sorted(
+            self.twprge_tokens + self.sec_tokens, key=lambda token: token[2])
+
+    def __iter__(self):
+        return iter(self.tokens)
+
+    def __len__(self):
+        return len(self.tokens)
+
+    def first_sec_word(self):
+        """
+        Get the start position of the first word "Section" (or
+        equivalent abbreviation or symbol) in the text, whether or not
+        it is followed by a section number. Returns ``None`` if there is
+        none.
+        """
+        endpos = len(self.text)
+        if self.sec_tokens:
+            # It can come no later than the first section.
+            endpos = self.sec_tokens[0][3]
+        mo = no_num_sec_regex.search(self.text, 0, endpos)
+        if mo is None:
+            return None
+        return mo.start()
+
+    def last_sec_start_before(self, pos: int):
+        """
+        Get the start position of the rightmost section or multi-section
+        that matches within ``text[:pos]``. Returns ``None`` if there is
+        none.
+        """
+        k = bisect.bisect_left(self._sec_starts, pos)
+        if k == 0:
+            return None
+        _, _, start, end = self.sec_tokens[k - 1]
+        if end <= pos:
+            return start
+        # This section runs past ``pos``, so it may match differently
+        # (or not at all) when cut off there.
+        last_start = None
+        for mo in multisec_regex.finditer(self.text, start, pos):
+            last_start = mo.start()
+        if last_start is not None:
+            return last_start
+        if k == 1:
+            return None
+        return self.sec_tokens[k - 2][2]
+
+
+__all__ = [
+    'PLSSTokenizer',
+]
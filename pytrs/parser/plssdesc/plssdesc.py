@@ -6,7 +6,7 @@ A class to represent a full PLSS land description, parse it into
 
 from ..config import (
     Config,
-    ConfigError,
+    MasterConfig,
     COPY_ALL,
 )
 from ..containers import TractList
@@ -18,6 +18,11 @@ from .plss_parse import (
     SecFinder,
     deduce_layout,
 )
+from .parse_cache import get_parse_cache
+from ..profiling.profiling import (
+    start_timing,
+    stop_timing,
+)
 
 
 class PLSSDesc:
@@ -317,6 +322,10 @@ class PLSSDesc:
         # capture descriptions with multiple layouts).
         self.segment = False
 
+        # Whether to create lightweight LiteTract objects (which are
+        # constructed into full Tracts only when needed).
+        self.lite_tracts = False
+
         # Attributes to control how deeply QQ's should be parsed.
         # If `.qq_depth` is set, it will override `.qq_depth_min` and
         # `.qq_depth_max`
@@ -444,14 +453,9 @@ class PLSSDesc:
          config parameters. (See ``Config`` documentation for optional
          parameters.)
         """
-        if isinstance(new_config, str) or new_config is None:
-            new_config = Config(new_config)
-        if not isinstance(new_config, Config):
-            raise ConfigError(new_config)
-        for attrib in Config._PLSSDESC_ATTRIBUTES:
-            value = getattr(new_config, attrib)
-            if value is not None:
-                setattr(self, attrib, value)
+        new_config = Config.intern(new_config)
+        for attrib, value in new_config._plssdesc_settings:
+            setattr(self, attrib, value)
         self.__config = new_config
 
     @property
@@ -485,6 +489,7 @@ class PLSSDesc:
             qq_depth=None,
             break_halves=None,
             no_pm=None,
+            lite_tracts=None,
     ):
         """
         Parse the description. If parameter ``commit=True`` (default),
@@ -637,11 +642,16 @@ class PLSSDesc:
 
             .. note::
 
-                When parsing long descriptions (more than 5 or 6
-                Twp/Rges in the original block of text), the principal
-                meridian scrubber can cause major performance issues,
-                especially beyond the 12th Twp/Rge. Disabling this
-                scrubber with ``no_pm=True`` will improve performance.
+                The principal meridian scrubber only does any real work
+                where the text contains something that looks like a
+                principal meridian, so ``no_pm=True`` is no longer
+                needed to parse long descriptions quickly.
+
+        :param lite_tracts: (Defaults False) Create lightweight
+         ``LiteTract`` objects, which hold only the Twp/Rge/Sec and
+         description (etc.), and are constructed into full ``Tract``
+         objects only when something else is needed. (Has no effect if
+         ``parse_qq=True``.)
 
         :return: Returns a ``TractList`` object containing the
          resulting ``Tract`` objects. (That same ``TractList`` will be
@@ -664,11 +674,14 @@ class PLSSDesc:
         elif sec_colon_cautious:
             require_colon = SecFinder.SEC_COLON_CAUTIOUS
 
+        # Take the `MasterConfig` defaults now, so that the whole parse
+        # uses the same ones (even if they are changed in another thread
+        # in the meantime).
         if not default_ns:
-            default_ns = self.default_ns
+            default_ns = self.default_ns or MasterConfig.default_ns
 
         if not default_ew:
-            default_ew = self.default_ew
+            default_ew = self.default_ew or MasterConfig.default_ew
 
         if ocr_scrub is None:
             ocr_scrub = self.ocr_scrub
@@ -680,6 +693,8 @@ class PLSSDesc:
         # `.parse(layout=<string>)`, PLSSParser.parse_chunk() will be
         # prevented from deducing it.  Leave as None to allow the parser
         # to deduce.
+        if layout is None:
+            layout = self.layout
 
         if parse_qq is None:
             parse_qq = self.parse_qq
@@ -688,7 +703,7 @@ class PLSSDesc:
             clean_qq = self.clean_qq
 
         # Config object for passing down to Tract objects.
-        handed_down_config = self.config.decompile_to_text()
+        handed_down_config = self.config
 
         if segment is None:
             segment = self.segment
@@ -709,6 +724,8 @@ class PLSSDesc:
             qq_depth_max = self.qq_depth_max
         if no_pm is None:
             no_pm = self.no_pm
+        if lite_tracts is None:
+            lite_tracts = self.lite_tracts
 
         # Parameters for `PLSSParser.parse()`.
         config_params = {
@@ -730,15 +747,28 @@ class PLSSDesc:
             "qq_depth": qq_depth,
             "break_halves": break_halves,
             "no_pm": no_pm,
+            "lite_tracts": lite_tracts,
             "handed_down_config": handed_down_config,
         }
 
-        parser = PLSSParser(
-            text=self.orig_desc,
-            layout=layout,
-            source=self.source,
-            **config_params
-        )
+        # Reuse the results of an identical parse, if parse results are
+        # being cached (see `pytrs.enable_parse_cache()`).
+        start = start_timing()
+        cache = get_parse_cache()
+        parser = None
+        if cache is not None:
+            cache_key = cache.make_key(self.orig_desc, layout, config_params)
+            parser = cache.get(cache_key, source=self.source)
+        if parser is None:
+            parser = PLSSParser(
+                text=self.orig_desc,
+                layout=layout,
+                source=self.source,
+                **config_params
+            )
+            if cache is not None:
+                cache.put(cache_key, parser)
+        stop_timing('plssdesc', start, text=self.orig_desc)
         tracts = parser.tracts  # a TractList object
         if commit:
             # Wipe the existing tracts, etc., if any.
@@ -835,7 +865,10 @@ class PLSSDesc:
          string).
         """
         preprocessor = PLSSPreprocessor(self.orig_desc, ocr_scrub=self.ocr_scrub)
-        return deduce_layout(preprocessor.text, candidates=candidates)
+        return deduce_layout(
+            preprocessor.text,
+            candidates=candidates,
+            tokenizer=preprocessor.tokenizer)
 
     def preprocess(
             self,
@@ -876,19 +909,18 @@ class PLSSDesc:
 
             .. note::
 
-                When parsing long descriptions (more than 5 or 6
-                Twp/Rges in the original block of text), the principal
-                meridian scrubber can cause major performance issues,
-                especially beyond the 12th Twp/Rge. Disabling this
-                scrubber with ``no_pm=True`` will improve performance.
+                The principal meridian scrubber only does any real work
+                where the text contains something that looks like a
+                principal meridian, so ``no_pm=True`` is no longer
+                needed to parse long descriptions quickly.
 
         :return: The preprocessed string.
         """
         text = self.orig_desc
         if default_ns is None:
-            default_ns = self.default_ns
+            default_ns = self.default_ns or MasterConfig.default_ns
         if default_ew is None:
-            default_ew = self.default_ew
+            default_ew = self.default_ew or MasterConfig.default_ew
         if ocr_scrub is None:
             ocr_scrub = self.ocr_scrub
         if no_pm is None:
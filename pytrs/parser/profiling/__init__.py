@@ -0,0 +1,6 @@
+
+"""
+Opt-in instrumentation of the parse pipeline.
+"""
+
+from .profiling import *
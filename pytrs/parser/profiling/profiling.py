@@ -0,0 +1,302 @@
+
+"""
+Opt-in instrumentation of the parse pipeline, recording the wall time
+and number of calls of each stage, and the slowest descriptions.
+
+Turn it on for a block of code with ``pytrs.instrument()``:
+
+.. code-block:: python
+
+    with pytrs.instrument() as stats:
+        parsed = pytrs.parse_many(descriptions)
+    print(stats.to_json(indent=2))
+
+Or set ``MasterConfig.profile_hook`` to a function, which will be
+called with ``(stage, seconds)`` every time a stage finishes in this
+process. (Unlike ``pytrs.instrument()``, the hook is not called for the
+work done in the worker processes of ``pytrs.parse_many()``.)
+
+When neither is in use, the instrumented stages do no timing at all.
+
+The stages (and their names in the results) are:
+
+- ``'plssdesc'`` -- the entire parse of a PLSS description.
+- ``'plss_preprocess'`` -- preprocessing a PLSS description, and within
+  that, ``'plss_preprocess.<regex>'`` for each scrubber regex.
+- ``'deduce_layout'``
+- ``'twprge_finder'`` and ``'sec_finder'`` -- finding the Twp/Rge's and
+  sections that match the layout.
+- ``'chunk_parser'`` -- parsing a chunk of the description into tract
+  components.
+- ``'construct_tracts'`` -- creating the ``Tract`` objects (including
+  parsing their lots and QQs, if configured to do so).
+- ``'tract_preprocess'`` -- preprocessing a tract description.
+- ``'tract_parse.lots'`` and ``'tract_parse.aliquots'`` -- extracting
+  the lots and the aliquots from a tract description.
+- ``'parse_aliquot'`` -- parsing a single aliquot into QQs.
+
+.. note::
+    A stage's time includes any stages nested within it (e.g.,
+    ``'construct_tracts'`` includes the ``'tract_parse.lots'`` of every
+    ``Tract`` that it creates), so the times of different stages should
+    not be added together.
+"""
+
+import functools
+import heapq
+import json
+import threading
+from contextlib import contextmanager
+from time import perf_counter
+
+from ..config import MasterConfig
+
+# The ParseStats that are currently collecting (replaced, never
+# modified in place, so that checking it requires no lock).
+_ACTIVE = ()
+_ACTIVE_LOCK = threading.Lock()
+
+# Description text is truncated to this many characters when it is
+# kept among the slowest descriptions.
+_MAX_TEXT_LEN = 200
+
+
+class ParseStats:
+    """
+    The aggregated wall time and number of calls of each stage of the
+    parse pipeline, plus the slowest descriptions, as collected by
+    ``pytrs.instrument()``.
+
+    Get the results with ``.to_dict()`` or ``.to_json()``.
+    """
+
+    def __init__(self, max_slowest: int = 10):
+        """
+        :param max_slowest: The number of slowest descriptions to keep.
+        """
+        self.max_slowest = max_slowest
+        # Keyed by stage, each a 2-list of [calls, total seconds].
+        self._stages = {}
+        # A min-heap of (seconds, count, text) for the slowest
+        # descriptions. (The count breaks ties between equal times.)
+        self._slowest = []
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"ParseStats<{len(self._stages)} stages>"
+
+    def record(self, stage: str, seconds: float, text: str = None) -> None:
+        """
+        Record one call of a stage.
+
+        :param stage: The name of the stage.
+        :param seconds: How long the call took.
+        :param text: (Optional) The description that was parsed, to be
+         considered for the slowest descriptions.
+        """
+        with self._lock:
+            totals = self._stages.get(stage)
+            if totals is None:
+                totals = self._stages[stage] = [0, 0.0]
+            totals[0] += 1
+            totals[1] += seconds
+            if text is not None and self.max_slowest > 0:
+                self._keep_if_slow(seconds, text[:_MAX_TEXT_LEN])
+        return None
+
+    def _keep_if_slow(self, seconds, text):
+        """
+        INTERNAL USE:
+        Keep the description, if it is among the slowest. (The lock must
+        be held.)
+        """
+        self._count += 1
+        entry = (seconds, self._count, text)
+        if len(self._slowest) < self.max_slowest:
+            heapq.heappush(self._slowest, entry)
+        elif seconds > self._slowest[0][0]:
+            heapq.heapreplace(self._slowest, entry)
+
+    def merge(self, other) -> None:
+        """
+        Add the results of another ``ParseStats`` (or of its
+        ``.to_dict()``) into this one.
+        """
+        if isinstance(other, ParseStats):
+            other = other.to_dict()
+        with self._lock:
+            for stage, data in other['stages'].items():
+                totals = self._stages.get(stage)
+                if totals is None:
+                    totals = self._stages[stage] = [0, 0.0]
+                totals[0] += data['calls']
+                totals[1] += data['seconds']
+            if self.max_slowest > 0:
+                for entry in other['slowest']:
+                    self._keep_if_slow(entry['seconds'], entry['text'])
+        return None
+
+    def reset(self) -> None:
+        """Discard all results collected so far."""
+        with self._lock:
+            self._stages = {}
+            self._slowest = []
+        return None
+
+    def to_dict(self) -> dict:
+        """
+        Get the results as a dict, in this format::
+
+            {
+                'stages': {
+                    'plssdesc': {
+                        'calls': 1000,
+                        'seconds': 1.2345,
+                        'mean_seconds': 0.0012345,
+                    },
+                    ...
+                },
+                'slowest': [
+                    {'seconds': 0.0521, 'text': 'T154N-R97W Sec 14: ...'},
+                    ...
+                ],
+            }
+
+        The slowest descriptions are ordered from slowest to fastest.
+        (Only the first 200 characters of each are kept.)
+        """
+        with self._lock:
+            stages = {
+                stage: {
+                    'calls': calls,
+                    'seconds': seconds,
+                    'mean_seconds': seconds / calls,
+                }
+                for stage, (calls, seconds) in self._stages.items()
+            }
+            slowest = [
+                {'seconds': seconds, 'text': text}
+                for seconds, _, text in sorted(self._slowest, reverse=True)
+            ]
+        return {'stages': stages, 'slowest': slowest}
+
+    def to_json(self, **kwargs) -> str:
+        """
+        Get the results (as in ``.to_dict()``) as a JSON string.
+
+        :param kwargs: Passed through to ``json.dumps()`` (e.g.,
+         ``indent=2``).
+        """
+        return json.dumps(self.to_dict(), **kwargs)
+
+
+@contextmanager
+def instrument(max_slowest: int = 10):
+    """
+    Collect the wall time and number of calls of each stage of the parse
+    pipeline (plus the slowest descriptions) for everything parsed
+    within the ``with`` block -- including in the worker processes of
+    ``pytrs.parse_many()``.
+
+    .. code-block:: python
+
+        with pytrs.instrument() as stats:
+            parsed = pytrs.parse_many(descriptions)
+        stats.to_dict()
+
+    See the ``pytrs.parser.profiling`` module for the names of the
+    stages.
+
+    :param max_slowest: The number of slowest descriptions to keep.
+     (Default 10.)
+    :return: A ``ParseStats`` object, which collects the results.
+    """
+    global _ACTIVE
+    stats = ParseStats(max_slowest)
+    with _ACTIVE_LOCK:
+        _ACTIVE = _ACTIVE + (stats,)
+    try:
+        yield stats
+    finally:
+        with _ACTIVE_LOCK:
+            _ACTIVE = tuple(s for s in _ACTIVE if s is not stats)
+
+
+def is_collecting() -> bool:
+    """
+    INTERNAL USE:
+    Check whether any ``ParseStats`` are collecting (regardless of
+    whether a ``MasterConfig.profile_hook`` is set).
+    """
+    return bool(_ACTIVE)
+
+
+def start_timing():
+    """
+    INTERNAL USE:
+    Start timing a stage. Returns the start time to pass to
+    ``stop_timing()`` (or ``None`` if nothing is being instrumented).
+    """
+    if not _ACTIVE and MasterConfig.profile_hook is None:
+        return None
+    return perf_counter()
+
+
+def stop_timing(stage: str, start, text: str = None) -> None:
+    """
+    INTERNAL USE:
+    Record the time since ``start`` (from ``start_timing()``) for the
+    ``stage``.
+
+    :param stage: The name of the stage.
+    :param start: The start time, or ``None`` to do nothing.
+    :param text: (Optional) The description that was parsed, to be
+     considered for the slowest descriptions.
+    """
+    if start is None:
+        return None
+    seconds = perf_counter() - start
+    for stats in _ACTIVE:
+        stats.record(stage, seconds, text)
+    hook = MasterConfig.profile_hook
+    if hook is not None:
+        hook(stage, seconds)
+    return None
+
+
+def timed(stage: str):
+    """
+    INTERNAL USE:
+    Decorate a function (or method) so that every call is timed as the
+    ``stage``.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = start_timing()
+            if start is None:
+                return func(*args, **kwargs)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                stop_timing(stage, start)
+        return wrapper
+    return decorator
+
+
+def _merge_into_active(results: dict) -> None:
+    """
+    INTERNAL USE:
+    Merge results (from ``ParseStats.to_dict()``) that were collected in
+    a worker process into every ``ParseStats`` that is collecting here.
+    """
+    for stats in _ACTIVE:
+        stats.merge(results)
+    return None
+
+
+__all__ = [
+    'ParseStats',
+    'instrument',
+]
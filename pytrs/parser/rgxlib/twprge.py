@@ -161,6 +161,17 @@ pp_twprge_no_ewt = re.compile(
     """, re.IGNORECASE | re.VERBOSE)
 
 
+# Either of the above two, so that both can be scrubbed in a single pass
+# over the text. (The named groups are stripped out of each, since a
+# name cannot be reused; re-match the span with whichever alternative
+# matched to get at them.)
+pp_twprge_no_nsr_or_ewt = re.compile(
+    r"(?P<no_nsr>{})|(?P<no_ewt>{})".format(
+        re.sub(r"\(\?P<\w+>", "(", pp_twprge_no_nsr.pattern),
+        re.sub(r"\(\?P<\w+>", "(", pp_twprge_no_ewt.pattern)),
+    re.IGNORECASE | re.VERBOSE)
+
+
 # With enough context, will capture T&R's with OCR artifacts (e.g.
 # "TIS4N-R97W" instead of intended "T154N-R97W").
 pp_twprge_ocr_scrub = re.compile(
@@ -223,6 +234,14 @@ pm_regex = re.compile(
     """, re.IGNORECASE | re.VERBOSE)
 
 
+# The Twp/Rge pattern, without its named groups (so that it can be
+# reused within a pattern that already has them) and without its
+# lookbehind (so that it is also caught where the 'the' in 'of the' has
+# absorbed a leading 'T').
+_twprge_lookahead = re.sub(
+    r"\(\?P<\w+>", "(",
+    twprge_regex.pattern.replace(r"((?<=[,;:])|(?<=\b))", "", 1))
+
 # Compile a twprge regex that should also capture P.M.
 pp_twprge_pm = re.compile(
     fr"""
@@ -235,9 +254,11 @@ pp_twprge_pm = re.compile(
     # of the ...
     (o*f*)?\s*(t*h*e*|t*e*h*|h*t*e|h*e*t*)?\s*
     
-    # Anything, arbitrarily capped at 25 characters.
+    # Anything, arbitrarily capped at 25 characters -- but never the
+    # start of another Twp/Rge, so that a P.M. following a later
+    # Twp/Rge does not swallow the one in between.
     # (Double-curly brackets to escape the f-string syntax.)
-    (.{{0,25}})
+    ((?:(?!{_twprge_lookahead}).){{0,25}})
     
     # Deadspace ...
     (\s*[:,;\.\-–—]*)
@@ -9,3 +9,5 @@ into lots and aliquot Quarter-Quarters ("QQs").
 # not imported here.
 
 from .tract import Tract
+from .compact_tract import CompactTract
+from .lite_tract import LiteTract
@@ -0,0 +1,167 @@
+
+"""
+Functions to compute the nominal gross acreage of parsed tracts.
+
+The nominal acreage of an aliquot assumes a standard 640-acre section,
+in which each quarter is 1/4 (and each half 1/2) of the aliquot it
+subdivides (e.g., the ``'NENE'`` is 40 acres, and the ``'N2SENW'`` is
+20 acres). Lots contribute the acreage stated for them in the
+description (if any).
+
+If NumPy is installed, ``tracts_acreage()`` computes the acreage of an
+entire list of tracts in a single vectorized pass. Otherwise, it falls
+back to computing each tract individually.
+"""
+
+from itertools import chain
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .aliquot_parse import _ALL
+from .symbolic_qqs import SymbolicQQList
+
+# The nominal acreage of a standard section.
+SECTION_ACRES = 640.0
+
+
+def aliquot_acres(aliquot: str) -> float:
+    """
+    Get the nominal acreage of a parsed aliquot, assuming a standard
+    640-acre section.
+
+        ``aliquot_acres('NENE')`` -> ``40.0``
+        ``aliquot_acres('N2SENW')`` -> ``20.0``
+        ``aliquot_acres('ALL')`` -> ``640.0``
+
+    :param aliquot: A parsed aliquot, such as ``'NENE'``, ``'N2SENW'``,
+     or ``'ALL'``.
+    :return: The acreage, as a float.
+    """
+    if aliquot == _ALL:
+        return SECTION_ACRES
+    # Each quarter divides the acreage by 4 (i.e., 2 ** 2), and each
+    # half by 2 (i.e., 2 ** 1).
+    halvings = len(aliquot) - aliquot.count('2')
+    return SECTION_ACRES / (1 << halvings)
+
+
+def lot_acres_total(lot_acres: dict) -> float:
+    """
+    Get the total of the acreages stated for lots (i.e., the values in
+    ``Tract.lot_acres``). Any acreage that cannot be interpreted as a
+    number is counted as 0.
+
+    :param lot_acres: A dict of lot names and their stated acreages (as
+     strings).
+    :return: The total acreage, as a float.
+    """
+    total = 0.0
+    for acres in lot_acres.values():
+        try:
+            total += float(acres)
+        except ValueError:
+            pass
+    return total
+
+
+def _acreage_aliquots(tract) -> list:
+    """
+    INTERNAL USE:
+    Get the aliquots whose nominal acreage makes up the tract's QQs.
+    (For symbolic QQs, these are the block prefixes, so that the QQs
+    need not be generated.)
+    """
+    if isinstance(tract.qqs, SymbolicQQList):
+        return tract.qqs.prefixes
+    return tract.qqs
+
+
+def tract_acres(tract) -> float:
+    """
+    Get the nominal gross acreage of a parsed tract: the acreage of its
+    QQs (assuming a standard 640-acre section), plus the acreage stated
+    for any of its lots. Lots without a stated acreage are not counted,
+    and overlapping QQs are counted each time they occur.
+
+    :param tract: A ``Tract`` (or ``CompactTract``).
+    :return: The acreage, as a float.
+    """
+    qq_acres = sum(map(aliquot_acres, _acreage_aliquots(tract)))
+    return qq_acres + lot_acres_total(tract.lot_acres)
+
+
+def tracts_acreage(tracts):
+    """
+    Get the nominal gross acreage of each of the tracts (as computed by
+    ``tract_acres()``).
+
+    If NumPy is installed, the acreages are computed in a single
+    vectorized pass and returned as a NumPy array of floats; otherwise,
+    they are returned as a list of floats. Either way, the results are
+    in the same order as the tracts.
+
+    :param tracts: A list of ``Tract`` (or ``CompactTract``) objects.
+    """
+    tracts = list(tracts)
+    if np is None:
+        return [tract_acres(tract) for tract in tracts]
+    n = len(tracts)
+    owners = np.arange(n)
+    acreages = np.zeros(n)
+
+    aliquot_lists = [_acreage_aliquots(tract) for tract in tracts]
+    counts = np.fromiter(map(len, aliquot_lists), dtype=np.intp, count=n)
+    if counts.any():
+        acreages += np.bincount(
+            np.repeat(owners, counts),
+            weights=_aliquot_acreages(chain.from_iterable(aliquot_lists)),
+            minlength=n)
+
+    lot_acres = [tract.lot_acres for tract in tracts]
+    counts = np.fromiter(map(len, lot_acres), dtype=np.intp, count=n)
+    if counts.any():
+        stated = [acres for la in lot_acres for acres in la.values()]
+        try:
+            lot_acreages = np.array(stated).astype(float)
+        except ValueError:
+            # At least one is not a number; let the tracts sort it out.
+            lot_acreages = np.array(list(map(lot_acres_total, lot_acres)))
+            counts = np.ones(n, dtype=np.intp)
+        acreages += np.bincount(
+            np.repeat(owners, counts), weights=lot_acreages, minlength=n)
+    return acreages
+
+
+def _aliquot_acreages(aliquots):
+    """
+    INTERNAL USE:
+    Get a NumPy array of the nominal acreage of each aliquot (as
+    computed by ``aliquot_acres()``).
+    """
+    # Join the aliquots into a single buffer of characters, so that
+    # their lengths and the number of halves in each can be found
+    # without looping over them. (Aliquots are pure ASCII.)
+    buffer = np.frombuffer(
+        ','.join(aliquots).encode('ascii', errors='replace'), dtype=np.uint8)
+    ends = np.append(np.flatnonzero(buffer == ord(',')), len(buffer))
+    starts = np.insert(ends[:-1] + 1, 0, 0)
+    lengths = ends - starts
+    twos = np.insert(np.cumsum(buffer == ord('2')), 0, 0)
+    halves = twos[ends] - twos[starts]
+    # Each quarter (2 chars) halves the acreage twice, and each half
+    # (also 2 chars) halves it once. 'ALL' is the only odd-length
+    # aliquot, and it is not halved at all.
+    halvings = np.where(lengths % 2 == 1, 0, lengths - halves)
+    return np.ldexp(SECTION_ACRES, -halvings.astype(np.int32))
+
+
+__all__ = [
+    'SECTION_ACRES',
+    'aliquot_acres',
+    'lot_acres_total',
+    'tract_acres',
+    'tracts_acreage',
+]
@@ -0,0 +1,189 @@
+
+"""
+Functions to represent parsed aliquots as integer bitmasks.
+
+At a given depth ``d``, a section is divided into ``4^d`` equal cells
+(e.g., 16 QQs at a depth of 2, or 64 ten-acre tracts at a depth of 3),
+and any combination of those cells is represented by a single ``int``,
+with one bit per cell. Unions, intersections, overlaps, etc. are then
+simple bitwise operations.
+
+Cells are numbered in the same order in which ``parse_aliquot()`` lists
+them -- i.e. at a depth of 2, bit 0 is the ``'NENE'``, bit 1 is the
+``'NWNE'``, ..., and bit 15 is the ``'SWSW'``.
+"""
+
+from .aliquot_parse import (
+    standardize_aliquot_components,
+    _NE,
+    _NW,
+    _SE,
+    _SW,
+    _ALL,
+)
+
+# The quarter for each digit in a cell's index.
+_DIGIT_QUARTERS = (_NE, _NW, _SE, _SW)
+
+# The quarters covered by each half (and each quarter) as digits.
+_COMPONENT_DIGITS = {
+    'N2': (0, 1),
+    'S2': (2, 3),
+    'E2': (0, 2),
+    'W2': (1, 3),
+    _NE: (0,),
+    _NW: (1,),
+    _SE: (2,),
+    _SW: (3,),
+}
+
+
+def _decon_aliquot(aliquot: str) -> list:
+    """
+    INTERNAL USE:
+    Break apart a parsed aliquot into its 2-character components, in
+    largest-to-smallest order (i.e. ``'N2SENW'`` ->
+    ``['NW', 'SE', 'N2']``), after standardizing any halves.
+    ``'ALL'`` has no components.
+    """
+    if aliquot == _ALL:
+        return []
+    if len(aliquot) % 2:
+        raise ValueError(f"Cannot convert aliquot {aliquot!r} to a bitmask.")
+    components = [aliquot[i:i + 2] for i in range(0, len(aliquot), 2)]
+    components.reverse()
+    for comp in components:
+        if comp not in _COMPONENT_DIGITS:
+            raise ValueError(
+                f"Cannot convert aliquot {aliquot!r} to a bitmask.")
+    if '2' not in aliquot:
+        return components
+    # Consecutive halves on opposite axes (e.g., the 'N2E2') do not nest
+    # like quarters, so standardize them first (to the 'NE').
+    components = standardize_aliquot_components(
+        [comp.rstrip('2') for comp in components])
+    return [f"{comp}2" if len(comp) == 1 else comp for comp in components]
+
+
+def aliquot_depth(aliquot: str) -> int:
+    """
+    INTERNAL USE:
+    Get the minimum depth at which the aliquot can be represented as a
+    bitmask (i.e. the number of its components, counting a half as a
+    component). ``'NENE'`` and ``'N2NE'`` are both at a depth of 2, and
+    ``'ALL'`` is at a depth of 0.
+
+    :param aliquot: A parsed aliquot, such as ``'NENE'``, ``'N2SENW'``,
+     or ``'ALL'``.
+    """
+    return len(_decon_aliquot(aliquot))
+
+
+def aliquot_to_mask(aliquot: str, depth: int = None) -> int:
+    """
+    INTERNAL USE:
+    Convert a parsed aliquot into a bitmask of the cells it covers at
+    the specified ``depth``.
+
+        ``aliquot_to_mask('NENE', 2)`` -> ``0b1``
+        ``aliquot_to_mask('N2NE', 2)`` -> ``0b11``
+        ``aliquot_to_mask('NE', 2)`` -> ``0b1111``
+
+    :param aliquot: A parsed aliquot, such as ``'NENE'``, ``'N2SENW'``,
+     or ``'ALL'``.
+    :param depth: The depth of the cells. Must be at least
+     ``aliquot_depth(aliquot)``. (Defaults to that minimum depth.)
+    :return: The bitmask, as an int.
+    """
+    components = _decon_aliquot(aliquot)
+    own_depth = len(components)
+    if depth is None:
+        depth = own_depth
+    if depth < own_depth:
+        raise ValueError(
+            f"Aliquot {aliquot!r} cannot be represented at a depth of "
+            f"{depth} (requires at least {own_depth}).")
+    # The indexes of the covered cells at the aliquot's own depth.
+    indexes = [0]
+    for comp in components:
+        digits = _COMPONENT_DIGITS[comp]
+        indexes = [i * 4 + d for i in indexes for d in digits]
+    # Each of those cells covers a contiguous run of the finer cells.
+    cells_per_index = 4 ** (depth - own_depth)
+    run = (1 << cells_per_index) - 1
+    mask = 0
+    for i in indexes:
+        mask |= run << (i * cells_per_index)
+    return mask
+
+
+def aliquots_to_mask(aliquots, depth: int) -> int:
+    """
+    INTERNAL USE:
+    Convert a list of parsed aliquots into a single bitmask of all the
+    cells they cover at the specified ``depth``.
+
+    :param aliquots: A list of parsed aliquots (e.g., ``Tract.qqs``).
+    :param depth: The depth of the cells. Must be at least the
+     ``aliquot_depth()`` of every aliquot in the list.
+    :return: The bitmask, as an int.
+    """
+    mask = 0
+    for aliquot in aliquots:
+        mask |= aliquot_to_mask(aliquot, depth)
+    return mask
+
+
+def mask_to_aliquots(mask: int, depth: int) -> list:
+    """
+    INTERNAL USE:
+    Convert a bitmask back into a list of aliquot strings, one for each
+    cell at the specified ``depth`` (in the same order as
+    ``parse_aliquot()`` would list them).
+
+        ``mask_to_aliquots(0b11, 2)`` -> ``['NENE', 'NWNE']``
+
+    :param mask: The bitmask, as an int.
+    :param depth: The depth of the cells.
+    :return: A list of aliquot strings.
+    """
+    if depth == 0:
+        return [_ALL] if mask & 1 else []
+    aliquots = []
+    while mask:
+        lowest = mask & -mask
+        index = lowest.bit_length() - 1
+        mask ^= lowest
+        # The smallest quarter is the lowest digit, and it comes first
+        # in the aliquot string.
+        components = []
+        for _ in range(depth):
+            index, digit = divmod(index, 4)
+            components.append(_DIGIT_QUARTERS[digit])
+        aliquots.append(''.join(components))
+    return aliquots
+
+
+def split_halves(aliquot: str) -> list:
+    """
+    INTERNAL USE:
+    Split any halves in a parsed aliquot into their quarters
+    (e.g., ``'N2SENW'`` -> ``['NESENW', 'NWSENW']``). An aliquot without
+    any halves is returned alone in a list.
+
+    :param aliquot: A parsed aliquot.
+    :return: A list of aliquot strings without halves.
+    """
+    if '2' not in aliquot:
+        return [aliquot]
+    depth = aliquot_depth(aliquot)
+    return mask_to_aliquots(aliquot_to_mask(aliquot, depth), depth)
+
+
+__all__ = [
+    'aliquot_depth',
+    'aliquot_to_mask',
+    'aliquots_to_mask',
+    'mask_to_aliquots',
+    'split_halves',
+]
@@ -4,6 +4,8 @@ Functions to parse an aliquot text block into a list of quarter-quarter
 (or smaller or larger, as configured by the requested depth).
 """
 
+import functools
+
 from ..rgxlib import *
 
 # Cardinal directions / aliquot names (without fractions).
@@ -36,6 +38,12 @@ QQ_SAME_AXIS = {
     _W: QQ_EW
 }
 
+# The maximum number of distinct aliquots (with their parse settings) to
+# hold in the caches of ``parse_aliquot()`` and
+# ``parse_aliquot_blocks()``. Real descriptions draw from a small
+# vocabulary of aliquots, so this is rarely reached.
+ALIQUOT_CACHE_MAXSIZE = 8192
+
 
 def parse_aliquot(
         text,
@@ -75,7 +83,85 @@ def parse_aliquot(
     :param break_halves: Whether to break halves into quarters, even
     if we're beyond the ``qq_depth_min``. (``False`` by default.)
     """
+    qq_depth_min, qq_depth_max = _resolve_depths(
+        qq_depth_min, qq_depth_max, qq_depth)
+    return list(_parse_aliquot_cached(
+        text, qq_depth_min, qq_depth_max, break_halves))
+
+
+@functools.lru_cache(maxsize=ALIQUOT_CACHE_MAXSIZE)
+def _parse_aliquot_cached(text, qq_depth_min, qq_depth_max, break_halves):
+    """
+    INTERNAL USE:
+    The cached body of ``parse_aliquot()``. Returns a tuple (so that the
+    cached result cannot be modified).
+    """
+    subdivided_component_list = _subdivide_components(
+        text, qq_depth_min, qq_depth_max, break_halves)
+
+    # subdivided_component_list is now in the format:
+    #   `[['SE'], ['NW', 'SW'], ['E2']]`
+    # ...for E/2W/2SE/4, parsed to a qq_depth_min of 2.
+
+    # Convert the 1-depth nested list into the final QQ list.
+    qqs = rebuild_aliquots(subdivided_component_list)
+    return tuple(qqs)
 
+
+def parse_aliquot_blocks(
+        text,
+        qq_depth_min=2,
+        qq_depth_max=None,
+        qq_depth=None,
+        break_halves=False) -> list:
+    """
+    INTERNAL USE:
+    Same as ``parse_aliquot()``, but without materializing the deepest
+    subdivisions. Returns a list of 2-tuples of ``(prefix, depth)``,
+    each representing every aliquot found by subdividing the ``prefix``
+    into quarters ``depth`` more times (so a ``depth`` of 0 represents
+    only the ``prefix`` itself):
+        'NE¼' (at a ``qq_depth_min`` of 4) -> [('NE', 3)]
+        'N½SW¼' -> [('NESW', 0), ('NWSW', 0)]
+
+    Expanding each block (in order) produces the same list as
+    ``parse_aliquot()`` would.
+
+    (Parameters are the same as for ``parse_aliquot()``.)
+    """
+    qq_depth_min, qq_depth_max = _resolve_depths(
+        qq_depth_min, qq_depth_max, qq_depth)
+    return list(_parse_aliquot_blocks_cached(
+        text, qq_depth_min, qq_depth_max, break_halves))
+
+
+@functools.lru_cache(maxsize=ALIQUOT_CACHE_MAXSIZE)
+def _parse_aliquot_blocks_cached(
+        text, qq_depth_min, qq_depth_max, break_halves):
+    """
+    INTERNAL USE:
+    The cached body of ``parse_aliquot_blocks()``. Returns a tuple (so
+    that the cached result cannot be modified).
+    """
+    subdivided_component_list = _subdivide_components(
+        text, qq_depth_min, qq_depth_max, break_halves, symbolic=True)
+    if not subdivided_component_list:
+        return ()
+    # Only the final (i.e. smallest) component is ever subdivided more
+    # than once, so it is the only one left unexpanded.
+    last_comps, depth = subdivided_component_list.pop(-1)
+    subdivided_component_list.append(last_comps)
+    return tuple(
+        (qq, depth) for qq in rebuild_aliquots(subdivided_component_list))
+
+
+def _resolve_depths(qq_depth_min, qq_depth_max, qq_depth) -> tuple:
+    """
+    INTERNAL USE:
+    Resolve the ``qq_depth`` (if any) into the ``qq_depth_min`` and
+    ``qq_depth_max``, and warn if they are inconsistent. Returns a
+    2-tuple of ``(qq_depth_min, qq_depth_max)``.
+    """
     if qq_depth is not None:
         qq_depth_min = qq_depth_max = qq_depth
 
@@ -89,6 +175,27 @@ def parse_aliquot(
             "Tract."
         )
         warnings.warn(msg)
+    return qq_depth_min, qq_depth_max
+
+
+def _subdivide_components(
+        text,
+        qq_depth_min=2,
+        qq_depth_max=None,
+        break_halves=False,
+        symbolic=False) -> list:
+    """
+    INTERNAL USE:
+    Break down an aliquot into a nested list of its subdivided
+    components, arranged largest-to-smallest, for
+    ``rebuild_aliquots()``. (Parameters are the same as for
+    ``parse_aliquot()``, except that any ``qq_depth`` must already have
+    been resolved into ``qq_depth_min`` and ``qq_depth_max``.)
+
+    :param symbolic: If used, the final component is instead a 2-tuple
+     of ``(components, depth)``, as returned by
+     ``subdivide_aliquot_symbolic()``.
+    """
 
     # Get a list of the component parts of the aliquot string, and then
     # reverse it -- i.e. 'N½SW¼NE¼' becomes ['NE', 'SW', 'N']
@@ -119,6 +226,7 @@ def parse_aliquot(
         component_list = component_list[:qq_depth_max]
 
     subdivided_component_list = []
+    last = len(component_list)
     for i, comp in enumerate(component_list, start=1):
         # Determine how deeply we need to subdivide (i.e. break down) each
         # component, such that we ultimately capture the intended qq_depth_min.
@@ -135,19 +243,16 @@ def parse_aliquot(
             depth -= 1
 
         # Subdivide this aliquot component, as deep as needed.
-        new_comp = subdivide_aliquot(comp, depth)
+        if symbolic and i == last:
+            new_comp = subdivide_aliquot_symbolic(comp, depth)
+        else:
+            new_comp = subdivide_aliquot(comp, depth)
 
         # Append it to our list of components (with subdivisions arranged
         # largest-to-smallest).
         subdivided_component_list.append(new_comp)
 
-    # subdivided_component_list is now in the format:
-    #   `[['SE'], ['NW', 'SW'], ['E2']]`
-    # ...for E/2W/2SE/4, parsed to a qq_depth_min of 2.
-
-    # Convert the 1-depth nested list into the final QQ list.
-    qqs = rebuild_aliquots(subdivided_component_list)
-    return qqs
+    return subdivided_component_list
 
 
 def pass_back_halves(aliquot_components: list) -> list:
@@ -362,8 +467,59 @@ def subdivide_aliquot(aliquot_component: str, depth: int):
     return rebuild_aliquots(divided)
 
 
+def subdivide_aliquot_symbolic(aliquot_component: str, depth: int):
+    """
+    INTERNAL USE:
+
+    Same as ``subdivide_aliquot()``, but only performs the first
+    subdivision. Returns a 2-tuple of the resulting list of aliquots and
+    the number of further times that each of them must be subdivided
+    into quarters to reach the requested ``depth``:
+
+    ``subdivide_aliquot_symbolic('N', 3)``
+    ->  ``(['NE', 'NW'], 2)``
+
+    ``subdivide_aliquot_symbolic('NE', 3)``
+    ->  ``(['NE'], 3)``
+
+    ``subdivide_aliquot_symbolic('N', 0)``
+    ->  ``(['N2'], 0)``
+    """
+    if depth <= 0:
+        return subdivide_aliquot(aliquot_component, depth), 0
+    if aliquot_component in QQ_SUBDIVIDE_DEFINITIONS:
+        return list(QQ_SUBDIVIDE_DEFINITIONS[aliquot_component]), depth - 1
+    return [aliquot_component], depth
+
+
+def expand_aliquot_block(prefix: str, depth: int) -> list:
+    """
+    INTERNAL USE:
+
+    Expand a ``(prefix, depth)`` block (as returned by
+    ``parse_aliquot_blocks()``) into the list of aliquots it represents:
+
+    ``expand_aliquot_block('NE', 1)``
+    ->  ``['NENE', 'NWNE', 'SENE', 'SWNE']``
+    """
+    if depth <= 0:
+        return [prefix]
+    return [f"{cell}{prefix}" for cell in _subdivided_cells(depth)]
+
+
+@functools.lru_cache(maxsize=None)
+def _subdivided_cells(depth: int) -> tuple:
+    """
+    INTERNAL USE:
+    The aliquots that make up an entire section at ``depth``, in order.
+    """
+    return tuple(subdivide_aliquot(_ALL, depth))
+
+
 __all__ = [
     'parse_aliquot',
+    'parse_aliquot_blocks',
+    'expand_aliquot_block',
     '_N',
     '_S',
     '_E',
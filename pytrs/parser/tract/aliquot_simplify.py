@@ -3,13 +3,19 @@ Functions for combining parsed QQs into simpler aliquots.
 """
 
 from __future__ import annotations
+import functools
 from typing import Hashable
-from .tract_parse import TractParser
+from .aliquot_bitmask import split_halves
+from .symbolic_qqs import SymbolicQQList
 
 __all__ = [
     'simplify_aliquots',
 ]
 
+# The maximum number of distinct sets of QQs (with ``assume_standard``)
+# to hold in the cache of ``simplify_aliquots()``.
+SIMPLIFY_CACHE_MAXSIZE = 8192
+
 _ALIQUOT_DEFS = [
     [{'NE', 'NW', 'SE', 'SW'}, ''],  # 'ALL', or the entire aliquot
     [{'NE', 'NW', 'SE', 'SW'}, 'ALL'],
@@ -216,14 +222,7 @@ class AliquotNode:
         :return: A list of aliquot strings, with halves split into
          quarters.
         """
-        split_qqs = []
-        if '2' in qq:
-            tp = TractParser(text=qq, clean_qq=True, break_halves=True)
-            for split_qq in tp.qqs:
-                split_qqs.append(split_qq)
-        else:
-            split_qqs.append(qq)
-        return split_qqs
+        return split_halves(qq)
 
     def register_aliquot(self, qq: str, source: Hashable = None):
         """
@@ -553,12 +552,30 @@ def simplify_aliquots(qqs: list[str], assume_standard=False) -> list[str]:
 
     To assume a standard 640-acre section, use ``assume_standard=True``,
     in which case the standard 16 QQ's will render ``'ALL'``.
+
+    A ``SymbolicQQList`` is simplified from its block prefixes, without
+    generating the individual QQs.
+
+    Results are cached by the set of QQs (since neither their order nor
+    any duplicates affect the result).
+    """
+    if isinstance(qqs, SymbolicQQList):
+        qqs = qqs.prefixes
+    return list(_simplify_cached(frozenset(qqs), bool(assume_standard)))
+
+
+@functools.lru_cache(maxsize=SIMPLIFY_CACHE_MAXSIZE)
+def _simplify_cached(qqs: frozenset, assume_standard: bool) -> tuple:
+    """
+    INTERNAL USE:
+    The cached body of ``simplify_aliquots()``. Returns a tuple (so that
+    the cached result cannot be modified).
     """
     tree = AliquotNode()
     tree.register_all_aliquots(qqs)
     tree.trim_tree()
     consolidated_aliquots = tree.consolidate(assume_standard=assume_standard)
-    return consolidated_aliquots
+    return tuple(consolidated_aliquots)
 
 
 def _calc_aliquot_component_rank(components: list[str] | tuple[str], prefer_short=False):
@@ -0,0 +1,373 @@
+"""
+A memory-efficient, slotted counterpart to the ``Tract`` class, for
+holding very large numbers of (typically already-parsed) tracts.
+"""
+
+from ..config import Config
+from ..trs import TRS
+from .tract import Tract
+from .fingerprint import lots_qqs_fingerprint, desc_fingerprint
+from .tract_preprocess import TractPreprocessor
+
+# Default values for the config-derived attributes, where the config
+# does not specify them. (Matches the defaults set in `Tract.__init__()`.)
+_TRACT_DEFAULTS = {
+    'default_ns': None,
+    'default_ew': None,
+    'parse_qq': False,
+    'clean_qq': False,
+    'suppress_lot_divs': False,
+    'ocr_scrub': False,
+    'qq_depth': None,
+    'qq_depth_min': 2,
+    'qq_depth_max': None,
+    'break_halves': False,
+    'symbolic_qq': False,
+}
+
+# Stored in `._pp_desc` when the description has not yet been
+# preprocessed. (`None` means that it is the same as `.desc`.)
+_PP_DESC_PENDING = False
+
+# One ``Config`` for each distinct combination of config-derived values,
+# shared by every ``CompactTract`` that has those values.
+_SHARED_CONFIGS = {}
+
+
+def _shared_config(values: tuple) -> Config:
+    """
+    INTERNAL USE:
+    Get the shared ``Config`` for a tuple of values, in the order of
+    ``Config._TRACT_ATTRIBUTES``.
+    """
+    config = _SHARED_CONFIGS.get(values)
+    if config is None:
+        config = Config.from_dict(dict(zip(Config._TRACT_ATTRIBUTES, values)))
+        config = _SHARED_CONFIGS.setdefault(values, config)
+    return config
+
+
+def _config_property(attrib):
+    """
+    INTERNAL USE:
+    Create a read-only property for a config-derived attribute, which
+    pulls its value from the shared ``Config``.
+    """
+    default = _TRACT_DEFAULTS[attrib]
+
+    def getter(self):
+        value = getattr(self._config, attrib)
+        if value is None:
+            return default
+        return value
+
+    return property(getter)
+
+
+class CompactTract:
+    """
+    A slotted, memory-efficient representation of a ``Tract``, for when
+    very large numbers of tracts need to be held at once. A
+    ``CompactTract`` can be held in a ``TractList``, and has all the same
+    attributes and output methods as a ``Tract`` (``.trs``, ``.qqs``,
+    ``.lots_aliquots``, ``.to_dict()``, ``.quick_desc()``, etc.).
+
+    Create one from an existing ``Tract`` with
+    ``CompactTract.from_tract()`` (or convert a whole ``TractList`` with
+    its ``.to_compact()`` method), and convert it back to a full
+    ``Tract`` with ``.to_tract()``.
+
+    Differences from ``Tract``:
+
+    - No per-instance ``__dict__``, so arbitrary attributes cannot be
+      added.
+
+    - The flag lists (``.w_flags``, ``.w_flag_lines``, ``.e_flags``,
+      ``.e_flag_lines``) are only allocated if there are any flags.
+      Until then, each is an empty tuple. (To add flags, assign a new
+      list to the attribute.)
+
+    - ``.config`` and the attributes derived from it (``.default_ns``,
+      ``.clean_qq``, ``.qq_depth_min``, etc.) are read-only, and come
+      from a single ``Config`` object that is shared by every
+      ``CompactTract`` with the same settings.
+
+    - It cannot be parsed or reconfigured. Convert it back to a
+      ``Tract`` for that.
+    """
+
+    __slots__ = (
+        '_trs',
+        '_uid',
+        '_config',
+        '_flags',
+        '_pp_desc',
+        'desc',
+        'orig_desc',
+        'orig_index',
+        'source',
+        'parse_complete',
+        'qqs',
+        'lots',
+        'aliquots_whole',
+        'lot_acres',
+    )
+
+    ATTRIBUTES = Tract.ATTRIBUTES
+
+    def __init__(self, tract: Tract):
+        """
+        :param tract: The ``Tract`` to represent. (Its lists and dicts
+         are copied, so later changes to it will not affect this
+         ``CompactTract``.)
+        """
+        if not isinstance(tract, Tract):
+            raise TypeError("`tract` must be a Tract object.")
+        self._trs = TRS(tract.trs)
+        # Keep the original unique identifier, so that sorting by
+        # creation order ('i') is unaffected by the conversion.
+        self._uid = tract._Tract__uid
+        self._config = _shared_config(
+            tuple(getattr(tract, att) for att in Config._TRACT_ATTRIBUTES))
+        self._flags = None
+        if any((tract.w_flags, tract.w_flag_lines,
+                tract.e_flags, tract.e_flag_lines)):
+            self._flags = (
+                list(tract.w_flags),
+                list(tract.w_flag_lines),
+                list(tract.e_flags),
+                list(tract.e_flag_lines),
+            )
+        self.desc = tract.desc
+        # Only store the preprocessed description if it is different.
+        # (And if it has not been computed yet, leave it until needed.)
+        pp_desc = tract._pp_desc_if_computed()
+        self._pp_desc = _PP_DESC_PENDING if pp_desc is None else None
+        if pp_desc is not None and pp_desc != tract.desc:
+            self._pp_desc = pp_desc
+        self.orig_desc = tract.orig_desc
+        self.orig_index = tract.orig_index
+        self.source = tract.source
+        self.parse_complete = tract.parse_complete
+        self.qqs = tract.qqs.copy()
+        self.lots = list(tract.lots)
+        self.aliquots_whole = list(tract.aliquots_whole)
+        self.lot_acres = dict(tract.lot_acres)
+
+    @classmethod
+    def from_tract(cls, tract: Tract):
+        """
+        Create a ``CompactTract`` from a ``Tract``.
+
+        :param tract: The ``Tract`` to represent.
+        :return: The new ``CompactTract``.
+        """
+        return cls(tract)
+
+    def to_tract(self) -> Tract:
+        """
+        Convert this ``CompactTract`` back to a full ``Tract`` (with a
+        new unique identifier), which can be parsed or reconfigured.
+        """
+        tract = Tract(
+            desc=self.desc,
+            trs=self.trs,
+            config=self._config,
+            parse_qq=False,
+            source=self.source,
+            orig_desc=self.orig_desc,
+            orig_index=self.orig_index)
+        tract.parse_qq = self.parse_qq
+        tract.parse_complete = self.parse_complete
+        if self._pp_desc is not _PP_DESC_PENDING:
+            tract.pp_desc = self.pp_desc
+        tract.qqs = self.qqs.copy()
+        tract.lots = list(self.lots)
+        tract.aliquots_whole = list(self.aliquots_whole)
+        tract.lot_acres = dict(self.lot_acres)
+        tract.w_flags = list(self.w_flags)
+        tract.w_flag_lines = list(self.w_flag_lines)
+        tract.e_flags = list(self.e_flags)
+        tract.e_flag_lines = list(self.e_flag_lines)
+        return tract
+
+    def __str__(self):
+        return self.quick_desc()
+
+    def __repr__(self):
+        return (
+            f"CompactTract({'' if self.parse_complete else 'un'}parsed)"
+            f"<{self.quick_desc_short(max_len=20)!r}>"
+        ).replace('\n', r'\n')
+
+    @property
+    def config(self):
+        return self._config
+
+    default_ns = _config_property('default_ns')
+    default_ew = _config_property('default_ew')
+    parse_qq = _config_property('parse_qq')
+    clean_qq = _config_property('clean_qq')
+    suppress_lot_divs = _config_property('suppress_lot_divs')
+    ocr_scrub = _config_property('ocr_scrub')
+    qq_depth = _config_property('qq_depth')
+    qq_depth_min = _config_property('qq_depth_min')
+    qq_depth_max = _config_property('qq_depth_max')
+    break_halves = _config_property('break_halves')
+    symbolic_qq = _config_property('symbolic_qq')
+
+    @property
+    def pp_desc(self):
+        if self._pp_desc is _PP_DESC_PENDING:
+            pp_desc = TractPreprocessor(self.desc, self.clean_qq).text
+            self._pp_desc = None if pp_desc == self.desc else pp_desc
+        if self._pp_desc is None:
+            return self.desc
+        return self._pp_desc
+
+    @pp_desc.setter
+    def pp_desc(self, new_pp_desc):
+        self._pp_desc = new_pp_desc
+
+    def _get_flags(self, i):
+        if self._flags is None:
+            return ()
+        return self._flags[i]
+
+    def _set_flags(self, i, new_flags):
+        if self._flags is None:
+            if not new_flags:
+                return None
+            self._flags = ([], [], [], [])
+        flags = list(self._flags)
+        flags[i] = new_flags
+        self._flags = tuple(flags)
+        return None
+
+    w_flags = property(
+        lambda self: self._get_flags(0),
+        lambda self, v: self._set_flags(0, v))
+    w_flag_lines = property(
+        lambda self: self._get_flags(1),
+        lambda self, v: self._set_flags(1, v))
+    e_flags = property(
+        lambda self: self._get_flags(2),
+        lambda self, v: self._set_flags(2, v))
+    e_flag_lines = property(
+        lambda self: self._get_flags(3),
+        lambda self, v: self._set_flags(3, v))
+
+    @property
+    def trs(self):
+        return self._trs.trs
+
+    @trs.setter
+    def trs(self, new_trs):
+        if isinstance(new_trs, TRS):
+            new_trs = new_trs.trs
+        self._trs = TRS(new_trs)
+
+    @property
+    def twp(self):
+        return self._trs.twp
+
+    @property
+    def twp_num(self):
+        return self._trs.twp_num
+
+    @property
+    def twp_ns(self):
+        return self._trs.twp_ns
+
+    ns = twp_ns
+
+    @property
+    def rge(self):
+        return self._trs.rge
+
+    @property
+    def rge_num(self):
+        return self._trs.rge_num
+
+    @property
+    def rge_ew(self):
+        return self._trs.rge_ew
+
+    ew = rge_ew
+
+    @property
+    def twprge(self):
+        return self._trs.twprge
+
+    @property
+    def sec(self):
+        return self._trs.sec
+
+    @property
+    def sec_num(self):
+        return self._trs.sec_num
+
+    @property
+    def twp_undef(self):
+        return self._trs.twp_undef
+
+    @property
+    def rge_undef(self):
+        return self._trs.rge_undef
+
+    @property
+    def sec_undef(self):
+        return self._trs.sec_undef
+
+    def pretty_twprge(self, *args, **kwargs):
+        """Same as ``Tract.pretty_twprge()``."""
+        return self._trs.pretty_twprge(*args, **kwargs)
+
+    def trs_is_undef(self, twp=True, rge=True, sec=True):
+        """Same as ``Tract.trs_is_undef()``."""
+        return self._trs.is_undef(twp, rge, sec)
+
+    def trs_is_error(self, twp=True, rge=True, sec=True):
+        """Same as ``Tract.trs_is_error()``."""
+        return self._trs.is_error(twp, rge, sec)
+
+    @property
+    def lots_qqs_fingerprint(self) -> int:
+        """
+        Same as ``Tract.lots_qqs_fingerprint``. (Not cached, to keep
+        ``CompactTract`` objects small.)
+        """
+        return lots_qqs_fingerprint(self)
+
+    @property
+    def desc_fingerprint(self) -> int:
+        """
+        Same as ``Tract.desc_fingerprint``. (Not cached, to keep
+        ``CompactTract`` objects small.)
+        """
+        return desc_fingerprint(self)
+
+    # These do not depend on how the data is stored, so are shared with
+    # the `Tract` class.
+    lots_qqs = Tract.lots_qqs
+    ilots = Tract.ilots
+    aliquots = Tract.aliquots
+    aliquots_standard = Tract.aliquots_standard
+    sorted_lots = Tract.sorted_lots
+    lots_aliquots = Tract.lots_aliquots
+    lots_aliquots_standard = Tract.lots_aliquots_standard
+    acres = Tract.acres
+    flags = Tract.flags
+    flag_lines = Tract.flag_lines
+    desc_is_flawed = Tract.desc_is_flawed
+    to_dict = Tract.to_dict
+    to_list = Tract.to_list
+    quick_desc = Tract.quick_desc
+    quick_desc_short = Tract.quick_desc_short
+    quick_desc_lots_aliquots = Tract.quick_desc_lots_aliquots
+    get_headers = Tract.get_headers
+
+
+__all__ = [
+    'CompactTract',
+]
@@ -0,0 +1,109 @@
+
+"""
+Stable 64-bit fingerprints of tracts, for finding duplicate tracts
+without comparing their lots/QQs or descriptions directly.
+
+Fingerprints are computed with BLAKE2b, so (unlike the builtin
+``hash()``) they are the same across processes and Python sessions, and
+can be stored alongside a dataset to find duplicates in later batches.
+
+.. note::
+    As with any 64-bit hash, distinct tracts can (very rarely) share a
+    fingerprint. Among 20 million distinct tracts, the chance of any
+    collision is about 1 in 100,000. So wherever tracts sharing a
+    fingerprint are to be treated as duplicates, their exact keys
+    (``lots_qqs_key()`` or ``desc_key()``) should be compared as well.
+"""
+
+from hashlib import blake2b
+
+from ..trs import TRS
+
+# Separators that will not occur within a Twp/Rge/Sec, lot, or QQ.
+_FIELD_SEP = '\x1f'
+_ITEM_SEP = '\x1e'
+
+
+def stable_hash64(text: str) -> int:
+    """
+    Get a stable 64-bit hash of the ``text``, as an unsigned int.
+    """
+    return int.from_bytes(
+        blake2b(text.encode('utf-8'), digest_size=8).digest(), 'big')
+
+
+def lots_qqs_key(tract) -> tuple:
+    """
+    Get the exact key that ``lots_qqs_fingerprint()`` is computed from:
+    the tract's Twp/Rge/Sec, and a sorted tuple of the set of its lots
+    and QQs.
+
+    :param tract: A ``Tract`` (or ``CompactTract``).
+    :return: A tuple of ``(trs, lots_qqs)``.
+    """
+    return tract.trs, tuple(sorted(set(tract.lots_qqs)))
+
+
+def lots_qqs_fingerprint(tract) -> int:
+    """
+    Get a fingerprint of the tract's Twp/Rge/Sec and the set of its lots
+    and QQs. Tracts in the same Twp/Rge/Sec with the same lots and QQs
+    (in any order, and ignoring duplicates) have the same fingerprint.
+
+    :param tract: A ``Tract`` (or ``CompactTract``). (Its lots and QQs
+     must have been parsed for the fingerprint to be meaningful.)
+    :return: The fingerprint, as an int.
+    """
+    trs, lots_qqs = lots_qqs_key(tract)
+    return stable_hash64(f"{trs}{_FIELD_SEP}{_ITEM_SEP.join(lots_qqs)}")
+
+
+def desc_key(tract) -> tuple:
+    """
+    Get the exact key that ``desc_fingerprint()`` is computed from: the
+    tract's Twp/Rge/Sec, and its preprocessed description
+    (``.pp_desc``) stripped of leading and trailing whitespace.
+
+    :param tract: A ``Tract`` (or ``CompactTract``). May also be a
+     ``TRS`` object, in which case the description is ``None``.
+    :return: A tuple of ``(trs, desc)``.
+    """
+    if isinstance(tract, TRS):
+        return tract.trs, None
+    return tract.trs, tract.pp_desc.strip()
+
+
+def desc_fingerprint(tract) -> int:
+    """
+    Get a fingerprint of the tract's Twp/Rge/Sec and its preprocessed
+    description (``.pp_desc``), stripped of leading and trailing
+    whitespace.
+
+    :param tract: A ``Tract`` (or ``CompactTract``). May also be a
+     ``TRS`` object, in which case only the Twp/Rge/Sec is used.
+    :return: The fingerprint, as an int.
+    """
+    if isinstance(tract, TRS):
+        return trs_fingerprint(tract)
+    trs, desc = desc_key(tract)
+    return stable_hash64(f"{trs}{_FIELD_SEP}{desc}")
+
+
+def trs_fingerprint(element) -> int:
+    """
+    Get a fingerprint of the Twp/Rge/Sec alone.
+
+    :param element: A ``Tract``, ``CompactTract``, or ``TRS`` object.
+    :return: The fingerprint, as an int.
+    """
+    return stable_hash64(element.trs)
+
+
+__all__ = [
+    'stable_hash64',
+    'lots_qqs_key',
+    'lots_qqs_fingerprint',
+    'desc_key',
+    'desc_fingerprint',
+    'trs_fingerprint',
+]
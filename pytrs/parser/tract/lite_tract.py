@@ -0,0 +1,124 @@
+
+"""
+A lightweight stand-in for a ``Tract``, created by the parser with the
+``'lite_tracts'`` config setting, which holds only what the parser
+found (the Twp/Rge/Sec, description, etc.) and becomes a full ``Tract``
+the first time anything else is needed.
+"""
+
+from ..trs import TRS
+from .tract import Tract
+
+# The flag attributes, in the order they are held in `._lite_flags`.
+_FLAG_ATTRIBUTES = ('w_flags', 'w_flag_lines', 'e_flags', 'e_flag_lines')
+
+_NO_FLAGS = ((), (), (), ())
+
+
+class LiteTract(Tract):
+    """
+    A ``Tract`` that has not been fully constructed. It holds only the
+    Twp/Rge/Sec, ``.desc``, ``.source``, ``.orig_desc``, and
+    ``.orig_index`` (plus the flags handed down by the parser, which are
+    shared by every ``LiteTract`` from the same description until they
+    are accessed).
+
+    Everything that depends only on the Twp/Rge/Sec (``.trs``,
+    ``.twprge``, ``.sec_num``, ``.trs_is_error()``, etc.) is available
+    as-is. The first time that any other attribute or method is needed,
+    the ``LiteTract`` is constructed in place into a full ``Tract``
+    (with the same results as if it had been created as one), so it can
+    be used in every way that a ``Tract`` can.
+
+    Create these by parsing with the ``'lite_tracts'`` config setting:
+
+    .. code-block:: python
+
+        desc = pytrs.PLSSDesc(
+            'T154N-R97W Sec 1 - 36: ALL', config='lite_tracts')
+        desc.tracts.trs  # (None of the 36 tracts is fully constructed.)
+    """
+
+    def __init__(
+            self,
+            desc,
+            trs,
+            config=None,
+            source=None,
+            orig_desc=None,
+            orig_index=0,
+            flags=_NO_FLAGS):
+        """
+        :param desc: Same as for ``Tract``.
+        :param trs: Same as for ``Tract``.
+        :param config: A ``Config`` object, to be applied when the full
+         ``Tract`` is constructed.
+        :param source: Same as for ``Tract``.
+        :param orig_desc: Same as for ``Tract``.
+        :param orig_index: Same as for ``Tract``.
+        :param flags: A 4-tuple of the ``w_flags``, ``w_flag_lines``,
+         ``e_flags``, and ``e_flag_lines`` (each a tuple), which will be
+         copied into lists when needed.
+        """
+        # (This skips `Tract.__init__()`, which is run when the full
+        # `Tract` is constructed.)
+        self._Tract__uid = Tract._next_uid()
+        self._Tract__trs = TRS(trs)
+        self.desc = desc
+        self.orig_index = orig_index
+        self.source = source
+        self.orig_desc = orig_desc
+        self.parse_complete = False
+        self._lite_config = config
+        self._lite_flags = flags
+
+    def __getattr__(self, name):
+        # Only called for attributes that have not been set -- i.e.
+        # everything that requires a full `Tract`.
+        lite_vars = vars(self)
+        if name.startswith('__') or '_lite_config' not in lite_vars:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}")
+        if name in _FLAG_ATTRIBUTES:
+            value = list(self._lite_flags[_FLAG_ATTRIBUTES.index(name)])
+            setattr(self, name, value)
+            return value
+        self.materialize()
+        return getattr(self, name)
+
+    @property
+    def is_lite(self) -> bool:
+        """Whether this has not yet been constructed into a full ``Tract``."""
+        return '_lite_config' in vars(self)
+
+    def materialize(self) -> None:
+        """
+        Construct this into a full ``Tract`` (in place), if it has not
+        been already. (This happens automatically when needed.)
+        """
+        lite_vars = vars(self)
+        if '_lite_config' not in lite_vars:
+            return None
+        config = lite_vars.pop('_lite_config')
+        flags = lite_vars.pop('_lite_flags')
+        # Anything set on this object since it was created (including
+        # its UID and Twp/Rge/Sec) takes priority over the new Tract.
+        overrides = dict(lite_vars)
+        full = Tract(
+            self.desc,
+            self._Tract__trs,
+            config=config,
+            parse_qq=False,
+            source=self.source,
+            orig_desc=self.orig_desc,
+            orig_index=self.orig_index)
+        lite_vars.update(vars(full))
+        for attrib, handed_down in zip(_FLAG_ATTRIBUTES, flags):
+            lite_vars[attrib] = lite_vars[attrib] + list(handed_down)
+        lite_vars.update(overrides)
+        return None
+
+
+__all__ = [
+    'LiteTract',
+]
@@ -0,0 +1,167 @@
+
+"""
+A list-like container of QQs that holds deep subdivisions symbolically,
+as ``(prefix, depth)`` blocks, rather than as one string per QQ.
+"""
+
+from .aliquot_parse import (
+    expand_aliquot_block,
+    QQ_QUARTERS,
+    _ALL,
+)
+from .aliquot_bitmask import (
+    aliquot_to_mask,
+    mask_to_aliquots,
+)
+
+
+class SymbolicQQList:
+    """
+    A read-mostly, list-like container of QQs (as stored in
+    ``Tract.qqs`` when a ``Tract`` is parsed with the ``'symbolic_qq'``
+    config setting).
+
+    Each QQ block is a 2-tuple of ``(prefix, depth)``, representing
+    every aliquot found by subdividing the ``prefix`` into quarters
+    ``depth`` more times -- e.g., ``('NE', 2)`` is the 16 10-acre
+    aliquots in the NE/4 (``'NENENE'``, ``'NWNENE'``, ...). The
+    individual QQ strings are only generated when iterating over (or
+    indexing into) the list. Counting (``len()``), membership tests
+    (``in``), and simplification into aliquots (e.g.,
+    ``Tract.aliquots``) work directly on the blocks.
+
+    Compares equal to a ``list`` of the same QQs, and adding it to a
+    ``list`` (or vice versa) returns a new ``list``.
+    """
+
+    def __init__(self, blocks=()):
+        """
+        :param blocks: (Optional) An iterable of ``(prefix, depth)``
+         2-tuples.
+        """
+        self.blocks = [(prefix, depth) for prefix, depth in blocks]
+
+    def __repr__(self):
+        return f"SymbolicQQList({len(self)})<{self.blocks!r}>"
+
+    def __len__(self):
+        return sum(4 ** depth for _, depth in self.blocks)
+
+    def __bool__(self):
+        return len(self.blocks) > 0
+
+    def __iter__(self):
+        for prefix, depth in self.blocks:
+            yield from expand_aliquot_block(prefix, depth)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return list(self)[item]
+        if item < 0:
+            item += len(self)
+        if item >= 0:
+            for prefix, depth in self.blocks:
+                size = 4 ** depth
+                if item < size:
+                    if not depth:
+                        return prefix
+                    return f"{mask_to_aliquots(1 << item, depth)[0]}{prefix}"
+                item -= size
+        raise IndexError('SymbolicQQList index out of range')
+
+    def __contains__(self, qq):
+        return self.count(qq) > 0
+
+    def __eq__(self, other):
+        if isinstance(other, (SymbolicQQList, list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __add__(self, other):
+        return list(self) + list(other)
+
+    def __radd__(self, other):
+        return list(other) + list(self)
+
+    def count(self, qq) -> int:
+        """
+        Count how many times the ``qq`` occurs in this list (without
+        generating the individual QQs).
+        """
+        if not isinstance(qq, str):
+            return 0
+        n = 0
+        for prefix, depth in self.blocks:
+            if not qq.endswith(prefix) or len(qq) != len(prefix) + depth * 2:
+                continue
+            leading = qq[:depth * 2]
+            if all(
+                    leading[i:i + 2] in QQ_QUARTERS
+                    for i in range(0, len(leading), 2)):
+                n += 1
+        return n
+
+    def append(self, qq: str):
+        """Add a single QQ to the end of this list."""
+        self.blocks.append((qq, 0))
+
+    def extend(self, qqs):
+        """
+        Add multiple QQs to the end of this list. (If ``qqs`` is another
+        ``SymbolicQQList``, its blocks are added without expanding
+        them.)
+        """
+        if isinstance(qqs, SymbolicQQList):
+            self.blocks.extend(qqs.blocks)
+        else:
+            self.blocks.extend((qq, 0) for qq in qqs)
+
+    def extend_blocks(self, blocks):
+        """
+        Add multiple ``(prefix, depth)`` blocks to the end of this list.
+        """
+        self.blocks.extend((prefix, depth) for prefix, depth in blocks)
+
+    def copy(self):
+        """Get a copy of this ``SymbolicQQList``."""
+        return SymbolicQQList(self.blocks)
+
+    @property
+    def prefixes(self) -> list:
+        """
+        The prefix of each block. Together, these cover the same land as
+        the complete list of QQs (so they can be simplified into
+        aliquots without generating the QQs).
+        """
+        return [prefix for prefix, _ in self.blocks]
+
+    def duplicates(self) -> list:
+        """
+        Get a list of each QQ that occurs more than once in this list
+        (listing each such QQ once).
+        """
+        # Overlapping blocks are found with bitmasks of the QQs at
+        # each block's full depth, so the blocks need not be expanded.
+        seen_strs = set()
+        dup_strs = []
+        masks = {}
+        for prefix, depth in self.blocks:
+            if '2' in prefix or prefix == _ALL:
+                # Not made up of quarters. Only an identical string is a
+                # duplicate.
+                if prefix in seen_strs and prefix not in dup_strs:
+                    dup_strs.append(prefix)
+                seen_strs.add(prefix)
+                continue
+            full_depth = len(prefix) // 2 + depth
+            mask = aliquot_to_mask(prefix, full_depth)
+            seen, dups = masks.get(full_depth, (0, 0))
+            masks[full_depth] = (seen | mask, dups | (seen & mask))
+        for full_depth in sorted(masks):
+            dup_strs.extend(mask_to_aliquots(masks[full_depth][1], full_depth))
+        return dup_strs
+
+
+__all__ = [
+    'SymbolicQQList',
+]
@@ -4,19 +4,23 @@ description block, and to parse that description block into lots and
 aliquot Quarter-Quarters ("QQs").
 """
 
+import copy
 import re
+import threading
 
 from ...utils import (
     _confirm_list_of_strings as clean_attributes,
 )
 from ..config import (
     Config,
-    ConfigError,
 )
 from ..trs import TRS
 from .tract_preprocess import TractPreprocessor
 from .tract_parse import TractParser
 from .aliquot_simplify import simplify_aliquots
+from .symbolic_qqs import SymbolicQQList
+from .acreage import tract_acres
+from .fingerprint import lots_qqs_fingerprint, desc_fingerprint
 
 
 class Tract:
@@ -89,6 +93,11 @@ class Tract:
 
             (And see also ``break_halves`` config setting.)
 
+        .. note::
+            With the ``symbolic_qq`` config setting, this is a
+            ``SymbolicQQList`` that holds deep subdivisions without
+            generating each QQ until it is iterated over.
+
     - ``.lots`` -- A list of identified lots. (ex:
       ``['L1', 'N2 of L2']`` from ``'Lot 1, North Half of Lot 2'``)
 
@@ -123,6 +132,11 @@ class Tract:
       acreages, as stated in the original description.
       (Ex: ``{'L1': '38.29'}`` from ``'Lot 1(38.29), Lot 2'``)
 
+    - ``.acres`` -- The nominal gross acreage of the parsed QQ's
+      (assuming a 'standard' 640-acre section), plus the acreage of
+      any lots in ``.lot_acres``. (Ex: ``78.29`` from
+      ``'Lot 1(38.29), Lot 2, NE/4NE/4'``)
+
     - ``.aliquots`` -- A list of simplified aliquots, combined from the
       parsed QQ's. (Ex: ``['N2NE', 'SW']``)  (Will NOT assume that this
       section is a 'standard' 640-acre section, with 16 QQ's -- i.e.,
@@ -143,8 +157,9 @@ class Tract:
             identified as an aliquot by the parser in the ORIGINAL
             description.
 
-    - ``.pp_desc`` -- The preprocessed description. (If the object has
-      not yet been parsed, it will be equivalent to ``.desc``.)
+    - ``.pp_desc`` -- The preprocessed description. (Computed from
+      ``.desc`` when first accessed, unless the object has already been
+      parsed, and kept until the object is parsed again.)
 
     - ``.source`` -- (Optional) Any value of any type (probably a str or
       int) specifying where the description came from. Useful if parsing
@@ -314,11 +329,14 @@ class Tract:
         'flags': 'Warning & Error Flags',  # **
         'flag_lines': 'Warning & Error Flags with Context',  # **
         'lot_acres': 'Lot Acreages',
+        'acres': 'Nominal Gross Acres',  # **
         'source': 'Source'
     }
 
     # A unique identifier that increments every time a Tract is created.
+    # (Only ever allocated through `Tract._next_uid()`.)
     __UID = 0
+    __UID_LOCK = threading.Lock()
 
     def __init__(
             self,
@@ -361,8 +379,7 @@ class Tract:
         if not isinstance(trs, (str, TRS)) and trs is not None:
             raise TypeError("`trs` must be a str, None, or a TRS object")
 
-        self.__uid = Tract.__UID
-        Tract.__UID += 1
+        self.__uid = Tract._next_uid()
 
         # Note that setting `.trs` populates a TRS object in the
         # protected `.__trs` attribute.
@@ -385,6 +402,18 @@ class Tract:
         # Whether we have parsed this Tract and committed the results
         self.parse_complete = False
 
+        # Cached fingerprints (see `.lots_qqs_fingerprint` and
+        # `.desc_fingerprint`), each stored with the state it was
+        # computed from. (A dict is created only when first needed.)
+        self.__fingerprints = None
+
+        # The preprocessed description (see `.pp_desc`), stored with the
+        # `(desc, clean_qq)` it was preprocessed from (or `None` if it
+        # was set directly). Not computed until first needed, in which
+        # case the text is `None` (and the `(desc, clean_qq)` are those
+        # at init, set below).
+        self.__pp_desc = None
+
         # list of warning flags
         self.w_flags = []
         # list of 2-tuples that caused warning flags (warning flag, text string)
@@ -409,6 +438,10 @@ class Tract:
         self.qq_depth_max = None
         self.break_halves = False
 
+        # Whether to hold deep subdivisions of QQs symbolically (in a
+        # SymbolicQQList), instead of generating each QQ at parse.
+        self.symbolic_qq = False
+
         # A list of standard lots, ['L1', 'L2', 'N2 of L5', ...]:
         self.lots = []
 
@@ -459,13 +492,13 @@ class Tract:
         if parse_qq is not None:
             self.parse_qq = parse_qq
 
-        self.pp_desc = self.desc
-
         # If config settings require calling parse() at init, do it now.
+        # (Otherwise, the description is not preprocessed until `.pp_desc`
+        # is needed -- but with the `.desc` and `.clean_qq` as of now.)
         if self.parse_qq:
             self.parse(commit=True)
         else:
-            self.preprocess(commit=True)
+            self.__pp_desc = ((self.desc, self.clean_qq), None)
 
     def __str__(self):
         return self.quick_desc()
@@ -476,6 +509,42 @@ class Tract:
             f"<{self.quick_desc_short(max_len=20)!r}>"
         ).replace('\n', r'\n')
 
+    @staticmethod
+    def _next_uid() -> int:
+        """
+        INTERNAL USE:
+        Allocate the next unique identifier for a ``Tract``. (Safe to
+        call from multiple threads at once.)
+        """
+        with Tract.__UID_LOCK:
+            uid = Tract.__UID
+            Tract.__UID += 1
+        return uid
+
+    def _reset_uid(self):
+        """
+        INTERNAL USE:
+        Assign a new unique identifier to this ``Tract``. (Used when a
+        ``Tract`` was created in a different process, whose UID counter
+        is independent from that of this process.)
+        """
+        self.__uid = Tract._next_uid()
+        return None
+
+    def _fresh_copy(self):
+        """
+        INTERNAL USE:
+        Get a copy of this ``Tract``, with a new unique identifier and
+        its own copies of any lists and dicts (e.g., flags, lots, and
+        QQs), so that changing one will not affect the other.
+        """
+        new = copy.copy(self)
+        new._reset_uid()
+        for attrib, value in list(vars(new).items()):
+            if isinstance(value, (list, dict, SymbolicQQList)):
+                setattr(new, attrib, value.copy())
+        return new
+
     @property
     def trs(self):
         """
@@ -691,7 +760,7 @@ class Tract:
         aliquots. (Does NOT assume this is a standard section where
         'ALL' is made up of 16 QQ's.)
         """
-        return self.sorted_lots + simplify_aliquots(self.qqs)
+        return self.sorted_lots + self.aliquots
 
     @property
     def lots_aliquots_standard(self):
@@ -700,7 +769,51 @@ class Tract:
         aliquots. (DOES assume that this is a standard section where
         'ALL' is made up of 16 QQ's.)
         """
-        return self.sorted_lots + simplify_aliquots(self.qqs, assume_standard=True)
+        return self.sorted_lots + self.aliquots_standard
+
+    @property
+    def acres(self) -> float:
+        """
+        The nominal gross acreage of this tract: the acreage of its QQs
+        (assuming a standard 640-acre section), plus the acreage stated
+        for any of its lots in the description. (Lots without a stated
+        acreage are not counted.)
+        """
+        return tract_acres(self)
+
+    @property
+    def lots_qqs_fingerprint(self) -> int:
+        """
+        A stable 64-bit fingerprint of the Twp/Rge/Sec and the set of
+        lots and QQs. (Computed once and cached until the tract is
+        re-parsed, or its ``.trs``, ``.lots``, or ``.qqs`` are changed
+        -- including in place.)
+        """
+        state = (self.trs, tuple(self.lots), tuple(self.qqs))
+        if self.__fingerprints is None:
+            self.__fingerprints = {}
+        cached = self.__fingerprints.get('lots_qqs')
+        if cached is None or cached[0] != state:
+            cached = (state, lots_qqs_fingerprint(self))
+            self.__fingerprints['lots_qqs'] = cached
+        return cached[1]
+
+    @property
+    def desc_fingerprint(self) -> int:
+        """
+        A stable 64-bit fingerprint of the Twp/Rge/Sec and the
+        preprocessed description. (Computed once and cached until the
+        tract is re-parsed, or its ``.trs`` or ``.pp_desc`` are
+        changed.)
+        """
+        state = (self.trs, self.pp_desc)
+        if self.__fingerprints is None:
+            self.__fingerprints = {}
+        cached = self.__fingerprints.get('desc')
+        if cached is None or cached[0] != state:
+            cached = (state, desc_fingerprint(self))
+            self.__fingerprints['desc'] = cached
+        return cached[1]
 
     @property
     def flags(self):
@@ -770,10 +883,7 @@ class Tract:
         # Compile the `config=` data into a Config object (or use the
         # provided object, if already provided as `Config` type), so we
         # can extract `default_ns` and `default_ew`
-        if isinstance(config, str) or config is None:
-            config = Config(config)
-        if not isinstance(config, Config):
-            raise ConfigError(config)
+        config = Config.intern(config)
 
         # Get our default_ns and default_ew from kwargs or config
         if default_ns is None:
@@ -796,6 +906,43 @@ class Tract:
             orig_index=orig_index, config=config, parse_qq=parse_qq)
         return new_tract
 
+    @property
+    def pp_desc(self):
+        """
+        The preprocessed description. (Computed when first accessed, and
+        kept until the tract is parsed again or this is set. Until the
+        tract is parsed, it is computed from the ``.desc`` and
+        ``.clean_qq`` as of init, even if either was changed before it
+        was first accessed -- just as if it had been computed at init.)
+        """
+        cached = self.__pp_desc
+        if cached is None:
+            self.preprocess(commit=True)
+        elif cached[1] is None:
+            desc, clean_qq = cached[0]
+            pp_text = TractPreprocessor(desc, clean_qq=clean_qq).text
+            self.__pp_desc = (cached[0], pp_text)
+        return self.__pp_desc[1]
+
+    @pp_desc.setter
+    def pp_desc(self, new_pp_desc):
+        self.__pp_desc = (None, new_pp_desc)
+
+    def _pp_desc_if_computed(self):
+        """
+        INTERNAL USE:
+        Get the preprocessed description, or ``None`` if it has not yet
+        been computed (or set) and it would be computed from the current
+        ``.desc`` and ``.clean_qq``. (If either has changed since init,
+        it is computed now.)
+        """
+        cached = self.__pp_desc
+        if cached is None or cached[1] is None:
+            if cached is None or cached[0] == (self.desc, self.clean_qq):
+                return None
+            return self.pp_desc
+        return cached[1]
+
     @property
     def config(self):
         return self.__config
@@ -811,16 +958,9 @@ class Tract:
         config settings. (See ``Config`` documentation for all optional
         settings.)
         """
-        if isinstance(new_config, str) or new_config is None:
-            new_config = Config(new_config)
-        if not isinstance(new_config, Config):
-            raise ConfigError(new_config)
-
-        for attrib in Config._TRACT_ATTRIBUTES:
-            value = getattr(new_config, attrib)
-            if value is not None:
-                setattr(self, attrib, value)
-
+        new_config = Config.intern(new_config)
+        for attrib, value in new_config._tract_settings:
+            setattr(self, attrib, value)
         self.__config = new_config
 
     @property
@@ -907,7 +1047,9 @@ class Tract:
             Setting ``qq_depth_min`` or ``qq_depth`` to a number larger
             than 4 will quickly start to be resource- and
             time-intensive, because each additional number is another
-            exponential division.
+            exponential division. (Unless using the ``symbolic_qq``
+            config setting, in which case the QQs are only generated
+            when ``.qqs`` is iterated over.)
 
         :param commit: Whether to commit the results to the appropriate
          instance attributes. Defaults to ``True``.
@@ -990,29 +1132,39 @@ class Tract:
         # ----------------------------------------
         # Parse it.
 
+        # Reuse the preprocessed description, if it was already computed
+        # from the same text and settings.
+        pp_text = None
+        cached = self.__pp_desc
+        if cached is not None and cached[0] == (self.desc, clean_qq):
+            pp_text = cached[1]
+
         parser = TractParser(
             text=self.desc,
+            pp_text=pp_text,
             clean_qq=clean_qq,
             suppress_lot_divs=suppress_lot_divs,
             qq_depth_min=qq_depth_min,
             qq_depth_max=qq_depth_max,
             qq_depth=qq_depth,
             break_halves=break_halves,
+            symbolic_qq=self.symbolic_qq,
             parent=self
         )
 
         # Store the results, if instructed to do so.
         if commit:
             self.parse_complete = True
+            self.__fingerprints = None
 
             # Unpack the appropriate attributes.
             for attribute in parser.UNPACKABLES:
                 setattr(self, attribute, getattr(parser, attribute))
 
             # Pull the preprocessed text from the parser.
-            self.pp_desc = parser.text
+            self.__pp_desc = ((parser.orig_text, clean_qq), parser.text)
 
-        return parser.lots + parser.qqs
+        return parser.lots_qqs
 
     def preprocess(self, clean_qq=None, commit=False) -> str:
         """
@@ -1021,8 +1173,9 @@ class Tract:
         attribute (with ``commit=True``).
 
         .. note::
-            Regardless whether committed, the description will be
-            preprocessed (again) when parsed.
+            If committed (or if ``.pp_desc`` has already been accessed),
+            the preprocessed description will be reused when parsed with
+            the same ``clean_qq``.
 
         :param clean_qq: Whether to expect only clean lots and aliquots
          no metes-and-bounds, exceptions, complicated descriptions,
@@ -1043,10 +1196,10 @@ class Tract:
         if clean_qq is None:
             clean_qq = self.clean_qq
         preprocessor = TractPreprocessor(text, clean_qq=clean_qq)
-        text = preprocessor.text
+        pp_text = preprocessor.text
         if commit:
-            self.pp_desc = text
-        return text
+            self.__pp_desc = ((text, clean_qq), pp_text)
+        return pp_text
 
     def to_dict(self, *attributes) -> dict:
         """
@@ -1058,7 +1211,10 @@ class Tract:
         """
 
         attributes = clean_attributes(attributes)
-        return {att: getattr(self, att, f"{att}: n/a") for att in attributes}
+        return {
+            att: _export_value(getattr(self, att, f"{att}: n/a"))
+            for att in attributes
+        }
 
     def to_list(self, *attributes) -> list:
         """
@@ -1070,7 +1226,10 @@ class Tract:
         """
 
         attributes = clean_attributes(attributes)
-        return [getattr(self, att, f"{att}: n/a") for att in attributes]
+        return [
+            _export_value(getattr(self, att, f"{att}: n/a"))
+            for att in attributes
+        ]
 
     def quick_desc(self, delim=': ') -> str:
         """
@@ -1167,6 +1326,17 @@ class Tract:
         return header_row
 
 
+def _export_value(value):
+    """
+    INTERNAL USE:
+    Expand a ``SymbolicQQList`` into a plain list of QQs for output.
+    Any other value is returned as-is.
+    """
+    if isinstance(value, SymbolicQQList):
+        return list(value)
+    return value
+
+
 __all__ = [
     'Tract',
 ]
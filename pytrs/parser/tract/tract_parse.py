@@ -5,15 +5,26 @@ been preprocessed.
 """
 
 import re
+import sys
 
+from ...utils import (
+    _intern_flags,
+    _intern_flag_lines,
+)
 from ..rgxlib import *
 from ..unpack import (
     LotUnpacker,
 )
 from .aliquot_parse import (
     parse_aliquot,
+    parse_aliquot_blocks,
     _ALL
 )
+from .symbolic_qqs import SymbolicQQList
+from ..profiling.profiling import (
+    start_timing,
+    stop_timing,
+)
 from .tract_preprocess import (
     TractPreprocessor,
 )
@@ -57,27 +68,39 @@ class TractParser:
             qq_depth_max=None,
             qq_depth=None,
             break_halves=False,
-            parent=None
+            symbolic_qq=False,
+            parent=None,
+            pp_text=None,
     ):
         """
         NOTE: Documentation for this class is not maintained here. See
         instead ``Tract.parse()``, which essentially serves as a wrapper
         for this class.
+
+        :param pp_text: (Optional) The ``text``, already preprocessed
+         with the same ``clean_qq``. (If not provided, ``text`` will be
+         preprocessed here.)
         """
         self.orig_text = text
-        self.preprocessor = TractPreprocessor(text, clean_qq)
-        self.text = self.preprocessor.text
+        self.preprocessor = None
+        if pp_text is None:
+            self.preprocessor = TractPreprocessor(text, clean_qq)
+            pp_text = self.preprocessor.text
+        self.text = pp_text
         self.clean_qq = clean_qq
         self.suppress_lot_divs = suppress_lot_divs
         self.qq_depth_min = qq_depth_min
         self.qq_depth_max = qq_depth_max
         self.qq_depth = qq_depth
         self.break_halves = break_halves
+        self.symbolic_qq = symbolic_qq
         self.parent = parent
 
         # These attributes will be populated during the parse.
         self.lots = []
         self.qqs = []
+        if symbolic_qq:
+            self.qqs = SymbolicQQList()
         self.lot_acres = {}
         self.aliquots_whole = []
         self.w_flags = []
@@ -123,6 +146,7 @@ class TractParser:
 
         # lot_blocks_and_leading_aliquots will contain 2-tuples of:
         #   (<text block for lots>, <text block for leading aliquot, if any>)
+        lots_start = start_timing()
         lot_blocks_and_leading_aliquots = []
         remaining_text = text
         while True:
@@ -159,16 +183,20 @@ class TractParser:
                 for idx in range(unpacker.aliquots_through):
                     new_lots[idx] = f"{leading_aliquot} of {new_lots[idx]}"
 
-            self.lots.extend(new_lots)
+            # Lots and QQs recur across many tracts, so intern them to
+            # share one string object for each.
+            self.lots.extend(map(sys.intern, new_lots))
             for lot_, acres_ in unpacker.lot_acres.items():
                 if lot_ in self.lot_acres:
                     flag = f"dup_lot_acreage<{lot_}({self.lot_acres[lot_]})>"
                     self.w_flags.append(flag)
                     self.w_flag_lines.append((flag, flag))
                 self.lot_acres[lot_] = acres_
+        stop_timing('tract_parse.lots', lots_start)
 
         # Get a list of all of the aliquots strings, so we can parse them
         # individually.
+        aliquots_start = start_timing()
         aliquot_blocks = []
         remaining_text = text
         while True:
@@ -197,6 +225,7 @@ class TractParser:
             if all_mo['context'] is None:
                 # If we ONLY found 'ALL', then we're good.
                 aliquot_blocks.append(_ALL)
+        stop_timing('tract_parse.aliquots', aliquots_start)
 
         # Now that we have list of text blocks, each containing a separate
         # aliquot, parse each of them into QQ's (or smaller, if further
@@ -207,13 +236,33 @@ class TractParser:
         if qq_depth is not None:
             qq_depth_min = qq_depth_max = qq_depth
         for txt in aliquot_blocks:
-            new_qqs = parse_aliquot(
-                txt, qq_depth_min, qq_depth_max, qq_depth, break_halves)
-            self.qqs.extend(new_qqs)
+            start = start_timing()
+            if self.symbolic_qq:
+                # Leave the deepest subdivisions unexpanded.
+                self.qqs.extend_blocks(parse_aliquot_blocks(
+                    txt, qq_depth_min, qq_depth_max, qq_depth, break_halves))
+            else:
+                new_qqs = parse_aliquot(
+                    txt, qq_depth_min, qq_depth_max, qq_depth, break_halves)
+                self.qqs.extend(map(sys.intern, new_qqs))
+            stop_timing('parse_aliquot', start)
 
-        lots_qqs = self.lots + self.qqs
         self.gen_flags()
-        return lots_qqs
+        self.w_flags = _intern_flags(self.w_flags)
+        self.w_flag_lines = _intern_flag_lines(self.w_flag_lines)
+        return self.lots_qqs
+
+    @property
+    def lots_qqs(self):
+        """
+        A combined list of lots + QQs. (A ``SymbolicQQList``, if parsing
+        with ``symbolic_qq``, so that the QQs are not expanded.)
+        """
+        if self.symbolic_qq:
+            lots_qqs = SymbolicQQList((lot, 0) for lot in self.lots)
+            lots_qqs.extend(self.qqs)
+            return lots_qqs
+        return self.lots + self.qqs
 
     def gen_flags(self):
         """
@@ -224,17 +273,22 @@ class TractParser:
         :return: None.
         """
         def find_duplicates(lst):
-            last = len(lst)
+            # Report each element that occurs again later in the list.
+            # (Scan backwards with a set, to stay linear in the length.)
+            seen = set()
             duplicates = []
-            for i, elem in enumerate(lst, start=1):
-                if i == last:
-                    break
-                if elem in lst[i:]:
+            for elem in reversed(lst):
+                if elem in seen:
                     duplicates.append(elem)
+                seen.add(elem)
+            duplicates.reverse()
             return duplicates
 
         dup_lots = find_duplicates(self.lots)
-        dup_qqs = find_duplicates(self.qqs)
+        if self.symbolic_qq:
+            dup_qqs = self.qqs.duplicates()
+        else:
+            dup_qqs = find_duplicates(self.qqs)
 
         if dup_lots:
             flag = f"dup_lot<{','.join(dup_lots)}>"
@@ -2,6 +2,7 @@
 import re
 
 from ..rgxlib import *
+from ..profiling.profiling import timed
 
 # Clean aliquot abbreviations with fraction.
 NE_FRAC = 'NE¼'
@@ -65,6 +66,7 @@ class TractPreprocessor:
         self.clean_qq = clean_qq
         self.text = self.preprocess(orig_text)
 
+    @timed('tract_preprocess')
     def preprocess(self, text, clean_qq=None, commit=False) -> str:
         if clean_qq is None:
             clean_qq = self.clean_qq
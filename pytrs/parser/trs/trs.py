@@ -5,6 +5,9 @@ TRS class to represent a unique Twp/Rge/Sec combination.
 
 
 import re
+import sys
+import threading
+from collections import OrderedDict
 
 from ..rgxlib import *
 from ..unpack import ocr_scrub_alpha_to_num
@@ -16,6 +19,33 @@ from ..config import (
 
 MC = MasterConfig
 
+# Layout of the packed integer encoding of a Twp/Rge/Sec (see
+# ``TRS.to_int()``), from the least significant bit:
+#   bits 0-6:   Sec number (0-99), or one of the Sec codes below.
+#   bits 7-16:  Rge number (0-999), or 0 if undefined or error.
+#   bits 17-18: Rge direction ('e', 'w', undefined, or error).
+#   bits 19-28: Twp number (0-999), or 0 if undefined or error.
+#   bits 29-30: Twp direction ('n', 's', undefined, or error).
+_SEC_BITS = 7
+_NUM_BITS = 10
+_DIR_BITS = 2
+_RGE_SHIFT = _SEC_BITS
+_EW_SHIFT = _RGE_SHIFT + _NUM_BITS
+_TWP_SHIFT = _EW_SHIFT + _DIR_BITS
+_NS_SHIFT = _TWP_SHIFT + _NUM_BITS
+_PACKED_LIMIT = 1 << (_NS_SHIFT + _DIR_BITS)
+_SEC_MASK = (1 << _SEC_BITS) - 1
+_NUM_MASK = (1 << _NUM_BITS) - 1
+_DIR_MASK = (1 << _DIR_BITS) - 1
+_MAX_NUM = 999
+_MAX_SEC = 99
+_SEC_UNDEF_CODE = _SEC_MASK - 1
+_SEC_ERR_CODE = _SEC_MASK
+_DIR_UNDEF_CODE = 2
+_DIR_ERR_CODE = 3
+_NS_CODES = ('n', 's')
+_EW_CODES = ('e', 'w')
+
 
 def compile_trs_unpacker_regex(
         twp_rgx, err_twp, undef_twp, rge_rgx, err_rge, undef_rge,
@@ -115,8 +145,18 @@ class TRS:
     # are only ever accessed by properties that protect them (e.g.,
     # ``Tract.twp``, ``TRS.twprge``, etc.) -- so in theory, somebody
     # would really have to want to mess things up in order to do so.
+    # The cache is bounded by ``MasterConfig.trs_cache_maxsize``, beyond
+    # which the least-recently-used entries are discarded.
     _USE_CACHE = True
-    __CACHE = {}
+    __CACHE = OrderedDict()
+    __CACHE_LOCK = threading.Lock()
+    # Incremented whenever the cache is cleared, so that a breakdown
+    # begun before then (possibly under different settings, see
+    # ``TRS._recompile()``) is not added to the cache afterward.
+    _cache_generation = 0
+    _cache_hits = 0
+    _cache_misses = 0
+    _cache_evictions = 0
 
     def __init__(self, trs: str = None):
         if trs in ['', None]:
@@ -154,7 +194,7 @@ class TRS:
     def trs(self, new_trs):
         # If we've already broken down this trs into a dict, just
         # reuse it.
-        self.__trs_dict = TRS.__CACHE.get(new_trs, None)
+        self.__trs_dict = TRS._cache_lookup(new_trs)
         if not self.__trs_dict:
             self.__trs_dict = TRS._cache_trs_to_dict(new_trs)
 
@@ -536,11 +576,64 @@ class TRS:
         # protected attributes (e.g,. ``Tract.twp``, ``TRS.twprge``,
         # etc.) -- although the cache itself could be accessed and
         # modified.
-        dct = TRS.trs_to_dict(trs)
+        # (The fast path interns its own strings.)
+        generation = TRS._cache_generation
+        dct = TRS._unpack_canonical(trs)
+        if dct is None:
+            dct = TRS.trs_to_dict(trs)
+            # Intern the strings, so that a breakdown that is rebuilt
+            # after being evicted from the cache still shares its
+            # strings with any objects that hold the earlier one.
+            for key, value in dct.items():
+                if isinstance(value, str):
+                    dct[key] = sys.intern(value)
         if TRS._USE_CACHE:
-            TRS.__CACHE[trs] = dct
+            TRS._cache_store(trs, dct, generation)
+        return dct
+
+    @staticmethod
+    def _cache_lookup(trs):
+        """
+        INTERNAL USE:
+        Get the dict for ``trs`` from the ``TRS.__CACHE`` (marking it as
+        recently used), or ``None`` if it is not there.
+        """
+        if not TRS._USE_CACHE:
+            return None
+        with TRS.__CACHE_LOCK:
+            dct = TRS.__CACHE.get(trs, None)
+            if dct is None:
+                TRS._cache_misses += 1
+                return None
+            TRS.__CACHE.move_to_end(trs)
+            TRS._cache_hits += 1
         return dct
 
+    @staticmethod
+    def _cache_store(trs, dct, generation=None):
+        """
+        INTERNAL USE:
+        Add the ``dct`` for ``trs`` to the ``TRS.__CACHE``, and discard
+        the least-recently-used entries beyond
+        ``MasterConfig.trs_cache_maxsize``.
+
+        If ``generation`` is specified but the cache has been cleared
+        since then, the ``dct`` is not added.
+        """
+        maxsize = MC.trs_cache_maxsize
+        with TRS.__CACHE_LOCK:
+            if generation is not None and generation != TRS._cache_generation:
+                return None
+            if trs in TRS.__CACHE:
+                TRS.__CACHE.move_to_end(trs)
+            TRS.__CACHE[trs] = dct
+            if maxsize is None:
+                return None
+            while len(TRS.__CACHE) > max(maxsize, 0):
+                TRS.__CACHE.popitem(last=False)
+                TRS._cache_evictions += 1
+        return None
+
     @staticmethod
     def trs_to_dict(trs) -> dict:
         """
@@ -575,6 +668,11 @@ class TRS:
         """
         if isinstance(trs, TRS):
             trs = trs.trs
+        # Nearly every Twp/Rge/Sec is already in the canonical format
+        # (because pyTRS generated it), so try that first.
+        dct = TRS._unpack_canonical(trs)
+        if dct is not None:
+            return dct
         dct = {
             'trs': MC._ERR_TRS,
             'twp': MC._ERR_TWP,
@@ -635,14 +733,257 @@ class TRS:
 
         return dct
 
+    @staticmethod
+    def _unpack_canonical(trs):
+        """
+        INTERNAL USE:
+        Break apart a Twp/Rge/Sec that is in the canonical pyTRS format
+        (e.g., ``'154n97w14'``) into the same dict as
+        ``TRS.trs_to_dict()``, without using the regex. The strings in
+        the dict are interned.
+
+        :return: The dict, or ``None`` if ``trs`` is anything other than
+         a fully defined Twp/Rge/Sec in the canonical format (e.g., an
+         error or undefined value, uppercase, or extra characters), which
+         must be left to the regex.
+        """
+        if (type(trs) is not str
+                or not 6 <= len(trs) <= 10
+                or not trs.isascii()):
+            return None
+        sec = trs[-2:]
+        if not sec.isdigit():
+            return None
+        # The Twp number is 1 to 3 digits, followed by 'n' or 's'.
+        for i in (1, 2, 3):
+            ns = trs[i]
+            if ns == 'n' or ns == 's':
+                break
+        else:
+            return None
+        twp_num = trs[:i]
+        rge = trs[i + 1:-2]
+        rge_num = rge[:-1]
+        ew = rge[-1:]
+        if (not twp_num.isdigit()
+                or not rge_num.isdigit()
+                or len(rge_num) > 3
+                or ew not in _EW_CODES):
+            return None
+        return {
+            'trs': sys.intern(trs),
+            'twp': sys.intern(trs[:i + 1]),
+            'twp_num': int(twp_num),
+            'twp_ns': ns,
+            'twp_undef': False,
+            'rge': sys.intern(rge),
+            'rge_num': int(rge_num),
+            'rge_ew': ew,
+            'rge_undef': False,
+            'sec': sys.intern(sec),
+            'sec_num': int(sec),
+            'sec_undef': False
+        }
+
+    def to_int(self) -> int:
+        """
+        Encode this Twp/Rge/Sec as a single non-negative integer (less
+        than ``2 ** 31``, so that it fits in an ``int32``), for compact
+        storage and fast comparison. Decode it with ``TRS.from_int()``.
+
+        Sorting the encoded integers sorts the Twp/Rge/Sec by Twp
+        direction (N before S), then Twp number, then Rge direction (E
+        before W), then Rge number, then Sec number. Undefined and error
+        values sort after all others.
+
+        .. note::
+            Any leading zeros in the Twp or Rge number (e.g., the
+            ``'012n'`` in ``'012n97w14'``) are not encoded.
+
+        :return: The encoded int.
+        """
+        dct = self.__trs_dict
+
+        def encode_dir(direction, undef, codes):
+            if direction in codes:
+                return codes.index(direction)
+            return _DIR_UNDEF_CODE if undef else _DIR_ERR_CODE
+
+        ns = encode_dir(dct['twp_ns'], dct['twp_undef'], _NS_CODES)
+        ew = encode_dir(dct['rge_ew'], dct['rge_undef'], _EW_CODES)
+        sec = dct['sec_num']
+        if sec is None:
+            sec = _SEC_UNDEF_CODE if dct['sec_undef'] else _SEC_ERR_CODE
+        return (
+            (ns << _NS_SHIFT)
+            | ((dct['twp_num'] or 0) << _TWP_SHIFT)
+            | (ew << _EW_SHIFT)
+            | ((dct['rge_num'] or 0) << _RGE_SHIFT)
+            | sec
+        )
+
+    @staticmethod
+    def int_to_trs(packed: int) -> str:
+        """
+        Decode an integer from ``TRS.to_int()`` into a Twp/Rge/Sec string
+        in the standard pyTRS format.
+
+        :param packed: The encoded int.
+        :return: The Twp/Rge/Sec as a string.
+        """
+        if not 0 <= packed < _PACKED_LIMIT:
+            raise ValueError(f"Not an encoded Twp/Rge/Sec: {packed!r}")
+
+        def decode(direction, num, codes, undef, err):
+            if direction < len(codes) and num <= _MAX_NUM:
+                return f"{num}{codes[direction]}"
+            if direction == _DIR_UNDEF_CODE and num == 0:
+                return undef
+            if direction == _DIR_ERR_CODE and num == 0:
+                return err
+            raise ValueError(f"Not an encoded Twp/Rge/Sec: {packed!r}")
+
+        twp = decode(
+            (packed >> _NS_SHIFT) & _DIR_MASK,
+            (packed >> _TWP_SHIFT) & _NUM_MASK,
+            _NS_CODES, MC._UNDEF_TWP, MC._ERR_TWP)
+        rge = decode(
+            (packed >> _EW_SHIFT) & _DIR_MASK,
+            (packed >> _RGE_SHIFT) & _NUM_MASK,
+            _EW_CODES, MC._UNDEF_RGE, MC._ERR_RGE)
+        sec = packed & _SEC_MASK
+        if sec == _SEC_UNDEF_CODE:
+            sec = MC._UNDEF_SEC
+        elif sec == _SEC_ERR_CODE:
+            sec = MC._ERR_SEC
+        elif sec <= _MAX_SEC:
+            sec = f"{sec:02d}"
+        else:
+            raise ValueError(f"Not an encoded Twp/Rge/Sec: {packed!r}")
+        return f"{twp}{rge}{sec}"
+
+    @staticmethod
+    def from_int(packed: int):
+        """
+        Create a new ``TRS`` object from an integer that was encoded by
+        ``TRS.to_int()``.
+
+        :param packed: The encoded int.
+        :return: The new ``TRS`` object.
+        """
+        return TRS(TRS.int_to_trs(packed))
+
     @classmethod
     def _clear_cache(cls):
         """
         INTERNAL USE:
-        Clear the ``TRS.__CACHE`` dict.
+        Clear the ``TRS.__CACHE`` dict (and reset its statistics).
         :return:
         """
-        cls.__CACHE = {}
+        with TRS.__CACHE_LOCK:
+            TRS.__CACHE.clear()
+            TRS._cache_generation += 1
+            TRS._cache_hits = 0
+            TRS._cache_misses = 0
+            TRS._cache_evictions = 0
+        return None
+
+    @classmethod
+    def _cached_trs(cls) -> list:
+        """
+        INTERNAL USE:
+        Get a list of the Twp/Rge/Sec currently in the ``TRS.__CACHE``
+        (from least- to most-recently used).
+        """
+        with TRS.__CACHE_LOCK:
+            return list(TRS.__CACHE)
+
+    @staticmethod
+    def cache_info() -> dict:
+        """
+        Get the statistics for the cache of Twp/Rge/Sec breakdowns that
+        is shared by all ``TRS`` and ``Tract`` objects, as a dict with
+        keys ``'hits'``, ``'misses'``, ``'evictions'``, ``'size'``, and
+        ``'maxsize'``.
+
+        (The maximum size is controlled by
+        ``MasterConfig.trs_cache_maxsize``.)
+        """
+        with TRS.__CACHE_LOCK:
+            return {
+                'hits': TRS._cache_hits,
+                'misses': TRS._cache_misses,
+                'evictions': TRS._cache_evictions,
+                'size': len(TRS.__CACHE),
+                'maxsize': MC.trs_cache_maxsize,
+            }
+
+    @staticmethod
+    def seed_cache(
+            twps,
+            rges,
+            secs=range(1, 37),
+            default_ns=None,
+            default_ew=None) -> int:
+        """
+        Add every combination of the specified Townships, Ranges, and
+        Sections to the cache of Twp/Rge/Sec breakdowns, so that they
+        will not need to be broken down when first encountered. Useful
+        for pre-seeding the cache with the legal Twp/Rge/Sec's of the
+        state (or other area) whose data is to be parsed::
+
+            # T140N-T163N, R74W-R106W, all sections.
+            TRS.seed_cache(range(140, 164), range(74, 107))
+
+        .. note::
+            If there are more combinations than
+            ``MasterConfig.trs_cache_maxsize``, only the last ones will
+            remain in the cache. Raise that limit first, if needed.
+
+        :param twps: An iterable of Townships, each as a str (e.g.,
+         ``'154n'``) or an int (in which case the N/S will come from
+         ``default_ns``).
+        :param rges: An iterable of Ranges, each as a str (e.g.,
+         ``'97w'``) or an int (in which case the E/W will come from
+         ``default_ew``).
+        :param secs: An iterable of Sections (as ints or str). Defaults
+         to all 36 sections.
+        :param default_ns: How to interpret townships for which
+         direction was not specified -- i.e. either ``'n'`` or ``'s'``.
+         (Defaults to ``MasterConfig.default_ns``.)
+        :param default_ew: How to interpret ranges for which direction
+         was not specified -- i.e. either ``'e'`` or ``'w'``. (Defaults
+         to ``MasterConfig.default_ew``.)
+        :return: The number of Twp/Rge/Sec combinations seeded.
+        """
+        rges = list(rges)
+        secs = list(secs)
+        all_trs = [
+            TRS.construct_trs(twp, rge, sec, default_ns, default_ew)
+            for twp in twps
+            for rge in rges
+            for sec in secs
+        ]
+        TRS._warm_cache(all_trs)
+        return len(all_trs)
+
+    @classmethod
+    def _warm_cache(cls, trs_list):
+        """
+        INTERNAL USE:
+        Break down each Twp/Rge/Sec in ``trs_list`` and add it to the
+        ``TRS.__CACHE`` (unless it is already there).
+        :param trs_list: An iterable of Twp/Rge/Sec strings in the
+         standard pyTRS format.
+        :return: None
+        """
+        if not TRS._USE_CACHE:
+            return None
+        for trs in trs_list:
+            # Checked without the lock; at worst, a Twp/Rge/Sec that
+            # another thread is caching will be broken down twice.
+            if trs not in TRS.__CACHE:
+                TRS._cache_trs_to_dict(trs)
         return None
 
     @classmethod
@@ -691,7 +1032,8 @@ class TRS:
         MC._UNDEF_TRS = f"{MC._UNDEF_TWPRGE}{MC._UNDEF_SEC}"
 
         # Clear the cache, because the same string would not necessarily
-        # result in the same output dict anymore.
+        # result in the same output dict anymore. (Any breakdown that is
+        # underway with the old settings will not be cached.)
         cls._clear_cache()
 
         return new_rgx
@@ -4,6 +4,7 @@ import csv
 from pathlib import Path
 
 from ..parser import Tract, TractList
+from ..parser.tract.compact_tract import CompactTract
 from ..utils import gen_uid, flatten
 
 
@@ -138,7 +139,9 @@ class TractWriter:
 
         :param to_write: a ``Tract``, ``PLSSDesc`` , ``TractList``, or
          an iterable container of any number and combination of those
-         object types.
+         object types. (Unless generating UIDs, this may also be a
+         generator -- e.g., from ``pytrs.iter_parse()`` -- which will be
+         written lazily.)
 
         :param plus_cols: (Optional) a list of additional data to write
          for each of the written rows. (Will write the same data for
@@ -152,24 +155,71 @@ class TractWriter:
             self.uid += 1
             return 0
         # If we're generating UID's, we need to know how many we'll
-        # write in total, so get a TractList.
-        tl = TractList.from_multiple(to_write)
-        total_to_write = len(tl)
+        # write in total, so get a TractList. We also do this for any
+        # container, so that every element is type-checked before
+        # anything is written. Only a generator (or other iterator) is
+        # written lazily, one Tract at a time.
+        total_to_write = None
+        if self.gen_uids or not TractWriter._is_iterator(to_write):
+            tracts = TractList.from_multiple(to_write)
+            total_to_write = len(tracts)
+        else:
+            tracts = TractWriter._iter_tracts(to_write)
         written = 0
-        for tract in tl:
-            row = tract.to_list(self.attributes)
-            if plus_cols:
-                row.extend(plus_cols)
-            if self.gen_uids:
-                uid = gen_uid(
-                    self.uid, written + 1, total_to_write, just=self.uid_just)
-                row.append(uid)
-            row = TractWriter._scrub_row(row)
-            self.writer.writerow(row)
-            written += 1
-        self.uid += 1
+        try:
+            for tract in tracts:
+                row = tract.to_list(self.attributes)
+                if plus_cols:
+                    row.extend(plus_cols)
+                if self.gen_uids:
+                    uid = gen_uid(
+                        self.uid, written + 1, total_to_write,
+                        just=self.uid_just)
+                    row.append(uid)
+                row = TractWriter._scrub_row(row)
+                self.writer.writerow(row)
+                written += 1
+        finally:
+            # Even if a bad element was encountered partway through a
+            # generator, the rows before it have been written.
+            self.uid += 1
         return written
 
+    @staticmethod
+    def _is_iterator(obj) -> bool:
+        """
+        INTERNAL USE:
+        Check whether ``obj`` is an iterator (e.g., a generator), which
+        can be iterated over only once.
+        """
+        try:
+            return iter(obj) is obj
+        except TypeError:
+            return False
+
+    @staticmethod
+    def _iter_tracts(to_write):
+        """
+        INTERNAL USE:
+        Generate the ``Tract`` objects in ``to_write`` (a ``Tract``,
+        ``PLSSDesc``, ``TractList``, or any iterable of those types,
+        including a generator), without collecting them into a list.
+        """
+        if isinstance(to_write, (Tract, CompactTract)):
+            yield to_write
+            return
+        err_msg = (
+            f"Cannot write {type(to_write)}. Must be a `Tract`, "
+            f"`PLSSDesc`, `TractList`, or an iterable of those types.")
+        if isinstance(to_write, str):
+            raise TypeError(err_msg)
+        try:
+            elements = iter(to_write)
+        except TypeError:
+            raise TypeError(err_msg)
+        for obj in elements:
+            yield from TractWriter._iter_tracts(obj)
+
     @staticmethod
     def _scrub_row(data):
         """
@@ -4,6 +4,8 @@
 Misc. tools for parsing, etc.
 """
 
+import sys
+
 
 def num_to_alpha(num):
     """
@@ -85,6 +87,29 @@ def _confirm_list_of_strings(*attributes) -> list:
     return attributes
 
 
+def _intern_flags(flags) -> list:
+    """
+    INTERNAL USE:
+    Get a new list of the flags, with each flag string interned, so
+    that every ``Tract`` (and ``PLSSDesc``) carrying an identical flag
+    holds the same string object.
+    """
+    return [
+        sys.intern(flag) if isinstance(flag, str) else flag
+        for flag in flags
+    ]
+
+
+def _intern_flag_lines(flag_lines) -> list:
+    """
+    INTERNAL USE:
+    Get a new list of the flag lines (2-tuples of flag and context),
+    with each string interned. (A flag line whose context is the flag
+    itself will therefore hold only one string.)
+    """
+    return [tuple(_intern_flags(line)) for line in flag_lines]
+
+
 __all__ = [
     'num_to_alpha',
     'alpha_to_num',
@@ -191,6 +191,8 @@ def parse_csv(
             pass
         if config is None:
             config = ''
+        elif isinstance(config, pytrs.Config):
+            config = config.decompile_to_text()
 
         # If user has specified a column for layout, add that layout to
         # the end of the `config` string.
@@ -213,8 +215,12 @@ def parse_csv(
             # of `PLSSDesc.tracts_to_list()`.
             all_tract_data = [t.to_list(attributes)]
         else:
-            d = pytrs.PLSSDesc(desc_text, config=config, parse_qq=True)
-            all_tract_data = d.tracts_to_list(attributes)
+            # Stream the Tracts straight out of the parser, rather than
+            # keeping a `PLSSDesc` (and its `TractList`) for every row.
+            all_tract_data = [
+                t.to_list(attributes)
+                for t in pytrs.iter_parse([desc_text], f"{config},parse_qq")
+            ]
 
         total_tracts = len(all_tract_data)
 
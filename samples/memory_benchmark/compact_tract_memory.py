@@ -0,0 +1,75 @@
+# Copyright (c) 2020-2022, James P. Imes, all rights reserved.
+
+"""
+Measure the memory held per tract by a ``TractList`` of full ``Tract``
+objects, versus the same tracts converted to ``CompactTract`` objects
+with ``TractList.to_compact()``.
+
+Run from the command line::
+
+    python compact_tract_memory.py [number_of_descriptions]
+"""
+
+import gc
+import sys
+import tracemalloc
+
+import pytrs
+
+
+__version__ = '0.1.0'
+__version_date__ = '10/16/2026'
+__author__ = 'James P. Imes'
+__email__ = 'jamesimes@gmail.com'
+
+
+SAMPLE_DESCS = (
+    'T154N-R97W Sec 14: NE/4, Lots 1 - 3, S/2NE/4, Sec 15: W/2',
+    'T154N-R97W Sec 22: N/2SW/4, Sec 23: Lots 1(40.12), 2, E/2NW/4',
+    'T153N-R96W Sec 1: ALL, Sec 2: SE/4NE/4, Lot 4',
+)
+
+
+def measure(num_descs=3000):
+    """
+    Parse ``num_descs`` descriptions (with ``parse_qq``), and return
+    a 3-tuple of the number of tracts, the bytes held per full
+    ``Tract``, and the bytes held per ``CompactTract``.
+    """
+    # Warm up the TRS cache, etc., so that it is not counted below.
+    for txt in SAMPLE_DESCS:
+        pytrs.PLSSDesc(txt, parse_qq=True)
+    gc.collect()
+    tracemalloc.start()
+
+    start = tracemalloc.get_traced_memory()[0]
+    full = pytrs.TractList()
+    for i in range(num_descs):
+        txt = SAMPLE_DESCS[i % len(SAMPLE_DESCS)]
+        full.extend(pytrs.PLSSDesc(txt, parse_qq=True).tracts)
+    gc.collect()
+    full_bytes = tracemalloc.get_traced_memory()[0] - start
+
+    start = tracemalloc.get_traced_memory()[0]
+    compact = full.to_compact()
+    gc.collect()
+    compact_bytes = tracemalloc.get_traced_memory()[0] - start
+
+    tracemalloc.stop()
+    num_tracts = len(compact)
+    return num_tracts, full_bytes / num_tracts, compact_bytes / num_tracts
+
+
+def main():
+    num_descs = 3000
+    if len(sys.argv) > 1:
+        num_descs = int(sys.argv[1])
+    num_tracts, per_full, per_compact = measure(num_descs)
+    print(f"Tracts:                  {num_tracts}")
+    print(f"Bytes per Tract:         {per_full:,.0f}")
+    print(f"Bytes per CompactTract:  {per_compact:,.0f}")
+    print(f"Reduction:               {1 - per_compact / per_full:.0%}")
+
+
+if __name__ == '__main__':
+    main()
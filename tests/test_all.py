@@ -13,6 +13,8 @@ from test_plss_preprocess import *
 from test_plssdesc_and_parse import *
 from test_trs import *
 from test_containers import *
+from test_tractwriter import *
+from test_benchmarks import *
 
 if __name__ == '__main__':
     unittest.main()
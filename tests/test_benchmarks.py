@@ -0,0 +1,61 @@
+"""
+Tests for the benchmark corpus generator (benchmarks.corpus).
+"""
+
+import unittest
+
+try:
+    from pytrs import PLSSDesc, IMPLEMENTED_LAYOUTS
+    from benchmarks.corpus import (
+        CorpusSpec,
+        generate_corpus,
+    )
+except ImportError:
+    import sys
+
+    sys.path.append('../')
+    from pytrs import PLSSDesc, IMPLEMENTED_LAYOUTS
+    from benchmarks.corpus import (
+        CorpusSpec,
+        generate_corpus,
+    )
+
+
+class CorpusTests(unittest.TestCase):
+
+    def test_deterministic(self):
+        self.assertEqual(generate_corpus(50, seed=3), generate_corpus(50, seed=3))
+        self.assertNotEqual(generate_corpus(50, seed=3), generate_corpus(50, seed=4))
+
+    def test_layouts_deduced(self):
+        corpus = generate_corpus(100, seed=0)
+        self.assertEqual(
+            set(IMPLEMENTED_LAYOUTS), {layout for _, layout in corpus})
+        for text, layout in corpus:
+            desc = PLSSDesc(text)
+            self.assertEqual(layout, desc.current_layout, text)
+            if layout != 'copy_all':
+                self.assertEqual([], desc.e_flags, text)
+
+    def test_spec(self):
+        spec = CorpusSpec(
+            twprges=(2, 2),
+            secs_per_twprge=(3, 3),
+            multisec_chance=0,
+            lots_chance=1,
+            lot_acres_chance=1,
+            lots_per_sec=(2, 2),
+            aliquots_per_sec=(1, 1),
+            aliquot_depth=(1, 1),
+        )
+        corpus = generate_corpus(20, layouts=['TRS_desc'], spec=spec)
+        for text, _ in corpus:
+            desc = PLSSDesc(text, config='parse_qq,clean_qq')
+            self.assertEqual(6, len(desc.tracts), text)
+            for tract in desc:
+                self.assertEqual(2, len(tract.lot_acres), text)
+                self.assertEqual(4, len(tract.qqs), text)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,6 +3,20 @@ Tests for the pytrs.parser.containers module (TractList and TRSList).
 """
 
 import unittest
+from unittest import mock
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
 
 try:
     from pytrs import Tract, PLSSDesc
@@ -10,6 +24,13 @@ try:
         TractList,
         TRSList,
     )
+    from pytrs.parser.containers.trs_index import (
+        TRSIndex,
+        trs_to_grid,
+        grid_to_trs,
+    )
+    from pytrs.parser.tract import CompactTract
+    from pytrs.parser.containers import columns
     from pytrs.utils import flatten
 except ImportError:
     import sys
@@ -20,6 +41,13 @@ except ImportError:
         TractList,
         TRSList,
     )
+    from pytrs.parser.containers.trs_index import (
+        TRSIndex,
+        trs_to_grid,
+        grid_to_trs,
+    )
+    from pytrs.parser.tract import CompactTract
+    from pytrs.parser.containers import columns
     from pytrs.utils import flatten
 
 SAMPLE_PLSSDESC_1 = PLSSDesc(
@@ -146,6 +174,24 @@ class TractListTests(unittest.TestCase):
             tl.custom_sort(key=sort_key)
             self.assertEqual(expected_results, flatten(tl.tracts_to_list('trs')))
 
+    def test_custom_sort_composite(self):
+        trs = [
+            '154n97w14', '154s97e01', 'XXXzXXXzXX', '12n3w36', '154n97e14',
+            '12s3w01', '154n97w01', '12n97wXX']
+        # Equivalent to sorting by each key in turn (left-to-right).
+        tl = TRSList(trs)
+        tl.sort(key=lambda t: -(t.sec_num or 37))
+        tl.sort(key=lambda t: (
+            (t.rge_num or 98) * (-1 if t.rge_ew == 'e' else 1)))
+        tl.sort(key=lambda t: (
+            (t.twp_num or 155) * (-1 if t.twp_ns == 'n' else 1)))
+        expected = tl.to_strings()
+        tl = TRSList(trs)
+        tl.custom_sort('s.rev, r.ew, t.ns')
+        self.assertEqual(expected, tl.to_strings())
+        with self.assertRaises(ValueError):
+            tl.custom_sort('s.ns')
+
     def test_consolidate(self):
         d1 = "T154N-R97W Sec 14: N/2, SE/4, Sec 15: S/2, Lots 5, 3, 1"
         d2 = "T154n-R97W Sec 14: SW/4"
@@ -198,6 +244,171 @@ class TractListTests(unittest.TestCase):
             self.assertEqual(desc, tract.desc)
             self.assertEqual(lots_aliquots, tract.lots_aliquots_standard)
 
+    def test_to_compact(self):
+        tl = TractList.from_multiple(ALL_SAMPLES)
+        compact = tl.to_compact()
+        self.assertEqual(len(tl), len(compact))
+        self.assertTrue(all(isinstance(t, CompactTract) for t in compact))
+        self.assertEqual(tl.quick_desc(), compact.quick_desc())
+        self.assertEqual(
+            tl.tracts_to_list('trs', 'lots_qqs'),
+            compact.tracts_to_list('trs', 'lots_qqs'))
+        # Sorting by creation order is unaffected by the conversion.
+        tl.custom_sort('i', reverse=True)
+        compact.custom_sort('i', reverse=True)
+        self.assertEqual(tl.quick_desc(), compact.quick_desc())
+        full = compact.to_full()
+        self.assertTrue(all(isinstance(t, Tract) for t in full))
+        self.assertEqual(tl.quick_desc(), full.quick_desc())
+
+    def test_filter_duplicates(self):
+        t1 = Tract('Lots 1 - 3, S/2NE/4', '154n97w14', parse_qq=True)
+        t2 = Tract('Lot 3, S/2NE/4, Lots 1, 2', '154n97w14', parse_qq=True)
+        t3 = Tract('Lots 1 - 3,  S/2NE/4 ', '154n97w14', parse_qq=True)
+        t4 = Tract('Lots 1 - 3, S/2NE/4', '154n97w15', parse_qq=True)
+        tl = TractList([t1, t2, t3, t4, t1])
+        self.assertEqual([t1], list(tl.filter_duplicates()))
+        self.assertEqual(
+            [t2, t3, t1], list(tl.filter_duplicates('lots_qqs')))
+        # (Only leading/trailing whitespace is ignored in the desc.)
+        self.assertEqual([t1], list(tl.filter_duplicates('desc')))
+        t5 = Tract(' Lots 1 - 3, S/2NE/4  ', '154n97w14', parse_qq=True)
+        self.assertEqual(
+            [t5], list(TractList([t1, t5]).filter_duplicates('desc')))
+        dups = tl.filter_duplicates('trs', drop=True)
+        self.assertEqual([t2, t3, t1], list(dups))
+        self.assertEqual([t1, t4], list(tl))
+
+    def test_filter_duplicates_edited_in_place(self):
+        t1 = Tract('NE/4NE/4', '154n97w14', parse_qq=True)
+        t2 = Tract('NW/4NW/4', '154n97w14', parse_qq=True)
+        tl = TractList([t1, t2])
+        self.assertEqual(0, len(tl.filter_duplicates('lots_qqs')))
+        t1.qqs[0] = 'NWNW'
+        self.assertEqual([t2], list(tl.filter_duplicates('lots_qqs')))
+
+    def test_fingerprint_collision(self):
+        t1 = Tract('NE/4NE/4', '154n97w14', parse_qq=True)
+        t2 = Tract('NW/4NW/4', '154n97w14', parse_qq=True)
+        t3 = Tract('NE/4NE/4', '154n97w14', parse_qq=True)
+        # Force every tract to have the same fingerprint.
+        collide = property(lambda self: 0)
+        with mock.patch.object(Tract, 'lots_qqs_fingerprint', collide):
+            tl = TractList([t1, t2, t3])
+            dups = tl.filter_duplicates('lots_qqs', drop=True)
+            self.assertEqual([t3], list(dups))
+            self.assertEqual([t1, t2], list(tl))
+            consolidated = TractList([t1, t2, t3]).consolidate()
+        self.assertEqual(['NENE', 'NWNW'], consolidated[0].qqs)
+
+    def test_filter_duplicates_across_batches(self):
+        seen = set()
+        batch_1 = TractList([
+            Tract('NE/4', '154n97w14', parse_qq=True),
+            Tract('Lots 1 - 3', '154n97w01', parse_qq=True)])
+        batch_2 = TractList([
+            Tract('Lots 3, 2, 1', '154n97w01', parse_qq=True),
+            Tract('NE/4', '154n97w15', parse_qq=True)])
+        self.assertEqual(
+            0, len(batch_1.filter_duplicates('lots_qqs', seen=seen)))
+        dups = batch_2.filter_duplicates('lots_qqs', drop=True, seen=seen)
+        self.assertEqual(['154n97w01'], [t.trs for t in dups])
+        self.assertEqual(['154n97w15'], [t.trs for t in batch_2])
+        self.assertEqual(3, len(seen))
+
+    def test_indexes(self):
+        tl = TractList.from_multiple(ALL_SAMPLES)
+        tl.create_index('trs', 'twprge')
+        self.assertEqual(['trs', 'twprge'], tl.indexed_attributes)
+        self.assertEqual(
+            tl.filter(lambda t: t.trs == '89s3e03'),
+            tl.lookup('trs', '89s3e03'))
+        self.assertEqual(
+            tl.filter(lambda t: t.twprge == '154n97w' and t.sec == '18'),
+            tl.filter({'twprge': '154n97w', 'sec': '18'}))
+        # Indexes stay current through changes to the list.
+        tl.append(Tract('NE/4', '89s3e03'))
+        self.assertEqual(3, len(tl.lookup('trs', '89s3e03')))
+        tl.insert(0, Tract('NW/4', '89s3e03'))
+        tl.custom_sort('s')
+        tl.pop(2)
+        tl[1] = Tract('SE/4', '89s3e03')
+        unindexed = TractList(tl)
+        for att in ('trs', 'twprge'):
+            grouped = tl.group_by(att)
+            expected = unindexed.group_by(att)
+            self.assertEqual(list(expected.keys()), list(grouped.keys()))
+            for k, v in expected.items():
+                self.assertEqual(v, grouped[k])
+        self.assertEqual(
+            unindexed.lookup('trs', '89s3e03'), tl.lookup('trs', '89s3e03'))
+        tl.drop_index()
+        self.assertEqual([], tl.indexed_attributes)
+
+    def test_acreage(self):
+        tl = TractList.from_multiple(ALL_SAMPLES)
+        acreage = tl.acreage()
+        self.assertEqual(len(tl), len(acreage))
+        for tract, acres in zip(tl, acreage):
+            self.assertAlmostEqual(tract.acres, acres)
+        # 160 (NE/4) + 5 * 640 (ALL)
+        self.assertEqual(3360, sum(TractList(SAMPLE_PLSSDESC_1).acreage()))
+        tl = TractList([Tract('Lot 1(38.29), Lot 2(.), SE/4', parse_qq=True)])
+        self.assertAlmostEqual(198.29, tl.acreage()[0])
+        self.assertEqual(0, len(TractList().acreage()))
+
+    def test_to_columns(self):
+        tl = TractList.from_multiple(ALL_SAMPLES)
+        atts = ['trs', 'twp_num', 'twp_ns', 'rge_ew', 'sec_num', 'qqs', 'acres']
+        columns = tl.to_columns(*atts)
+        self.assertEqual(atts, list(columns.keys()))
+        as_dicts = tl.tracts_to_dict('trs', 'qqs')
+        for i, dct in enumerate(as_dicts):
+            self.assertEqual(dct['trs'], columns['trs'][i])
+            self.assertEqual(dct['qqs'], list(columns['qqs'][i]))
+        # 154n97w14, ..., and the error Twp/Rge/Sec of SAMPLE_TRACT_4.
+        self.assertEqual(154, columns['twp_num'][0])
+        self.assertEqual(0, columns['twp_ns'][0])
+        self.assertEqual(1, columns['rge_ew'][0])
+        self.assertEqual(14, columns['sec_num'][0])
+        self.assertEqual(0, columns['twp_num'][-1])
+        self.assertEqual(-1, columns['twp_ns'][-1])
+        self.assertAlmostEqual(160, columns['acres'][0])
+        if np is not None:
+            self.assertEqual('int16', columns['twp_num'].dtype)
+            self.assertEqual('int8', columns['twp_ns'].dtype)
+            self.assertEqual('int8', columns['sec_num'].dtype)
+            self.assertEqual(object, columns['qqs'].dtype)
+        empty = TractList().to_columns('trs', 'twp_num')
+        self.assertEqual(0, len(empty['trs']))
+        self.assertEqual(0, len(empty['twp_num']))
+
+    @unittest.skipIf(pd is None, "pandas is not installed")
+    def test_to_pandas(self):
+        tl = TractList.from_multiple(ALL_SAMPLES)
+        df = tl.to_pandas('trs', 'twp_num', 'twp_ns', 'desc')
+        self.assertEqual(len(tl), len(df))
+        self.assertEqual('category', df['twp_ns'].dtype.name)
+        self.assertEqual('n', df['twp_ns'].iloc[0])
+        self.assertEqual(154, df['twp_num'].iloc[0])
+        self.assertTrue(pd.isna(df['twp_num'].iloc[-1]))
+        self.assertTrue(pd.isna(df['twp_ns'].iloc[-1]))
+
+    @unittest.skipIf(pa is None, "pyarrow is not installed")
+    def test_to_arrow(self):
+        tl = TractList.from_multiple(ALL_SAMPLES)
+        table = tl.to_arrow('trs', 'rge_num', 'rge_ew')
+        self.assertEqual(len(tl), table.num_rows)
+        self.assertEqual(97, table.column('rge_num')[0].as_py())
+        self.assertEqual('w', table.column('rge_ew')[0].as_py())
+        self.assertIsNone(table.column('rge_num')[len(tl) - 1].as_py())
+
+    def test_to_arrow_without_numpy(self):
+        tl = TractList.from_multiple(ALL_SAMPLES)
+        with mock.patch.object(columns, 'np', None):
+            with self.assertRaises(ImportError):
+                tl.to_arrow('trs', 'rge_num')
+
 
 class TRSListTests(unittest.TestCase):
 
@@ -206,6 +417,21 @@ class TRSListTests(unittest.TestCase):
         for i, tract in enumerate(SAMPLE_PLSSDESC_1):
             self.assertEqual(tract.trs, tl[i].trs)
 
+    def test_to_from_ints(self):
+        tl = TRSList.from_multiple(ALL_SAMPLES)
+        ints = tl.to_ints()
+        self.assertTrue(all(isinstance(i, int) for i in ints))
+        self.assertEqual(tl.to_strings(), TRSList.from_ints(ints).to_strings())
+
+    def test_contains_indexed(self):
+        tl = TRSList(SAMPLE_PLSSDESC_1)
+        tl.create_index('trs')
+        self.assertTrue(tl.contains('154n97w14'))
+        self.assertTrue(tl.contains(['154n97w14', '154n97w20'], match_all=True))
+        self.assertFalse(tl.contains(['154n97w14', '1n1w01'], match_all=True))
+        tl.append('1n1w01')
+        self.assertTrue(tl.contains(['154n97w14', '1n1w01'], match_all=True))
+
     def test_from_tractlist(self):
         """
         Creation of TRSList from a TractList.
@@ -261,3 +487,53 @@ class TRSListTests(unittest.TestCase):
             # Verify they're the same length (i.e. nothing in grouped[twprge]
             # that is not also in the list of expected tracts).
             self.assertEqual(len(expected_tract_strs), len(stringified_trses))
+
+class TRSIndexTests(unittest.TestCase):
+
+    def test_grid(self):
+        self.assertEqual((0, 0), trs_to_grid('1n1e31'))
+        self.assertEqual((5, 5), trs_to_grid('1n1e01'))
+        self.assertEqual((0, 4), trs_to_grid('1n1e07'))
+        self.assertEqual((-1, -1), trs_to_grid('1s1w01'))
+        self.assertIsNone(trs_to_grid('154n97w__'))
+        for trs in ('154n97w14', '1s1e36', '12s3w07'):
+            self.assertEqual(trs, grid_to_trs(*trs_to_grid(trs)))
+
+    def test_get(self):
+        index = TRSIndex(SAMPLE_PLSSDESC_2)
+        self.assertIsInstance(index.get('88s3e02'), TractList)
+        self.assertEqual(
+            ['N2NE'], index.get('88s3e02')[0].aliquots)
+        self.assertIn('154n97w01', index)
+        self.assertNotIn('154n97w02', index)
+        self.assertEqual(0, len(index.get('154n97w02')))
+        self.assertEqual(len(SAMPLE_PLSSDESC_2.tracts), len(index))
+
+    def test_border(self):
+        self.assertEqual(
+            ['154n96w06', '154n96w07', '154n97w02', '154n97w11',
+             '154n97w12', '155n96w31', '155n97w35', '155n97w36'],
+            TRSIndex.border('154n97w01'))
+        # A 2-section unit, without corners.
+        self.assertEqual(
+            ['154n97w10', '154n97w11', '154n97w13', '154n97w16',
+             '154n97w22', '154n97w23'],
+            TRSIndex.border(['154n97w14', '154n97w15'], diagonal=False))
+
+    def test_adjacent_and_within(self):
+        index = TRSIndex(
+            PLSSDesc('T154N-R97W Sec 1 - 36: ALL, T155N-R97W Sec 36: ALL'))
+        self.assertEqual(
+            ['154n97w02', '154n97w11', '154n97w12', '155n97w36'],
+            [t.trs for t in index.adjacent('154n97w01')])
+        self.assertEqual(13, len(index.within('154n97w15', 2)))
+        self.assertEqual(
+            12, len(index.within('154n97w15', 2, include_self=False)))
+        self.assertEqual(5, TRSIndex.distance('154n97w14', '154n97w31'))
+
+    def test_from_trs(self):
+        index = TRSIndex(['154n97w01', '154n97w02', 'asdf'])
+        self.assertIsInstance(index.adjacent('154n97w01'), TRSList)
+        self.assertEqual(1, len(index.unlocated))
+        self.assertEqual(
+            ['154n97w02'], index.adjacent('154n97w01').to_strings())
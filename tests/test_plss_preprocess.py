@@ -121,6 +121,55 @@ class PreprocessTest(unittest.TestCase):
             self.assertEqual(expected_clear, clear_pm)
             self.assertEqual(expected_no_pm, no_pm)
 
+    def test_repeated_twprge_preprocess(self):
+        """
+        Each matched Twp/Rge should be cleaned up exactly once, even if
+        the same Twp/Rge appears many times in the text.
+        """
+        txt = ', '.join(['T154N-R97W, Sec 14: NE/4'] * 40)
+        expected = ', '.join(['T154N-R97W Sec 14: NE/4'] * 40)
+        self.assertEqual(expected, PLSSPreprocessor(txt).text)
+
+        txt = '\n'.join(
+            f"Township {twp} North, Range 97 West, Sec 1: ALL"
+            for twp in range(100, 140))
+        expected = '\n'.join(
+            f"T{twp}N-R97W Sec 1: ALL" for twp in range(100, 140))
+        self.assertEqual(expected, PLSSPreprocessor(txt, no_pm=True).text)
+
+    def test_adjacent_twprge_with_pm(self):
+        """
+        A P.M. following one Twp/Rge should not cause the preceding
+        Twp/Rge to be swallowed up with it.
+        """
+        txt = (
+            'T154N-R97W 5th PM\n'
+            'T1S-R1E\n'
+            'T154N-R97W 5th PM\n'
+            'T154N-R97W of the 5th Principal Meridian'
+        )
+        expected = ['T154N-R97W', 'T1S-R1E', 'T154N-R97W', 'T154N-R97W']
+        self.assertEqual(expected, find_twprge(PLSSPreprocessor(txt).text))
+
+        txt = 'T1S-R1E; T2N-R2W 5th PM; T154-R97, 6th P.M.'
+        expected = ['T1S-R1E', 'T2N-R2W', 'T154N-R97W']
+        self.assertEqual(expected, find_twprge(PLSSPreprocessor(txt).text))
+
+    def test_many_twprge_with_pm(self):
+        """
+        Long descriptions should be preprocessed promptly, whether or
+        not they contain principal meridians.
+        """
+        txt = '\n'.join(
+            f"T{twp}N-R97W{pm} Sec 14: NE/4"
+            for twp, pm in zip(range(100, 300), [' 5th PM', ''] * 100))
+        expected = '\n'.join(
+            f"T{twp}N-R97W Sec 14: NE/4" for twp in range(100, 300))
+        self.assertEqual(expected, PLSSPreprocessor(txt).text)
+
+        txt = ', '.join(['T154N-R97W Sec 14: NE/4'] * 200)
+        self.assertEqual(txt, PLSSPreprocessor(txt).text)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -3,23 +3,42 @@ Tests for the pytrs.parser.plssdesc module and submodules (except the
 .plss_preprocess submodule, which has its own tests).
 """
 
+import json
+import sys
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     from pytrs.parser import PLSSDesc
-    from pytrs.parser.plssdesc.plss_parse import PLSSParser
+    from pytrs.parser.plssdesc.plss_parse import PLSSParser, deduce_layout
+    from pytrs.parser.plssdesc.plss_tokenize import PLSSTokenizer
     from pytrs.parser import Tract
+    from pytrs.parser import LiteTract
     from pytrs.parser import MasterConfig
+    from pytrs.parser import Config
+    from pytrs.parser import TractList
+    from pytrs.parser import parse_many
+    from pytrs.parser import iter_parse
+    from pytrs.parser import enable_parse_cache, disable_parse_cache
+    from pytrs.parser import instrument, ParseStats
     from pytrs.utils import flatten
+    from benchmarks.corpus import generate_corpus
 except ImportError:
-    import sys
-
     sys.path.append('../')
     from pytrs.parser import PLSSDesc
-    from pytrs.parser.plssdesc.plss_parse import PLSSParser
+    from pytrs.parser.plssdesc.plss_parse import PLSSParser, deduce_layout
+    from pytrs.parser.plssdesc.plss_tokenize import PLSSTokenizer
     from pytrs.parser import Tract
+    from pytrs.parser import LiteTract
     from pytrs.parser import MasterConfig
+    from pytrs.parser import Config
+    from pytrs.parser import TractList
+    from pytrs.parser import parse_many
+    from pytrs.parser import iter_parse
+    from pytrs.parser import enable_parse_cache, disable_parse_cache
+    from pytrs.parser import instrument, ParseStats
     from pytrs.utils import flatten
+    from benchmarks.corpus import generate_corpus
 
 # All four of these have the same tracts.
 TEST_DESC_MULTI_TRS_DESC = (
@@ -248,6 +267,431 @@ class PLSSParseTests(unittest.TestCase):
             d.sort_tracts(key=sort_key)
             self.assertEqual(expected_results, flatten(d.tracts_to_list('trs')))
 
+    def test_shared_strings(self):
+        txt = "T154N-R97W Sec 14 - 16: NE/4, T155N-R97W Sec 1: NE/4"
+        d1 = PLSSDesc(txt, parse_qq=True)
+        d2 = PLSSDesc(txt, parse_qq=True)
+        tracts = list(d1) + list(d2)
+        # Handed-down flags, and QQs, are the same string objects.
+        flags = {id(t.w_flags[0]) for t in tracts}
+        self.assertEqual(1, len(flags))
+        qqs = {id(t.qqs[0]) for t in tracts}
+        self.assertEqual(1, len(qqs))
+        # Each Tract still has its own flag list.
+        d1[0].w_flags.append('changed')
+        self.assertNotIn('changed', d1[1].w_flags)
+        self.assertNotIn('changed', d1.w_flags)
+        # The original description is not copied.
+        self.assertTrue(all(t.orig_desc is d1.orig_desc for t in d1))
+
+
+class PLSSTokenizerTests(unittest.TestCase):
+
+    def test_tokens(self):
+        txt = "T154N-R97W Sec 14: NE/4, Sec 1 - 3: ALL, T155N-R97W Sec 22: W/2"
+        tokenizer = PLSSTokenizer(txt)
+        kinds = [kind for kind, *_ in tokenizer]
+        expected = ['TWPRGE', 'SEC', 'MULTISEC', 'TWPRGE', 'SEC']
+        self.assertEqual(expected, kinds)
+        starts = [start for *_, start, _ in tokenizer]
+        self.assertEqual(sorted(starts), starts)
+        self.assertEqual(txt.index('Sec 1 - 3'), tokenizer.last_sec_start_before(41))
+
+    def test_overlapping_tokens(self):
+        """
+        A section that runs into a Twp/Rge should still be considered
+        as it would be if cut off at the start of the Twp/Rge.
+        """
+        txt = "Sec 1, 154N-R97W"
+        tokenizer = PLSSTokenizer(txt)
+        # Both patterns claim the '154'.
+        self.assertEqual(['MULTISEC', 'TWPRGE'], [t[0] for t in tokenizer])
+        self.assertEqual(0, tokenizer.last_sec_start_before(7))
+        self.assertIsNone(tokenizer.last_sec_start_before(0))
+
+    def test_deduce_layout_with_tokenizer(self):
+        txts = (
+            TEST_DESC_MULTI_TRS_DESC,
+            TEST_DESC_MULTI_S_DESC_TR,
+            TEST_DESC_MULTI_DESC_STR,
+            TEST_DESC_MULTI_TR_DESC_S,
+            '  NE/4 of Section 14',
+            'Section NE/4 of Sec 14, T154N-R97W',
+        )
+        for txt in txts:
+            self.assertEqual(
+                deduce_layout(txt),
+                deduce_layout(txt, tokenizer=PLSSTokenizer(txt)))
+
+
+class BatchParseTests(unittest.TestCase):
+    """
+    Tests for the ``parse_many()`` function.
+    """
+
+    ROWS = [
+        (TEST_DESC_MULTI_TRS_DESC, 'src_1'),
+        ('T155N-R97W Sec 14: NE/4', 'src_2'),
+        'T156N-R98W Sec 1: Lots 1 - 3, S/2N/2',
+    ]
+
+    def _test_results(self, results):
+        self.assertEqual(3, len(results))
+        expected = [PLSSDesc(row[0] if isinstance(row, tuple) else row)
+                    for row in self.ROWS]
+        for res, exp in zip(results, expected):
+            self.assertEqual(exp.quick_desc(), res.quick_desc())
+        self.assertEqual(['src_1', 'src_2', None], [r.source for r in results])
+        for res in results:
+            for tract in res:
+                self.assertEqual(res.source, tract.source)
+
+    def test_parse_many_serial(self):
+        self._test_results(parse_many(self.ROWS, workers=1))
+
+    def test_parse_many_multiprocess(self):
+        results = parse_many(self.ROWS, config='parse_qq', workers=2)
+        self._test_results(results)
+        self.assertEqual(['NENE', 'NWNE', 'SENE', 'SWNE'], results[1][0].qqs)
+
+        # UIDs should be reassigned in input order.
+        tl = TractList.from_multiple(results)
+        expected = tl.quick_desc()
+        tl.reverse()
+        tl.custom_sort('i')
+        self.assertEqual(expected, tl.quick_desc())
+
+    def test_parse_many_tracts_only(self):
+        results = parse_many(self.ROWS, workers=2, tracts_only=True)
+        self.assertTrue(all(isinstance(r, TractList) for r in results))
+        self.assertEqual(['src_2'], [t.source for t in results[1]])
+
+    def test_iter_parse(self):
+        gen = iter_parse(iter(self.ROWS), config='parse_qq')
+        tract = next(gen)
+        self.assertEqual('155n97w01', tract.trs)
+        self.assertEqual('src_1', tract.source)
+        self.assertEqual(TEST_DESC_MULTI_TRS_DESC, tract.orig_desc)
+        remaining = list(gen)
+        self.assertEqual(8, len(remaining))
+        self.assertEqual(['NENE', 'NWNE', 'SENE', 'SWNE'], remaining[-2].qqs)
+        self.assertEqual('src_2', remaining[-2].source)
+        self.assertEqual(None, remaining[-1].source)
+
+    def test_layout_specified_at_init(self):
+        txt = 'Sec 14: NE/4 of T154N-R97W'
+        d = PLSSDesc(txt, layout='copy_all')
+        self.assertEqual('copy_all', d.current_layout)
+        results = parse_many([txt], layout='copy_all', workers=2)
+        self.assertEqual('copy_all', results[0].current_layout)
+
+
+class ConfigTests(unittest.TestCase):
+    """
+    Tests for Config objects, and how they are shared.
+    """
+
+    def test_immutable(self):
+        config = Config('n,w,parse_qq')
+        with self.assertRaises(AttributeError):
+            config.parse_qq = False
+        with self.assertRaises(AttributeError):
+            del config.default_ns
+        replaced = config.replace(parse_qq=False, default_ns='s')
+        self.assertEqual((True, 'n'), (config.parse_qq, config.default_ns))
+        self.assertEqual(
+            (False, 's'), (replaced.parse_qq, replaced.default_ns))
+        self.assertEqual(config, replaced.replace(parse_qq=True, default_ns='n'))
+        with self.assertRaises(ValueError):
+            config.replace(asdf=True)
+
+    def test_equality(self):
+        self.assertEqual(Config('n, w, parse_qq'), Config('parse_qq,w,n'))
+        self.assertEqual(
+            hash(Config('n, w, parse_qq')), hash(Config('parse_qq,w,n')))
+        self.assertEqual(
+            Config('clean_qq,qq_depth.3'),
+            Config.from_kwargs(clean_qq=True, qq_depth=3))
+        self.assertNotEqual(Config('n'), Config('s'))
+        self.assertNotEqual(Config('n'), Config('n', config_name='other'))
+
+    def test_intern(self):
+        self.assertIs(Config.intern('n,parse_qq'), Config.intern('n,parse_qq'))
+        self.assertIs(Config.intern(None), Config.intern(''))
+        config = Config.intern('n,parse_qq')
+        self.assertIs(config, Config.intern(Config('parse_qq,n')))
+        with self.assertRaises(TypeError):
+            Config.intern(1)
+
+    def test_shared_by_tracts(self):
+        config = Config('n,w,clean_qq')
+        d1 = PLSSDesc(TEST_DESC_MULTI_TRS_DESC, config=config, parse_qq=True)
+        d2 = PLSSDesc(TEST_DESC_MULTI_TRS_DESC, config='n,w,clean_qq')
+        tracts = TractList.from_multiple(d1, d2)
+        self.assertEqual(1, len({id(t.config) for t in d1}))
+        self.assertEqual(1, len({id(t.config) for t in d2}))
+        self.assertEqual(config.replace(parse_qq=True), d1[0].config)
+        self.assertTrue(all(t.clean_qq for t in tracts))
+        self.assertTrue(all(t.parse_qq for t in d1))
+        self.assertFalse(any(t.parse_qq for t in d2))
+
+
+class ParseCacheTests(unittest.TestCase):
+    """
+    Tests for caching parse results.
+    """
+
+    TXT = 'T154N-R97W Sec 14: NE/4, Sec 15: W/2'
+
+    def setUp(self):
+        self.cache = enable_parse_cache(maxsize=2)
+
+    def tearDown(self):
+        disable_parse_cache()
+
+    def test_hits_and_misses(self):
+        d1 = PLSSDesc(self.TXT, source='a')
+        d2 = PLSSDesc(self.TXT, source='b')
+        self.assertEqual(1, self.cache.hits)
+        self.assertEqual(1, self.cache.misses)
+        self.assertEqual(d1.quick_desc(), d2.quick_desc())
+        self.assertEqual(d1.current_layout, d2.current_layout)
+        self.assertEqual(d1.pp_desc, d2.pp_desc)
+        self.assertEqual(['b', 'b'], [t.source for t in d2])
+        # Different parameters should not reuse the same results.
+        d3 = PLSSDesc(self.TXT, config='parse_qq')
+        self.assertEqual(2, self.cache.misses)
+        self.assertEqual(['NENE', 'NWNE', 'SENE', 'SWNE'], d3[0].qqs)
+
+    def test_results_are_copies(self):
+        d1 = PLSSDesc(self.TXT)
+        d1[0].desc = 'changed'
+        d1[0].w_flags.append('changed')
+        d1.w_flags.append('changed')
+        d2 = PLSSDesc(self.TXT)
+        d3 = PLSSDesc(self.TXT)
+        self.assertEqual('NE/4', d2[0].desc)
+        self.assertNotIn('changed', d2[0].w_flags)
+        self.assertNotIn('changed', d2.w_flags)
+        self.assertIsNot(d2[0], d3[0])
+        # Each copy is a distinct Tract, created in order.
+        uids = [t._Tract__uid for t in (d1[0], d2[0], d3[0])]
+        self.assertEqual(sorted(set(uids)), uids)
+
+    def test_eviction(self):
+        for twp in range(150, 154):
+            PLSSDesc(f'T{twp}N-R97W Sec 14: NE/4')
+        info = self.cache.info()
+        self.assertEqual(2, info['size'])
+        self.assertEqual(2, info['evictions'])
+        PLSSDesc('T153N-R97W Sec 14: NE/4')
+        PLSSDesc('T150N-R97W Sec 14: NE/4')
+        self.assertEqual(1, self.cache.hits)
+        self.assertEqual(5, self.cache.misses)
+
+
+class InstrumentTests(unittest.TestCase):
+    """
+    Tests for instrumenting the stages of the parse.
+    """
+
+    TXT = 'T154N-R97W Sec 14: NE/4, Sec 15: Lots 1 - 3, S/2N/2'
+
+    def test_instrument(self):
+        with instrument(max_slowest=1) as stats:
+            PLSSDesc(self.TXT, config='parse_qq')
+            PLSSDesc('T1N-R1W Sec 1: ALL')
+        # Nothing is recorded outside of the `with` block.
+        PLSSDesc(self.TXT)
+        results = stats.to_dict()
+        stages = results['stages']
+        self.assertEqual(2, stages['plssdesc']['calls'])
+        self.assertEqual(2, stages['plss_preprocess']['calls'])
+        self.assertEqual(2, stages['plss_preprocess.twprge_regex']['calls'])
+        self.assertEqual(2, stages['construct_tracts']['calls'])
+        # Only the first description's tracts were parsed for lots/QQs.
+        self.assertEqual(2, stages['tract_parse.lots']['calls'])
+        self.assertEqual(2, stages['parse_aliquot']['calls'])
+        for stage in ('deduce_layout', 'twprge_finder', 'sec_finder',
+                      'chunk_parser', 'tract_preprocess',
+                      'tract_parse.aliquots'):
+            self.assertIn(stage, stages)
+        self.assertEqual(1, len(results['slowest']))
+        self.assertIn(
+            results['slowest'][0]['text'], (self.TXT, 'T1N-R1W Sec 1: ALL'))
+        self.assertEqual(results, json.loads(stats.to_json()))
+        stats.reset()
+        self.assertEqual({'stages': {}, 'slowest': []}, stats.to_dict())
+
+    def test_merge(self):
+        stats = ParseStats(max_slowest=2)
+        stats.record('plssdesc', 0.5, text='a')
+        other = ParseStats()
+        other.record('plssdesc', 1.0, text='b')
+        other.record('plssdesc', 0.25, text='c')
+        stats.merge(other)
+        results = stats.to_dict()
+        self.assertEqual(3, results['stages']['plssdesc']['calls'])
+        self.assertAlmostEqual(1.75, results['stages']['plssdesc']['seconds'])
+        self.assertEqual(['b', 'a'], [s['text'] for s in results['slowest']])
+
+    def test_parse_many_multiprocess(self):
+        rows = [self.TXT, 'T1N-R1W Sec 1: ALL', 'T2N-R1W Sec 2: W/2']
+        with instrument() as stats:
+            parse_many(rows, config='parse_qq', workers=2)
+        self.assertEqual(3, stats.to_dict()['stages']['plssdesc']['calls'])
+
+    def test_profile_hook(self):
+        recorded = []
+        try:
+            MasterConfig.profile_hook = (
+                lambda stage, seconds: recorded.append(stage))
+            PLSSDesc(self.TXT)
+        finally:
+            MasterConfig.profile_hook = None
+        self.assertIn('plssdesc', recorded)
+        self.assertIn('chunk_parser', recorded)
+
+    def test_profile_hook_parse_many_multiprocess(self):
+        rows = [self.TXT, 'T1N-R1W Sec 1: ALL', 'T2N-R1W Sec 2: W/2']
+        recorded = []
+        try:
+            MasterConfig.profile_hook = (
+                lambda stage, seconds: recorded.append(stage))
+            parsed = parse_many(rows, workers=2)
+            # The hook is not called for work done in the workers...
+            self.assertEqual([], recorded)
+            self.assertEqual(
+                [PLSSDesc(r).quick_desc() for r in rows],
+                [d.quick_desc() for d in parsed])
+            # ...but is for a serial parse.
+            recorded.clear()
+            parse_many(rows, workers=1)
+            self.assertEqual(3, recorded.count('plssdesc'))
+            # And `instrument()` still collects the stats of the workers.
+            with instrument() as stats:
+                parse_many(rows, workers=2)
+            self.assertEqual(
+                3, stats.to_dict()['stages']['plssdesc']['calls'])
+        finally:
+            MasterConfig.profile_hook = None
+
+
+class LiteTractTests(unittest.TestCase):
+    """
+    Tests for parsing into LiteTract objects.
+    """
+
+    TXT = (
+        'T154N-R97W Sec 1 - 12: ALL, '
+        'T155N-R97W Sec 14: NE/4, Sec 15: W/2, Lot 1')
+
+    def test_lite_until_needed(self):
+        d = PLSSDesc(self.TXT, config='lite_tracts')
+        self.assertEqual(14, len(d.tracts))
+        self.assertTrue(all(isinstance(t, LiteTract) for t in d))
+        self.assertTrue(all(isinstance(t, Tract) for t in d))
+        self.assertEqual('154n97w01', d[0].trs)
+        self.assertEqual('155n97w', d[-1].twprge)
+        self.assertEqual(15, d[-1].sec_num)
+        self.assertTrue(all(t.is_lite for t in d))
+        self.assertEqual('W/2, Lot 1', d[-1].desc)
+        self.assertTrue(d[-1].is_lite)
+        d[-1].parse()
+        self.assertFalse(d[-1].is_lite)
+        self.assertIn('L1', d[-1].lots_qqs)
+        self.assertTrue(d[0].is_lite)
+
+    def test_same_as_full(self):
+        for config in ('', 'n,w,clean_qq', 'segment,ocr_scrub'):
+            full = PLSSDesc(self.TXT, config=config)
+            lite = PLSSDesc(self.TXT, config=f"{config},lite_tracts")
+            self.assertEqual(
+                [t.to_dict() for t in full], [t.to_dict() for t in lite])
+            uids = [t._Tract__uid for t in lite]
+            self.assertEqual(sorted(uids), uids)
+
+    def test_flags(self):
+        txt = 'T154N-R97W Sec 14: NE/4, Sec 15: W/2, and all that etc.'
+        full = PLSSDesc(txt)
+        lite = PLSSDesc(txt, config='lite_tracts')
+        self.assertEqual(full[0].w_flags, lite[0].w_flags)
+        self.assertTrue(lite[0].is_lite)
+        lite[0].w_flags.append('asdf')
+        self.assertNotIn('asdf', lite[1].w_flags)
+        self.assertEqual(full[1].to_dict(), lite[1].to_dict())
+
+    def test_parse_qq_not_lite(self):
+        d = PLSSDesc(self.TXT, config='lite_tracts', parse_qq=True)
+        self.assertFalse(any(isinstance(t, LiteTract) for t in d))
+
+    def test_tractlist(self):
+        d = PLSSDesc(self.TXT, config='lite_tracts')
+        tl = TractList(d.tracts)
+        tl.custom_sort('s.num')
+        self.assertEqual(12, len(tl.group_by('twprge')['154n97w']))
+        self.assertTrue(all(t.is_lite for t in tl))
+        self.assertEqual(
+            PLSSDesc(self.TXT).tracts.quick_desc(), d.tracts.quick_desc())
+
+
+class ThreadSafetyTests(unittest.TestCase):
+    """
+    Tests for parsing in multiple threads at once.
+    """
+
+    CONFIGS = ('', 'parse_qq', 'lite_tracts', 'clean_qq,parse_qq,segment')
+    NUM_THREADS = 16
+
+    def setUp(self):
+        self.texts = [text for text, _ in generate_corpus(30, seed=25)]
+        # Switch threads far more often than usual, to shake out races.
+        self.switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+
+    def tearDown(self):
+        sys.setswitchinterval(self.switch_interval)
+        disable_parse_cache()
+
+    def parse_corpus(self, _=None):
+        results = []
+        for i, text in enumerate(self.texts):
+            d = PLSSDesc(text, config=self.CONFIGS[i % len(self.CONFIGS)])
+            results.append(d.tracts)
+        return results
+
+    def check_threaded(self):
+        serial = [
+            [t.to_dict() for t in tl] for tl in self.parse_corpus()]
+        with ThreadPoolExecutor(max_workers=self.NUM_THREADS) as executor:
+            threaded = list(
+                executor.map(self.parse_corpus, range(self.NUM_THREADS)))
+        uids = set()
+        num_tracts = 0
+        for results in threaded:
+            self.assertEqual(serial, [[t.to_dict() for t in tl] for tl in results])
+            for tl in results:
+                uids.update(t._Tract__uid for t in tl)
+                num_tracts += len(tl)
+        self.assertEqual(num_tracts, len(uids))
+
+    def test_threaded_parse(self):
+        self.check_threaded()
+
+    def test_threaded_parse_cached(self):
+        enable_parse_cache(maxsize=20)
+        self.check_threaded()
+
+    def test_master_config_read_at_parse(self):
+        default_ns = MasterConfig.default_ns
+        try:
+            MasterConfig.default_ns = 's'
+            d = PLSSDesc('T154-R97W Sec 1: ALL')
+            self.assertEqual('154s97w01', d[0].trs)
+            self.assertEqual('154s97w01', PLSSParser('T154-R97W Sec 1: ALL').tracts[0].trs)
+        finally:
+            MasterConfig.default_ns = default_ns
+
 
 if __name__ == '__main__':
     unittest.main()
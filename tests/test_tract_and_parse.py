@@ -6,18 +6,42 @@ Tests for the pytrs.parser.tract module and submodules (except the
 import unittest
 
 try:
-    from pytrs.parser.tract import Tract
+    from pytrs.parser.tract import Tract, CompactTract
+    from pytrs.parser import instrument
     from pytrs.parser.tract.tract_parse import TractParser
-    from pytrs.parser.tract.aliquot_parse import parse_aliquot
+    from pytrs.parser.tract.aliquot_parse import (
+        parse_aliquot,
+        parse_aliquot_blocks,
+        expand_aliquot_block,
+    )
+    from pytrs.parser.tract.symbolic_qqs import SymbolicQQList
     from pytrs.parser.tract.aliquot_simplify import simplify_aliquots
+    from pytrs.parser.tract.aliquot_bitmask import (
+        aliquot_to_mask,
+        aliquots_to_mask,
+        mask_to_aliquots,
+        split_halves,
+    )
 except ImportError:
     import sys
 
     sys.path.append('../')
-    from pytrs.parser.tract import Tract
+    from pytrs.parser.tract import Tract, CompactTract
+    from pytrs.parser import instrument
     from pytrs.parser.tract.tract_parse import TractParser
-    from pytrs.parser.tract.aliquot_parse import parse_aliquot
+    from pytrs.parser.tract.aliquot_parse import (
+        parse_aliquot,
+        parse_aliquot_blocks,
+        expand_aliquot_block,
+    )
+    from pytrs.parser.tract.symbolic_qqs import SymbolicQQList
     from pytrs.parser.tract.aliquot_simplify import simplify_aliquots
+    from pytrs.parser.tract.aliquot_bitmask import (
+        aliquot_to_mask,
+        aliquots_to_mask,
+        mask_to_aliquots,
+        split_halves,
+    )
 
 # This data will be used for testing both TractParser and Tract classes.
 
@@ -162,6 +186,88 @@ class AliquotParseTests(unittest.TestCase):
         qqs2 = parse_aliquot('SE/4SE/4')
         self.assertEqual(['SESE'], qqs2)
 
+    def test_aliquot_parse_cached(self):
+        # Changing a returned list must not affect later results.
+        qqs = parse_aliquot('N/2NE/4')
+        qqs.append('SWSW')
+        self.assertEqual(['NENE', 'NWNE'], parse_aliquot('N/2NE/4'))
+        # `qq_depth` is equivalent to the same min and max.
+        self.assertEqual(
+            parse_aliquot('NE/4', qq_depth_min=3, qq_depth_max=3),
+            parse_aliquot('NE/4', qq_depth=3))
+        self.assertEqual(16, len(parse_aliquot('NE/4', qq_depth=3)))
+        self.assertEqual(64, len(parse_aliquot('NE/4', qq_depth=4)))
+        with self.assertWarns(UserWarning):
+            parse_aliquot('NE/4', qq_depth_min=3, qq_depth_max=2)
+        with self.assertWarns(UserWarning):
+            parse_aliquot('NE/4', qq_depth_min=3, qq_depth_max=2)
+
+
+class AliquotBitmaskTests(unittest.TestCase):
+
+    def test_aliquot_to_mask(self):
+        self.assertEqual(0b1, aliquot_to_mask('NENE', 2))
+        self.assertEqual(0b11, aliquot_to_mask('N2NE', 2))
+        self.assertEqual(0b1111, aliquot_to_mask('NE', 2))
+        self.assertEqual(0xFFFF, aliquot_to_mask('ALL', 2))
+        # N/2 of the E/2 is the NE/4.
+        self.assertEqual(aliquot_to_mask('NE', 3), aliquot_to_mask('N2E2', 3))
+        with self.assertRaises(ValueError):
+            aliquot_to_mask('NENENE', 2)
+
+    def test_round_trip(self):
+        qqs = parse_aliquot('S/2N/2', qq_depth_min=3)
+        mask = aliquots_to_mask(qqs, 3)
+        self.assertEqual(qqs, mask_to_aliquots(mask, 3))
+        self.assertEqual(mask, aliquot_to_mask('S2N2', 3))
+        self.assertEqual(parse_aliquot('ALL'), mask_to_aliquots(0xFFFF, 2))
+
+    def test_split_halves(self):
+        self.assertEqual(['NESENW', 'NWSENW'], split_halves('N2SENW'))
+        self.assertEqual(['NENE'], split_halves('NENE'))
+        tp = TractParser(text='E2SW', clean_qq=True, break_halves=True)
+        self.assertEqual(tp.qqs, split_halves('E2SW'))
+
+
+class SymbolicQQTests(unittest.TestCase):
+
+    def test_blocks_match_parse_aliquot(self):
+        for text in ('NE', 'S/2N/2', 'E/2SW/4', 'ALL', 'N/2NE/4'):
+            for depth in (2, 3, 4):
+                blocks = parse_aliquot_blocks(text, qq_depth=depth)
+                expanded = [
+                    qq for prefix, d in blocks
+                    for qq in expand_aliquot_block(prefix, d)]
+                self.assertEqual(
+                    parse_aliquot(text, qq_depth=depth), expanded)
+
+    def test_list_without_expansion(self):
+        qqs = SymbolicQQList([('NE', 4), ('SESW', 0)])
+        self.assertEqual(257, len(qqs))
+        self.assertIn('NENENENENE', qqs)
+        self.assertIn('SESW', qqs)
+        self.assertNotIn('NENENESW', qqs)
+        self.assertEqual(1, qqs.count('SWSWSWSWNE'))
+        self.assertEqual('SESW', qqs[-1])
+        self.assertEqual(list(qqs)[100], qqs[100])
+        self.assertEqual(['NE', 'SESW'], qqs.prefixes)
+
+    def test_duplicates(self):
+        qqs = SymbolicQQList([('NE', 1), ('NENE', 0), ('E2', 0), ('E2', 0)])
+        self.assertEqual(['E2', 'NENE'], qqs.duplicates())
+
+    def test_symbolic_tract(self):
+        text = 'NE/4, N/2NE/4, Lot 1'
+        plain = Tract(text, config='qq_depth.4', parse_qq=True)
+        symbolic = Tract(
+            text, config='qq_depth.4,symbolic_qq', parse_qq=True)
+        self.assertIsInstance(symbolic.qqs, SymbolicQQList)
+        self.assertEqual(plain.qqs, symbolic.qqs)
+        self.assertEqual(plain.lots_qqs, symbolic.lots_qqs)
+        self.assertEqual(plain.aliquots, symbolic.aliquots)
+        self.assertTrue(symbolic.w_flags[0].startswith('dup_qq<NENENENE,'))
+        self.assertEqual(plain.to_dict(['qqs']), symbolic.to_dict(['qqs']))
+
 
 class TractTests(unittest.TestCase):
     """
@@ -264,6 +370,33 @@ class TractTests(unittest.TestCase):
         tract = Tract(txt, parse_qq=True)
         self.assertEqual(['L1', 'L2', 'L3', 'L5', 'L1', 'SENE', 'SWNE'], tract.lots_qqs)
 
+    def test_acres(self):
+        tract = Tract('Lot 1(38.29), Lot 2, N/2SE/4NW/4, NE/4', parse_qq=True)
+        self.assertAlmostEqual(38.29 + 20 + 160, tract.acres)
+        self.assertEqual(640, Tract('ALL', parse_qq=True).acres)
+        self.assertEqual(0, Tract('NE/4').acres)
+        symbolic = Tract('NE/4', config='qq_depth.5,symbolic_qq', parse_qq=True)
+        self.assertEqual(160, symbolic.acres)
+
+    def test_fingerprints(self):
+        t1 = Tract('Lots 1 - 3, S/2NE/4', '154n97w14', parse_qq=True)
+        t2 = Tract('Lot 3, S/2NE/4, Lots 1, 2', '154n97w14', parse_qq=True)
+        self.assertEqual(t1.lots_qqs_fingerprint, t2.lots_qqs_fingerprint)
+        self.assertNotEqual(t1.desc_fingerprint, t2.desc_fingerprint)
+        self.assertEqual(
+            t1.lots_qqs_fingerprint, CompactTract(t1).lots_qqs_fingerprint)
+        # The cached fingerprint is updated when the data changes.
+        before = t1.lots_qqs_fingerprint
+        t1.trs = '154n97w15'
+        self.assertNotEqual(before, t1.lots_qqs_fingerprint)
+        t1.trs = '154n97w14'
+        t1.qqs.append('NENE')
+        self.assertNotEqual(before, t1.lots_qqs_fingerprint)
+        t1.parse()
+        self.assertEqual(before, t1.lots_qqs_fingerprint)
+        t1.qqs[0] = 'NWNW'
+        self.assertNotEqual(before, t1.lots_qqs_fingerprint)
+
     def test_ilots(self):
         txt = 'Lots 1 - 3, S/2NE/4, Lot 5, Lot 1'
         tract = Tract(txt, parse_qq=True)
@@ -494,5 +627,130 @@ class TractTests(unittest.TestCase):
         lots_aliquots = tract.lots_aliquots
         self.assertEqual(lots + aliquots, lots_aliquots)
 
+    def test_pp_desc_lazy(self):
+        with instrument() as stats:
+            tract = Tract('Northeast Quarter', config='clean_qq')
+            self.assertNotIn('tract_preprocess', stats.to_dict()['stages'])
+            self.assertEqual('NE¼', tract.pp_desc)
+            # Preprocessed only once, and reused for the parse.
+            tract.pp_desc
+            tract.parse()
+            self.assertEqual(['NENE', 'NWNE', 'SENE', 'SWNE'], tract.qqs)
+            self.assertEqual(
+                1, stats.to_dict()['stages']['tract_preprocess']['calls'])
+            # Not reused if parsed with different settings.
+            tract.parse(clean_qq=False)
+            self.assertEqual(
+                2, stats.to_dict()['stages']['tract_preprocess']['calls'])
+        tract = Tract('NE/4')
+        tract.pp_desc = 'set directly'
+        self.assertEqual('set directly', tract.pp_desc)
+        tract.parse()
+        self.assertEqual('NE¼', tract.pp_desc)
+
+    def test_pp_desc_settings_at_init(self):
+        # Until parsed, preprocessed with the `.desc` and `.clean_qq` as
+        # of init (as though it had been preprocessed then).
+        tract = Tract('NENE', config='')
+        tract.clean_qq = True
+        self.assertEqual('NENE', tract.pp_desc)
+        tract = Tract('Northeast Quarter', config='clean_qq')
+        tract.desc = 'SW/4'
+        self.assertEqual('NE¼', tract.pp_desc)
+        # Parsing uses the current settings.
+        tract.parse()
+        self.assertEqual('SW¼', tract.pp_desc)
+        tract = Tract('NENE', config='')
+        tract.clean_qq = True
+        self.assertEqual('NENE', CompactTract(tract).pp_desc)
+
+    def test_aliquot_simplify_cached(self):
+        # Order and duplicates do not matter.
+        self.assertEqual(
+            simplify_aliquots(['NENE', 'NWNE']),
+            simplify_aliquots(['NWNE', 'NENE', 'NWNE']))
+        tract = Tract('NE/4', parse_qq=True)
+        aliquots = tract.aliquots
+        self.assertEqual(['NE'], aliquots)
+        # Changing a returned list must not affect later results.
+        aliquots.append('SWSW')
+        self.assertEqual(['NE'], tract.aliquots)
+        self.assertEqual(['NE'], tract.lots_aliquots)
+        # Recomputed when the QQs are changed...
+        tract.qqs.remove('SENE')
+        self.assertEqual(['N2NE', 'SWNE'], tract.aliquots)
+        tract.qqs = ['NENE', 'NWNE', 'SENE', 'SWNE'] * 4
+        self.assertEqual(['NE'], tract.aliquots)
+        # ...or the tract is re-parsed.
+        tract.parse(qq_depth=3)
+        self.assertEqual(['NE'], tract.aliquots)
+        self.assertEqual(16, len(tract.qqs))
+        # Also when the QQs are edited in place.
+        tract = Tract('NE/4NE/4', trs='154n97w14', parse_qq=True)
+        self.assertEqual(['NENE'], tract.aliquots)
+        tract.qqs[0] = 'NWNW'
+        self.assertEqual(['NWNW'], tract.aliquots)
+        self.assertEqual(['NWNW'], tract.lots_aliquots)
+        self.assertEqual(['NWNW'], tract.aliquots_standard)
+
+
+class CompactTractTests(unittest.TestCase):
+    """
+    Tests for ``CompactTract`` class.
+    """
+
+    def test_same_data_as_tract(self):
+        tract = Tract(
+            BASIC['desc'], trs='154n97w14', parse_qq=True, config='clean_qq')
+        compact = CompactTract.from_tract(tract)
+        attributes = [
+            att for att in Tract.ATTRIBUTES if 'flag' not in att]
+        self.assertEqual(tract.to_dict(attributes), compact.to_dict(attributes))
+        self.assertEqual(tract.quick_desc(), compact.quick_desc())
+
+    def test_pp_desc_lazy(self):
+        tract = Tract('Northeast Quarter', config='clean_qq')
+        compact = CompactTract(tract)
+        self.assertEqual('NE¼', compact.pp_desc)
+        self.assertEqual('NE¼', compact.to_tract().pp_desc)
+        self.assertEqual('NE¼', CompactTract(compact.to_tract()).pp_desc)
+        self.assertEqual('NE/4', CompactTract(Tract('NE/4')).desc)
+
+    def test_no_dict(self):
+        compact = CompactTract(Tract(BASIC['desc'], parse_qq=True))
+        self.assertFalse(hasattr(compact, '__dict__'))
+        with self.assertRaises(AttributeError):
+            compact.some_new_attribute = 1
+
+    def test_shared_config(self):
+        t1 = Tract('NE/4', parse_qq=True, config='n,w,clean_qq')
+        t2 = Tract('SE/4', parse_qq=True, config='n,w,clean_qq')
+        t3 = Tract('SE/4', parse_qq=True)
+        c1, c2, c3 = CompactTract(t1), CompactTract(t2), CompactTract(t3)
+        self.assertIs(c1.config, c2.config)
+        self.assertIsNot(c1.config, c3.config)
+        self.assertEqual('n', c1.default_ns)
+        self.assertTrue(c1.clean_qq)
+        self.assertFalse(c3.clean_qq)
+
+    def test_flags_allocated_lazily(self):
+        compact = CompactTract(Tract('NE/4', parse_qq=True))
+        self.assertEqual((), compact.w_flags)
+        self.assertIsNone(compact._flags)
+        compact.w_flags = ['some_flag']
+        self.assertEqual(['some_flag'], compact.flags)
+        self.assertFalse(compact.e_flags)
+
+    def test_to_tract(self):
+        tract = Tract(BASIC['desc'], trs='154n97w14', parse_qq=True)
+        restored = CompactTract(tract).to_tract()
+        self.assertIsInstance(restored, Tract)
+        self.assertEqual(tract.to_dict(list(Tract.ATTRIBUTES)),
+                         restored.to_dict(list(Tract.ATTRIBUTES)))
+        # Can be reparsed as a normal Tract.
+        restored.parse(qq_depth=3)
+        self.assertEqual(tract.lots, restored.lots)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,83 @@
+"""
+Tests for the pytrs.tractwriter module.
+"""
+
+import csv
+import os
+import tempfile
+import unittest
+
+try:
+    from pytrs import Tract, PLSSDesc, iter_parse
+    from pytrs.tractwriter import TractWriter
+except ImportError:
+    import sys
+
+    sys.path.append('../')
+    from pytrs import Tract, PLSSDesc, iter_parse
+    from pytrs.tractwriter import TractWriter
+
+ROWS = [
+    ('T154N-R97W Sec 14: NE/4, Sec 15: W/2', 'src_1'),
+    ('T1S-R2E Sec 1: ALL', 'src_2'),
+]
+
+
+class TractWriterTests(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.fp = os.path.join(self.tmp_dir.name, 'test.csv')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _read_rows(self):
+        with open(self.fp, newline='') as file:
+            return list(csv.reader(file))
+
+    def test_write_iter_parse(self):
+        """Write a generator of Tracts, as returned by ``iter_parse()``."""
+        writer = TractWriter(['trs', 'desc', 'source'], self.fp, 'w')
+        written = writer.write(iter_parse(iter(ROWS)))
+        writer.close()
+        self.assertEqual(3, written)
+        expected = [
+            ['trs', 'desc', 'source'],
+            ['154n97w14', 'NE/4', 'src_1'],
+            ['154n97w15', 'W/2', 'src_1'],
+            ['1s2e01', 'ALL', 'src_2'],
+        ]
+        self.assertEqual(expected, self._read_rows())
+
+    def test_write_iter_parse_uids(self):
+        writer = TractWriter(['trs'], self.fp, 'w', uid=1)
+        writer.write(iter_parse(iter(ROWS)))
+        writer.write(PLSSDesc('T1S-R2E Sec 2: ALL'))
+        writer.close()
+        expected = [
+            ['trs', 'UID'],
+            ['154n97w14', '0001.a-c'],
+            ['154n97w15', '0001.b-c'],
+            ['1s2e01', '0001.c-c'],
+            ['1s2e02', '0002.a-a'],
+        ]
+        self.assertEqual(expected, self._read_rows())
+
+    def test_write_bad_element(self):
+        """A container with a bad element should write nothing."""
+        tract = Tract('NE/4', '154n97w14')
+        writer = TractWriter(['trs'], self.fp, 'w')
+        with self.assertRaises(TypeError):
+            writer.write([tract, 5])
+        # A generator is written lazily, so the rows before the bad
+        # element are written.
+        with self.assertRaises(TypeError):
+            writer.write(obj for obj in [tract, 5])
+        writer.close()
+        self.assertEqual([['trs'], ['154n97w14']], self._read_rows())
+        self.assertEqual(1, writer.uid)
+
+
+if __name__ == '__main__':
+    unittest.main()
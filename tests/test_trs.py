@@ -3,9 +3,11 @@
 Tests for the pytrs.parser.trs module.
 """
 
+import threading
 import unittest
 
 try:
+    from pytrs.parser.config import MasterConfig
     from pytrs.parser.trs import (
         TRS,
         trs_to_dict,
@@ -13,6 +15,7 @@ try:
 except ImportError:
     import sys
     sys.path.append('../')
+    from pytrs.parser.config import MasterConfig
     from pytrs.parser.trs import (
         TRS,
         trs_to_dict,
@@ -158,3 +161,114 @@ class TRSTests(unittest.TestCase):
         self.assertEqual(expected, TRS.trs_to_dict(trs))
         # Test the equivalent function.
         self.assertEqual(expected, trs_to_dict(trs))
+
+    def test_trs_to_dict_noncanonical(self):
+        # Canonical strings are unpacked without the regex; anything else
+        # must still be unpacked the same way as before.
+        self.assertEqual(
+            TRS.trs_to_dict('154n97w14'), TRS.trs_to_dict('154N97W14'))
+        dct = TRS.trs_to_dict('012n097e00')
+        self.assertEqual(('012n', 12, '097e', 97, 0), (
+            dct['twp'], dct['twp_num'], dct['rge'], dct['rge_num'],
+            dct['sec_num']))
+        self.assertEqual('154n97wXX', TRS.trs_to_dict('154n97w1')['trs'])
+        self.assertEqual('154n97w14', TRS.trs_to_dict('1154n97w145')['trs'])
+        dct = TRS.trs_to_dict('___z97w14')
+        self.assertTrue(dct['twp_undef'])
+        self.assertEqual(97, dct['rge_num'])
+        self.assertEqual('XXXzXXXzXX', TRS.trs_to_dict('asdf')['trs'])
+
+    def test_to_int(self):
+        for trs in [
+                '154n97w14', '1s1e01', '999n999w99', '154n97wXX',
+                '___z97w14', 'XXXzXXXzXX', '___z___z__', '154n___z__']:
+            packed = TRS(trs).to_int()
+            self.assertTrue(0 <= packed < 2 ** 31)
+            self.assertEqual(trs, TRS.int_to_trs(packed))
+            self.assertEqual(TRS(trs), TRS.from_int(packed))
+        # Leading zeros are not encoded.
+        self.assertEqual('12n97w14', TRS.from_int(TRS('012n97w14').to_int()).trs)
+        ordered = ['1n2e36', '1n1w01', '1n1w02', '2n1e01', '1s1e01', '___z___z__']
+        self.assertEqual(
+            ordered, sorted(ordered, key=lambda t: TRS(t).to_int()))
+        for bad in [-1, 2 ** 31, 100]:
+            with self.assertRaises(ValueError):
+                TRS.int_to_trs(bad)
+
+    def test_warm_cache(self):
+        TRS._clear_cache()
+        self.assertEqual([], TRS._cached_trs())
+        TRS._warm_cache(['154n97w14', '1s9e01'])
+        self.assertEqual(['154n97w14', '1s9e01'], TRS._cached_trs())
+        self.assertEqual('97w', TRS('154n97w14').rge)
+
+    def test_cache_bounded(self):
+        orig_maxsize = MasterConfig.trs_cache_maxsize
+        try:
+            MasterConfig.trs_cache_maxsize = 2
+            TRS._clear_cache()
+            TRS('154n97w14')
+            TRS('154n97w15')
+            # Hit, so '154n97w14' is now the most recently used.
+            TRS('154n97w14')
+            TRS('154n97w16')
+            self.assertEqual(['154n97w14', '154n97w16'], TRS._cached_trs())
+            expected = {
+                'hits': 1,
+                'misses': 3,
+                'evictions': 1,
+                'size': 2,
+                'maxsize': 2,
+            }
+            self.assertEqual(expected, TRS.cache_info())
+            # Evicted Twp/Rge/Sec is still broken down correctly.
+            self.assertEqual(15, TRS('154n97w15').sec_num)
+        finally:
+            MasterConfig.trs_cache_maxsize = orig_maxsize
+            TRS._clear_cache()
+
+    def test_seed_cache(self):
+        TRS._clear_cache()
+        num = TRS.seed_cache(
+            twps=range(1, 3), rges=['97w'], default_ns='s')
+        self.assertEqual(72, num)
+        cached = TRS._cached_trs()
+        self.assertEqual(72, len(cached))
+        self.assertEqual('1s97w01', cached[0])
+        self.assertEqual('2s97w36', cached[-1])
+        TRS('2s97w36')
+        self.assertEqual(1, TRS.cache_info()['hits'])
+        TRS._clear_cache()
+
+    def test_cache_threaded(self):
+        orig_maxsize = MasterConfig.trs_cache_maxsize
+        errors = []
+
+        def construct(offset):
+            try:
+                for i in range(500):
+                    sec = (i + offset) % 36 + 1
+                    trs = TRS.from_twprgesec(154, 97 + i % 10, sec)
+                    if trs.sec_num != sec:
+                        errors.append(trs)
+            except Exception as e:
+                errors.append(e)
+
+        try:
+            MasterConfig.trs_cache_maxsize = 50
+            TRS._clear_cache()
+            threads = [
+                threading.Thread(target=construct, args=(n,))
+                for n in range(8)
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            self.assertEqual([], errors)
+            info = TRS.cache_info()
+            self.assertEqual(8 * 500, info['hits'] + info['misses'])
+            self.assertEqual(50, info['size'])
+        finally:
+            MasterConfig.trs_cache_maxsize = orig_maxsize
+            TRS._clear_cache()